@@ -18,10 +18,12 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.nlp.sentiment_dict import SentimentDictionary
 from src.nlp.tone_analyzer import ToneAnalyzer
+from src.nlp.results_store import ToneResultStore
 from src.models.rate_predictor import RatePredictor
 from src.utils.styles import get_custom_css
 from src.views.analysis_view import render_analysis_view
 from src.views.settings_view import render_settings_view
+from src.data.database import get_database_manager
 
 # 페이지 설정
 st.set_page_config(
@@ -38,7 +40,11 @@ ANALYSIS_DIR = DATA_DIR / "analysis"
 
 @st.cache_data
 def load_tone_data():
-    """톤 분석 결과 로드"""
+    """톤 분석 결과 로드 (컬럼형 저장소 우선, 없으면 CSV)"""
+    store = ToneResultStore(ANALYSIS_DIR / "tone_index_results")
+    if store.exists():
+        return store.load()
+
     tone_path = ANALYSIS_DIR / "tone_index_results.csv"
     if not tone_path.exists():
         st.error("톤 분석 결과 파일이 없습니다. 먼저 분석을 실행해주세요.")
@@ -577,6 +583,20 @@ def main():
             st.metric("최근 톤 지수", f"{df.iloc[-1]['tone_index']:+.3f}")
 
             st.markdown("---")
+
+            # 의사록 전문 검색 (FTS5 인덱스, python -m src.data.document_store 로 수집)
+            st.subheader("🔎 의사록 검색")
+            search_query = st.text_input("검색어", placeholder="예: 가계부채 주택가격", key="doc_search_query")
+            if search_query:
+                hits = get_database_manager().search_documents(search_query, limit=10)
+                if not hits:
+                    st.caption("검색 결과가 없습니다.")
+                for hit in hits:
+                    section_label = "토의" if hit.section == "discussion" else "의결"
+                    st.markdown(f"**{hit.meeting_date.replace('_', '-')}** · {section_label} ({len(hit.offsets)}회)")
+                    st.caption(hit.snippet)
+
+            st.markdown("---")
             
             # 전문가 설정 버튼
             st.markdown("""
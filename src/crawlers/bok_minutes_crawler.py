@@ -12,6 +12,7 @@ import time
 import logging
 import re
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 
@@ -58,7 +59,18 @@ class BOKMinutesCrawler:
     # 뉴스/자료 페이지 (AJAX 엔드포인트)
     NEWS_LIST_URL = "https://www.bok.or.kr/portal/singl/newsData/listCont.do"
 
-    def __init__(self):
+    def __init__(self, base_url: Optional[str] = None):
+        """
+        Args:
+            base_url: 한국은행 홈페이지 주소 (None이면 환경 변수 BOK_BASE_URL, 없으면 실제 홈페이지)
+                      로컬 대체 서버(standin_server) 사용 시 지정
+        """
+        base_url = (base_url or os.getenv("BOK_BASE_URL") or "").rstrip("/")
+        if base_url:
+            self.BASE_URL = base_url
+            self.POLICY_MEETING_URL = self.POLICY_MEETING_URL.replace(BOKMinutesCrawler.BASE_URL, base_url)
+            self.NEWS_LIST_URL = self.NEWS_LIST_URL.replace(BOKMinutesCrawler.BASE_URL, base_url)
+
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
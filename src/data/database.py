@@ -12,10 +12,13 @@ SQLite 기반 데이터베이스로 다음 정보를 관리합니다:
 import sqlite3
 import logging
 import sys
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
+import numpy as np
 import pandas as pd
 import json
 
@@ -30,6 +33,238 @@ print(f"Project Root Added: {PROJECT_ROOT}")
 DB_DIR = PROJECT_ROOT / "data" / "db"
 DB_PATH = DB_DIR / "bok_analyzer.db"
 
+from src.data.db_pool import ConnectionPool, get_pool
+from src.data.query_cache import QueryCache, get_query_cache
+from src.data.db_stats import QueryStats, get_query_stats, instrumented
+from src.data.search_index import (
+    SECTIONS as SEARCH_SECTIONS, query_terms, build_match_query, find_term_offsets, make_snippet
+)
+
+# 스키마 마이그레이션: (버전, 설명, SQL 목록)
+# 버전 순서대로 한 번씩 적용하며, 적용된 버전은 PRAGMA user_version에 기록
+SCHEMA_MIGRATIONS: List[Tuple[int, str, List[str]]] = [
+    (1, "시장 지표 / 전문가 가중치 조회용 커버링 인덱스", [
+        # get_market_data: indicator_name = ? AND indicator_date 범위 + ORDER BY indicator_date
+        # (SELECT * 컬럼 전체 포함 → 테이블 조회 없이 인덱스만 읽음)
+        """
+        CREATE INDEX IF NOT EXISTS idx_market_indicators_name_date
+        ON market_indicators(indicator_name, indicator_date, value, source)
+        """,
+        # get_active_weights / get_all_keywords: 키워드별 최신 조정값, 조정 횟수
+        """
+        CREATE INDEX IF NOT EXISTS idx_expert_weights_keyword_date
+        ON expert_weights(keyword_id, date_applied, adjusted_weight)
+        """,
+    ]),
+    (2, "키워드별 현재 가중치 구체화 테이블 + 가중치 버전", [
+        # save_expert_weight가 이력 저장과 같은 트랜잭션에서 갱신
+        """
+        CREATE TABLE IF NOT EXISTS active_weights (
+            keyword_id INTEGER PRIMARY KEY,
+            adjusted_weight REAL NOT NULL,
+            expert_weight_id INTEGER,
+            adjustment_count INTEGER NOT NULL DEFAULT 0,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (keyword_id) REFERENCES keywords(id)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS db_metadata (
+            key TEXT PRIMARY KEY,
+            value INTEGER NOT NULL
+        )
+        """,
+        # 기존 이력에서 키워드별 최신 조정값 / 조정 횟수 채우기
+        """
+        INSERT OR REPLACE INTO active_weights
+        (keyword_id, adjusted_weight, expert_weight_id, adjustment_count, updated_at)
+        SELECT keyword_id, adjusted_weight, id, adjustment_count, date_applied
+        FROM (
+            SELECT
+                ew.*,
+                ROW_NUMBER() OVER (
+                    PARTITION BY keyword_id ORDER BY date_applied DESC, id DESC
+                ) AS rn,
+                COUNT(*) OVER (PARTITION BY keyword_id) AS adjustment_count
+            FROM expert_weights ew
+        )
+        WHERE rn = 1
+        """,
+        """
+        INSERT OR IGNORE INTO db_metadata (key, value) VALUES ('weights_version', 1)
+        """,
+    ]),
+    (3, "시차 조인용 정수 일자 컬럼 + 인덱스", [
+        # 율리우스 일수 정수 (가상 생성 컬럼 → 저장 코드 변경 없이 항상 동기화)
+        """
+        ALTER TABLE market_indicators ADD COLUMN indicator_day INTEGER
+        GENERATED ALWAYS AS (CAST(julianday(date(indicator_date)) AS INTEGER)) VIRTUAL
+        """,
+        # 회의 날짜는 'YYYY_MM_DD' 형식도 허용
+        """
+        ALTER TABLE tone_results ADD COLUMN meeting_day INTEGER
+        GENERATED ALWAYS AS (CAST(julianday(date(replace(meeting_date, '_', '-'))) AS INTEGER)) VIRTUAL
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_market_indicators_day
+        ON market_indicators(indicator_day, indicator_name, value, indicator_date)
+        """,
+    ]),
+    (4, "압축 문서 저장소 컬럼", [
+        # 원문 / 정제 텍스트는 압축 BLOB, 섹션은 정제 텍스트 기준 오프셋 (document_store 참조)
+        "ALTER TABLE documents ADD COLUMN content_hash TEXT",
+        "ALTER TABLE documents ADD COLUMN codec TEXT",
+        "ALTER TABLE documents ADD COLUMN raw_blob BLOB",
+        "ALTER TABLE documents ADD COLUMN cleaned_blob BLOB",
+        "ALTER TABLE documents ADD COLUMN discussion_start INTEGER",
+        "ALTER TABLE documents ADD COLUMN discussion_end INTEGER",
+        "ALTER TABLE documents ADD COLUMN decision_start INTEGER",
+        "ALTER TABLE documents ADD COLUMN decision_end INTEGER",
+        "ALTER TABLE documents ADD COLUMN sections_version TEXT",
+        "ALTER TABLE documents ADD COLUMN raw_length INTEGER",
+        "ALTER TABLE documents ADD COLUMN stored_bytes INTEGER",
+        "ALTER TABLE documents ADD COLUMN source_path TEXT",
+        "ALTER TABLE documents ADD COLUMN updated_at TIMESTAMP",
+        """
+        CREATE INDEX IF NOT EXISTS idx_documents_content_hash
+        ON documents(content_hash)
+        """,
+    ]),
+    (5, "의사록 전문 검색 인덱스 (FTS5)", [
+        # 본문 없는(contentless) 색인: rowid = 문서 id * 2 + 섹션 번호 (search_index 참조)
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts
+        USING fts5(body, content='', tokenize='unicode61')
+        """,
+        # 문서가 색인된 토큰화 규칙 버전 (NULL이면 미색인)
+        "ALTER TABLE documents ADD COLUMN search_version INTEGER",
+    ]),
+    (6, "지표별 증분 동기화 기록", [
+        # 지표별 마지막 동기화 결과 (ecos_sync 참조)
+        """
+        CREATE TABLE IF NOT EXISTS sync_watermarks (
+            indicator_name TEXT NOT NULL,
+            source TEXT NOT NULL,
+            last_date DATE,
+            requested_from TEXT,
+            rows_fetched INTEGER NOT NULL DEFAULT 0,
+            rows_changed INTEGER NOT NULL DEFAULT 0,
+            synced_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (indicator_name, source)
+        )
+        """,
+    ]),
+]
+
+# 가중치가 바뀔 때마다 1씩 증가 (하위 캐시의 키로 사용)
+BUMP_WEIGHTS_VERSION = """
+INSERT INTO db_metadata (key, value) VALUES ('weights_version', 1)
+ON CONFLICT(key) DO UPDATE SET value = value + 1
+"""
+
+# 방금 추가한 조정 이력(id > ?)을 현재 가중치에 반영 (같은 키워드가 여러 번이면 마지막 값)
+UPSERT_ACTIVE_FROM_HISTORY = """
+INSERT INTO active_weights
+(keyword_id, adjusted_weight, expert_weight_id, adjustment_count, updated_at)
+SELECT keyword_id, adjusted_weight, id, 1, CURRENT_TIMESTAMP
+FROM expert_weights
+WHERE id > ?
+ORDER BY id
+ON CONFLICT(keyword_id) DO UPDATE SET
+    adjusted_weight = excluded.adjusted_weight,
+    expert_weight_id = excluded.expert_weight_id,
+    adjustment_count = adjustment_count + 1,
+    updated_at = excluded.updated_at
+"""
+
+# 값이 바뀐 행만 삽입/갱신 (같은 값이면 변경 없음 → rowcount에서 제외, id 유지)
+UPSERT_CHANGED_MARKET_ROW = """
+INSERT INTO market_indicators (indicator_date, indicator_name, value, source)
+VALUES (?, ?, ?, ?)
+ON CONFLICT(indicator_date, indicator_name, source) DO UPDATE SET
+    value = excluded.value
+WHERE market_indicators.value IS NOT excluded.value
+"""
+
+# 톤 지수 모델 파라미터 기본값 (α: 텍스트, β: 시장 반응, γ: 뉴스 감성)
+DEFAULT_MODEL_PARAMETERS = {"alpha": 0.5, "beta": 0.3, "gamma": 0.2}
+
+# 구체화된 현재 가중치와 기본 가중치를 조인 (키워드당 기본키 조회 1회)
+ACTIVE_WEIGHTS_QUERY = """
+SELECT
+    k.term,
+    COALESCE(a.adjusted_weight, k.base_weight) as active_weight
+FROM keywords k
+LEFT JOIN active_weights a ON a.keyword_id = k.id
+"""
+
+ALL_KEYWORDS_QUERY = """
+SELECT
+    k.term,
+    k.polarity,
+    k.base_weight,
+    k.category,
+    k.description,
+    COALESCE(a.adjusted_weight, k.base_weight) as active_weight,
+    COALESCE(a.adjustment_count, 0) as adjustment_count
+FROM keywords k
+LEFT JOIN active_weights a ON a.keyword_id = k.id
+ORDER BY k.polarity, k.category, k.term
+"""
+
+
+@dataclass
+class LagCube:
+    """회의 × 지표 × 시차 큐브"""
+    values: np.ndarray          # (회의 수, 지표 수, 시차 수), 관측치 없으면 NaN
+    meeting_dates: List[str]
+    tone_index: np.ndarray      # 회의별 톤 지수
+    indicators: List[str]
+    offsets: np.ndarray         # -lag ~ +lag
+    unit: str                   # "calendar" (일) 또는 "trading" (관측일 기준)
+
+    def tone_correlations(self, min_samples: int = 5) -> pd.DataFrame:
+        """
+        시차별 톤 지수-지표 상관계수
+
+        Returns:
+            DataFrame (index: 시차, columns: 지표), 표본이 min_samples 미만이면 NaN
+        """
+        x = np.broadcast_to(self.tone_index[:, None, None], self.values.shape)
+        valid = ~np.isnan(self.values) & ~np.isnan(x)
+        n = valid.sum(axis=0)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            xv = np.where(valid, x, 0.0)
+            yv = np.where(valid, self.values, 0.0)
+            mean_x = xv.sum(axis=0) / n
+            mean_y = yv.sum(axis=0) / n
+            dx = np.where(valid, x - mean_x, 0.0)
+            dy = np.where(valid, self.values - mean_y, 0.0)
+            corr = (dx * dy).sum(axis=0) / np.sqrt((dx ** 2).sum(axis=0) * (dy ** 2).sum(axis=0))
+
+        corr[n < min_samples] = np.nan
+        return pd.DataFrame(corr.T, index=self.offsets, columns=self.indicators)
+
+
+@dataclass
+class SearchHit:
+    """의사록 검색 결과"""
+    meeting_date: str
+    section: str                        # "discussion" 또는 "decision"
+    score: float                        # 관련도 (-bm25, 클수록 관련도 높음)
+    offsets: List[Tuple[int, int]]      # 정제 텍스트 기준 검색어 출현 구간
+    snippet: str
+
+
+class QueryPlanError(RuntimeError):
+    """주요 조회 쿼리가 인덱스 대신 전체 테이블 스캔을 사용할 때 발생"""
+
+
+# 스키마 초기화가 끝난 DB 파일 (프로세스당 1회만 초기화)
+_initialized_paths = set()
+_init_lock = threading.Lock()
+
 
 @dataclass
 class ExpertWeight:
@@ -41,9 +276,21 @@ class ExpertWeight:
     date_applied: datetime
 
 
+@dataclass
+class WriteResult:
+    """일괄 저장 결과"""
+    received: int   # 입력 행 수
+    written: int    # 저장(삽입 또는 교체)된 행 수
+    skipped: int    # 오류로 저장되지 않은 행 수
+    unchanged: int = 0  # 기존 값과 같아 저장하지 않은 행 수 (only_changed 사용 시)
+
+
 class DatabaseManager:
     """데이터베이스 관리 클래스"""
 
+    # 이 행 수 이상이면 스테이징 테이블 병합 사용
+    STAGING_THRESHOLD = 50000
+
     def __init__(self, db_path: Optional[Path] = None):
         """
         데이터베이스 매니저 초기화
@@ -51,26 +298,175 @@ class DatabaseManager:
         Args:
             db_path: 데이터베이스 파일 경로 (None이면 기본 경로 사용)
         """
-        self.db_path = db_path or DB_PATH
+        self.db_path = Path(db_path or DB_PATH)
 
         # 디렉토리 생성
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # 데이터베이스 초기화
-        self._initialize_database()
+        # 프로세스 공유 연결 풀 (WAL, 스레드 인식)
+        self.pool: ConnectionPool = get_pool(self.db_path)
+
+        # 프로세스 공유 읽기 캐시 (테이블 세대 기반 무효화)
+        self.cache: QueryCache = get_query_cache(self.db_path)
+        self._tx_local = threading.local()
+
+        # 선택 계측 (기본 비활성, 환경 변수 BOK_DB_STATS=1로 활성화 가능)
+        self.instrumentation: QueryStats = get_query_stats(self.db_path)
+        if self.instrumentation.enabled:
+            self.pool.set_trace_callback(self.instrumentation.trace)
+
+        # 데이터베이스 초기화 (프로세스당 1회)
+        with _init_lock:
+            if self.pool.db_path not in _initialized_paths:
+                self._initialize_database()
+                _initialized_paths.add(self.pool.db_path)
+                logger.info(f"데이터베이스 초기화 완료: {self.db_path}")
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """풀에서 연결 대여 (블록 종료 시 커밋, 예외 시 롤백)"""
+        with self.pool.connection() as conn:
+            yield conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        일괄 작업용 트랜잭션
+
+        블록 안에서 호출한 DatabaseManager 메서드는 모두 같은 연결/트랜잭션을 공유하며,
+        블록이 끝날 때 한 번에 커밋됩니다 (예외 발생 시 전체 롤백).
+
+        Example:
+            with db.transaction():
+                for term, weight in changes.items():
+                    db.save_expert_weight(term, weight)
+        """
+        outermost = not self.pool.in_transaction()
+        if outermost:
+            self._tx_local.tables = set()
+        try:
+            with self.pool.connection() as conn:
+                yield conn
+        finally:
+            if outermost:
+                # 커밋(또는 롤백) 이후 블록 안에서 쓴 테이블 캐시를 다시 무효화
+                tables, self._tx_local.tables = self._tx_local.tables, None
+                self.cache.bump(*tables)
+
+    def _invalidate(self, *tables: str):
+        """
+        쓰기 후 테이블 캐시 무효화
+
+        쓰기 메서드의 연결 블록이 끝난 뒤(커밋 후) 호출합니다.
+        transaction() 안이면 바깥 블록 종료 시 한 번 더 무효화됩니다.
+        """
+        pending = getattr(self._tx_local, "tables", None)
+        if pending is not None:
+            pending.update(tables)
+        self.cache.bump(*tables)
+
+    def _cached(self, key: Tuple, tables: Tuple[str, ...], loader):
+        """
+        읽기 캐시 경유 조회
+
+        트랜잭션 안에서는 커밋 전 데이터가 캐시에 남지 않도록 캐시를 거치지 않습니다.
+        """
+        if self.pool.in_transaction():
+            return loader()
+        return self.cache.get_or_load(key, tables, loader)
+
+    def cache_stats(self) -> Dict[str, float]:
+        """읽기 캐시 통계 (적중/실패 횟수, 항목 수 등)"""
+        return self.cache.stats()
+
+    def clear_cache(self):
+        """읽기 캐시 비우기"""
+        self.cache.clear()
+
+    def enable_instrumentation(self, slow_query_ms: Optional[float] = None):
+        """
+        계측 활성화 (같은 DB 파일을 쓰는 매니저 전체에 적용)
+
+        Args:
+            slow_query_ms: 느린 호출 기준 (ms, None이면 기존 값 유지)
+        """
+        if slow_query_ms is not None:
+            self.instrumentation.slow_query_ms = slow_query_ms
+        self.instrumentation.enabled = True
+        self.pool.set_trace_callback(self.instrumentation.trace)
+
+    def disable_instrumentation(self):
+        """계측 비활성화 (누적 통계는 유지)"""
+        self.instrumentation.enabled = False
+        self.pool.set_trace_callback(None)
+
+    def explain_sql(self, sql: str) -> List[str]:
+        """SQL 실행 계획 (EXPLAIN QUERY PLAN의 detail 목록)"""
+        with self._connection() as conn:
+            return [row['detail'] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}")]
+
+    def stats(self) -> Dict:
+        """
+        DB 사용 통계 스냅샷
 
-        logger.info(f"데이터베이스 초기화 완료: {self.db_path}")
+        Returns:
+            {
+                "instrumentation": {"enabled", "slow_query_ms"},
+                "methods": {메서드: {calls, errors, mean_ms, p50_ms, p95_ms, max_ms, rows, histogram}},
+                "slow_queries": [{time, method, duration_ms, rows, statements: [{sql, plan}]}],
+                "connections": {opened, closed, open, idle, max_size},
+                "cache": {entries, hits, misses, hit_rate, ...}
+            }
+        """
+        snapshot = self.instrumentation.snapshot()
+        return {
+            "instrumentation": {
+                "enabled": snapshot["enabled"],
+                "slow_query_ms": snapshot["slow_query_ms"],
+            },
+            "methods": snapshot["methods"],
+            "slow_queries": snapshot["slow_queries"],
+            "connections": self.pool.stats(),
+            "cache": self.cache.stats(),
+        }
 
-    def _get_connection(self) -> sqlite3.Connection:
-        """데이터베이스 연결 생성"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # 딕셔너리 형태로 결과 반환
-        return conn
+    def reset_stats(self):
+        """계측 누적 통계 초기화"""
+        self.instrumentation.reset()
 
     def _initialize_database(self):
-        """데이터베이스 스키마 생성"""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        """데이터베이스 스키마 생성 및 마이그레이션 적용"""
+        with self._connection() as conn:
+            self._create_schema(conn.cursor())
+            conn.commit()
+            self._apply_migrations(conn)
+
+    def _apply_migrations(self, conn: sqlite3.Connection):
+        """PRAGMA user_version 이후의 마이그레이션을 버전별 트랜잭션으로 적용"""
+        current = conn.execute("PRAGMA user_version").fetchone()[0]
+
+        for version, description, statements in SCHEMA_MIGRATIONS:
+            if version <= current:
+                continue
+            try:
+                conn.execute("BEGIN")
+                for statement in statements:
+                    conn.execute(statement)
+                conn.execute(f"PRAGMA user_version = {version}")
+                conn.commit()
+            except sqlite3.Error:
+                conn.rollback()
+                logger.error(f"스키마 마이그레이션 실패: v{version} ({description})")
+                raise
+            logger.info(f"스키마 마이그레이션 적용: v{version} ({description})")
+
+    def schema_version(self) -> int:
+        """현재 스키마 버전 (적용된 마지막 마이그레이션 번호)"""
+        with self._connection() as conn:
+            return conn.execute("PRAGMA user_version").fetchone()[0]
+
+    def _create_schema(self, cursor: sqlite3.Cursor):
+        """테이블 생성 (CREATE TABLE IF NOT EXISTS)"""
 
         # 1. 문서 원본 테이블
         cursor.execute("""
@@ -180,9 +576,7 @@ class DatabaseManager:
         )
         """)
 
-        conn.commit()
-        conn.close()
-
+    @instrumented
     def save_keywords_from_dict(self, sentiment_dict):
         """
         감성 사전에서 키워드 로드하여 DB에 저장
@@ -190,28 +584,31 @@ class DatabaseManager:
         Args:
             sentiment_dict: SentimentDictionary 객체
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with self._connection() as conn:
+            cursor = conn.cursor()
 
-        # 매파 키워드
-        for term, entry in sentiment_dict.hawkish_terms.items():
-            cursor.execute("""
-            INSERT OR REPLACE INTO keywords (term, polarity, base_weight, category, description)
-            VALUES (?, ?, ?, ?, ?)
-            """, (entry.term, entry.polarity, entry.weight, entry.category, entry.description))
+            # 매파 키워드
+            for term, entry in sentiment_dict.hawkish_terms.items():
+                cursor.execute("""
+                INSERT OR REPLACE INTO keywords (term, polarity, base_weight, category, description)
+                VALUES (?, ?, ?, ?, ?)
+                """, (entry.term, entry.polarity, entry.weight, entry.category, entry.description))
 
-        # 비둘기파 키워드
-        for term, entry in sentiment_dict.dovish_terms.items():
-            cursor.execute("""
-            INSERT OR REPLACE INTO keywords (term, polarity, base_weight, category, description)
-            VALUES (?, ?, ?, ?, ?)
-            """, (entry.term, entry.polarity, entry.weight, entry.category, entry.description))
+            # 비둘기파 키워드
+            for term, entry in sentiment_dict.dovish_terms.items():
+                cursor.execute("""
+                INSERT OR REPLACE INTO keywords (term, polarity, base_weight, category, description)
+                VALUES (?, ?, ?, ?, ?)
+                """, (entry.term, entry.polarity, entry.weight, entry.category, entry.description))
+
+            # 기본 가중치가 바뀌었을 수 있으므로 가중치 버전 증가
+            cursor.execute(BUMP_WEIGHTS_VERSION)
 
-        conn.commit()
-        conn.close()
+        self._invalidate("keywords", "db_metadata")
 
         logger.info(f"키워드 {len(sentiment_dict.hawkish_terms) + len(sentiment_dict.dovish_terms)}개 저장 완료")
 
+    @instrumented
     def save_expert_weight(
         self,
         keyword: str,
@@ -228,31 +625,135 @@ class DatabaseManager:
             reason: 조정 사유
             expert_name: 전문가 이름
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with self._connection() as conn:
+            cursor = conn.cursor()
 
-        # 키워드 ID 조회
-        cursor.execute("SELECT id FROM keywords WHERE term = ?", (keyword,))
-        row = cursor.fetchone()
+            # 키워드 ID 조회
+            cursor.execute("SELECT id FROM keywords WHERE term = ?", (keyword,))
+            row = cursor.fetchone()
 
-        if not row:
-            logger.warning(f"키워드를 찾을 수 없습니다: {keyword}")
-            conn.close()
-            return
+            if not row:
+                logger.warning(f"키워드를 찾을 수 없습니다: {keyword}")
+                return
 
-        keyword_id = row['id']
+            keyword_id = row['id']
 
-        # 조정 이력 저장
-        cursor.execute("""
-        INSERT INTO expert_weights (keyword_id, adjusted_weight, adjustment_reason, expert_name)
-        VALUES (?, ?, ?, ?)
-        """, (keyword_id, adjusted_weight, reason, expert_name))
+            # 조정 이력 저장
+            cursor.execute("""
+            INSERT INTO expert_weights (keyword_id, adjusted_weight, adjustment_reason, expert_name)
+            VALUES (?, ?, ?, ?)
+            """, (keyword_id, adjusted_weight, reason, expert_name))
 
-        conn.commit()
-        conn.close()
+            # 현재 가중치 / 가중치 버전 갱신 (같은 트랜잭션)
+            cursor.execute("""
+            INSERT INTO active_weights
+            (keyword_id, adjusted_weight, expert_weight_id, adjustment_count, updated_at)
+            VALUES (?, ?, ?, 1, CURRENT_TIMESTAMP)
+            ON CONFLICT(keyword_id) DO UPDATE SET
+                adjusted_weight = excluded.adjusted_weight,
+                expert_weight_id = excluded.expert_weight_id,
+                adjustment_count = adjustment_count + 1,
+                updated_at = excluded.updated_at
+            """, (keyword_id, adjusted_weight, cursor.lastrowid))
+            cursor.execute(BUMP_WEIGHTS_VERSION)
+
+        self._invalidate("expert_weights", "active_weights", "db_metadata")
 
         logger.info(f"전문가 가중치 저장: {keyword} = {adjusted_weight}")
 
+    def _apply_weight_history(self, cursor: sqlite3.Cursor, inserted: int):
+        """
+        방금 추가한 조정 이력 inserted건을 현재 가중치에 반영하고 가중치 버전 증가
+
+        같은 트랜잭션에서 이력을 추가한 직후 호출해야 합니다
+        (쓰기 잠금을 쥐고 있으므로 AUTOINCREMENT id는 연속이며 가장 큼).
+        """
+        last_id = cursor.execute("SELECT MAX(id) FROM expert_weights").fetchone()[0]
+        cursor.execute(UPSERT_ACTIVE_FROM_HISTORY, (last_id - inserted,))
+        cursor.execute(BUMP_WEIGHTS_VERSION)
+
+    @instrumented
+    def save_expert_weights(
+        self,
+        weights: Dict[str, float],
+        reason: str = "",
+        expert_name: str = "User"
+    ) -> int:
+        """
+        전문가 가중치 일괄 저장 (단일 트랜잭션)
+
+        Args:
+            weights: {키워드: 조정된 가중치}
+            reason: 조정 사유
+            expert_name: 전문가 이름
+
+        Returns:
+            저장된 키워드 수 (사전에 없는 키워드 제외)
+        """
+        if not weights:
+            return 0
+
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+            INSERT INTO expert_weights (keyword_id, adjusted_weight, adjustment_reason, expert_name)
+            SELECT id, ?, ?, ? FROM keywords WHERE term = ?
+            """, [(weight, reason, expert_name, term) for term, weight in weights.items()])
+            inserted = cursor.rowcount
+
+            if inserted > 0:
+                self._apply_weight_history(cursor, inserted)
+
+        if inserted < len(weights):
+            logger.warning(f"키워드를 찾을 수 없어 제외: {len(weights) - inserted}개")
+        self._invalidate("expert_weights", "active_weights", "db_metadata")
+        logger.info(f"전문가 가중치 일괄 저장: {inserted}개")
+        return inserted
+
+    @instrumented
+    def reset_expert_weights(
+        self,
+        polarity: Optional[str] = None,
+        reason: str = "전문가가 기본값으로 복원",
+        expert_name: str = "User"
+    ) -> int:
+        """
+        기본값과 다른 전문가 가중치를 기본값으로 복원 (조정 이력을 남기는 단일 트랜잭션)
+
+        Args:
+            polarity: "hawkish" / "dovish"로 제한 (None이면 전체)
+            reason: 조정 사유
+            expert_name: 전문가 이름
+
+        Returns:
+            복원된 키워드 수
+        """
+        query = """
+        INSERT INTO expert_weights (keyword_id, adjusted_weight, adjustment_reason, expert_name)
+        SELECT k.id, k.base_weight, ?, ?
+        FROM keywords k
+        JOIN active_weights a ON a.keyword_id = k.id
+        WHERE a.adjusted_weight != k.base_weight
+        """
+        params: List = [reason, expert_name]
+        if polarity is not None:
+            query += " AND k.polarity = ?"
+            params.append(polarity)
+        query += " ORDER BY k.id"
+
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            restored = cursor.rowcount
+
+            if restored > 0:
+                self._apply_weight_history(cursor, restored)
+
+        self._invalidate("expert_weights", "active_weights", "db_metadata")
+        logger.info(f"전문가 가중치 기본값 복원: {restored}개{f' ({polarity})' if polarity else ''}")
+        return restored
+
+    @instrumented
     def get_active_weights(self) -> Dict[str, float]:
         """
         현재 활성 가중치 반환 (전문가 조정값 우선, 없으면 기본값)
@@ -260,29 +761,29 @@ class DatabaseManager:
         Returns:
             {키워드: 가중치} 딕셔너리
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        return self._cached(("get_active_weights",), ("keywords", "active_weights"), self._load_active_weights)
 
-        # 가장 최근의 전문가 가중치와 기본 가중치를 조인
-        cursor.execute("""
-        SELECT
-            k.term,
-            COALESCE(
-                (SELECT adjusted_weight
-                 FROM expert_weights ew
-                 WHERE ew.keyword_id = k.id
-                 ORDER BY date_applied DESC
-                 LIMIT 1),
-                k.base_weight
-            ) as active_weight
-        FROM keywords k
-        """)
+    def _load_active_weights(self) -> Dict[str, float]:
+        with self._connection() as conn:
+            cursor = conn.execute(ACTIVE_WEIGHTS_QUERY)
 
-        weights = {row['term']: row['active_weight'] for row in cursor.fetchall()}
+            weights = {row['term']: row['active_weight'] for row in cursor.fetchall()}
 
-        conn.close()
         return weights
 
+    @instrumented
+    def get_weights_version(self) -> int:
+        """
+        가중치 버전 반환 (전문가 조정 / 키워드 저장 시마다 증가)
+
+        컴파일된 매처나 재계산된 톤 시계열 같은 하위 캐시는
+        가중치를 다시 조회하는 대신 이 값을 키로 사용할 수 있습니다.
+        """
+        with self._connection() as conn:
+            row = conn.execute("SELECT value FROM db_metadata WHERE key = 'weights_version'").fetchone()
+        return row['value'] if row else 0
+
+    @instrumented
     def get_all_keywords(self) -> pd.DataFrame:
         """
         모든 키워드와 가중치 정보 반환
@@ -290,66 +791,227 @@ class DatabaseManager:
         Returns:
             DataFrame with columns: term, polarity, base_weight, active_weight, category
         """
-        conn = self._get_connection()
-
-        query = """
-        SELECT
-            k.term,
-            k.polarity,
-            k.base_weight,
-            k.category,
-            k.description,
-            COALESCE(
-                (SELECT adjusted_weight
-                 FROM expert_weights ew
-                 WHERE ew.keyword_id = k.id
-                 ORDER BY date_applied DESC
-                 LIMIT 1),
-                k.base_weight
-            ) as active_weight,
-            (SELECT COUNT(*)
-             FROM expert_weights ew
-             WHERE ew.keyword_id = k.id) as adjustment_count
-        FROM keywords k
-        ORDER BY k.polarity, k.category, k.term
-        """
+        return self._cached(("get_all_keywords",), ("keywords", "active_weights"), self._load_all_keywords)
 
-        df = pd.read_sql_query(query, conn)
-        conn.close()
+    def _load_all_keywords(self) -> pd.DataFrame:
+        with self._connection() as conn:
+            df = pd.read_sql_query(ALL_KEYWORDS_QUERY, conn)
 
         return df
 
+    @instrumented
     def save_market_data(
         self,
         df: pd.DataFrame,
         indicator_name: str,
-        source: str = "ECOS"
-    ):
+        source: str = "ECOS",
+        staging: Optional[bool] = None,
+        only_changed: bool = False
+    ) -> "WriteResult":
         """
-        시장 지표 데이터 일괄 저장
+        시장 지표 데이터 일괄 저장 (executemany 단일 트랜잭션 upsert)
 
         Args:
             df: DataFrame with 'date' and 'value' columns
             indicator_name: 지표 이름 (예: 'base_rate', 'ktb_3y')
             source: 데이터 출처
+            staging: 임시 스테이징 테이블에 적재 후 한 번에 병합할지 여부
+                     (None이면 STAGING_THRESHOLD 행 이상일 때 자동 사용)
+            only_changed: 저장된 값과 다른 행만 삽입/갱신 (증분 동기화용, 기존 행 id 유지)
+
+        Returns:
+            WriteResult (입력/저장/제외/변경 없음 행 수)
+        """
+        rows = self._market_rows(df)
+        if staging is None:
+            staging = len(rows) >= self.STAGING_THRESHOLD
+
+        row_sql = UPSERT_CHANGED_MARKET_ROW if only_changed else """
+        INSERT OR REPLACE INTO market_indicators
+        (indicator_date, indicator_name, value, source)
+        VALUES (?, ?, ?, ?)
         """
-        conn = self._get_connection()
 
-        for _, row in df.iterrows():
+        with self._connection() as conn:
+            # 일괄 저장을 세이브포인트로 감싸 실패 시 일부 적용된 행까지 되돌린 뒤 재시도
+            # (되돌리지 않으면 재시도 시 이미 쓰인 행이 '변경 없음'으로 집계됨)
+            conn.execute("SAVEPOINT market_bulk")
             try:
-                conn.execute("""
-                INSERT OR REPLACE INTO market_indicators
-                (indicator_date, indicator_name, value, source)
-                VALUES (?, ?, ?, ?)
-                """, (row['date'], indicator_name, row['value'], source))
-            except Exception as e:
-                logger.warning(f"시장 데이터 저장 실패: {e}")
+                if staging:
+                    written = self._merge_market_staging(conn, rows, indicator_name, source, only_changed)
+                else:
+                    written = conn.executemany(
+                        row_sql, ((date, indicator_name, value, source) for date, value in rows)
+                    ).rowcount
+                stored = len(rows)
+                conn.execute("RELEASE market_bulk")
+            except (sqlite3.Error, ValueError, TypeError) as e:
+                conn.execute("ROLLBACK TO market_bulk")
+                conn.execute("RELEASE market_bulk")
+
+                # 일부 행 오류 시 행 단위로 재시도하여 정상 행은 저장
+                logger.warning(f"시장 데이터 일괄 저장 실패, 행 단위로 재시도: {e}")
+                written = 0
+                stored = 0
+                for date, value in rows:
+                    try:
+                        written += conn.execute(row_sql, (date, indicator_name, value, source)).rowcount
+                        stored += 1
+                    except Exception as row_error:
+                        logger.warning(f"시장 데이터 저장 실패: {row_error}")
+
+        if written:
+            self._invalidate("market_indicators")
+
+        result = WriteResult(
+            received=len(df),
+            written=written,
+            skipped=len(df) - stored,
+            unchanged=stored - written
+        )
+        logger.info(
+            f"시장 데이터 저장: {indicator_name} "
+            f"({result.written}/{result.received}개 레코드"
+            f"{f', 변경 없음 {result.unchanged}개' if only_changed else ''}"
+            f"{', 스테이징 병합' if staging else ''})"
+        )
+        return result
+
+    @staticmethod
+    def _market_rows(df: pd.DataFrame) -> List[Tuple]:
+        """DataFrame을 (날짜, 값) 튜플 리스트로 한 번에 변환"""
+        dates = df['date']
+        if pd.api.types.is_datetime64_any_dtype(dates):
+            # Timestamp는 sqlite3가 직접 바인딩하지 못하므로 문자열로 변환
+            # (일/월 단위 지표는 날짜 문자열 조건과 비교되도록 'YYYY-MM-DD')
+            has_time = (dates.dropna() != dates.dropna().dt.normalize()).any()
+            fmt = '%Y-%m-%d %H:%M:%S' if has_time else '%Y-%m-%d'
+            dates = dates.dt.strftime(fmt).astype(object).where(dates.notna(), None)
+        values = df['value'].astype(object).where(df['value'].notna(), None)
+        return list(zip(dates.tolist(), values.tolist()))
+
+    def _merge_market_staging(
+        self,
+        conn: sqlite3.Connection,
+        rows: List[Tuple],
+        indicator_name: str,
+        source: str,
+        only_changed: bool = False
+    ) -> int:
+        """
+        인덱스 없는 임시 테이블에 적재한 뒤 INSERT ... SELECT 한 번으로 병합
+
+        only_changed면 저장된 값과 다른 행만 삽입/갱신
+
+        Returns:
+            병합(삽입 또는 교체)된 행 수
+        """
+        conn.execute("""
+        CREATE TEMP TABLE IF NOT EXISTS market_staging (
+            indicator_date DATE,
+            value REAL
+        )
+        """)
+        conn.execute("DELETE FROM temp.market_staging")
+        conn.executemany("INSERT INTO temp.market_staging (indicator_date, value) VALUES (?, ?)", rows)
+        if only_changed:
+            # WHERE true: INSERT ... SELECT ... ON CONFLICT 구문 모호성 회피 (SQLite 문서 참조)
+            merged = conn.execute("""
+            INSERT INTO market_indicators
+            (indicator_date, indicator_name, value, source)
+            SELECT indicator_date, ?, value, ?
+            FROM temp.market_staging
+            WHERE true
+            ORDER BY rowid
+            ON CONFLICT(indicator_date, indicator_name, source) DO UPDATE SET
+                value = excluded.value
+            WHERE market_indicators.value IS NOT excluded.value
+            """, (indicator_name, source)).rowcount
+        else:
+            merged = conn.execute("""
+            INSERT OR REPLACE INTO market_indicators
+            (indicator_date, indicator_name, value, source)
+            SELECT indicator_date, ?, value, ?
+            FROM temp.market_staging
+            ORDER BY rowid
+            """, (indicator_name, source)).rowcount
+        conn.execute("DELETE FROM temp.market_staging")
+        return merged
+
+    @instrumented
+    def get_latest_indicator_dates(self, source: Optional[str] = None) -> Dict[str, str]:
+        """
+        지표별 마지막 저장 날짜 (증분 동기화 시작점)
+
+        Args:
+            source: 데이터 출처로 제한 (None이면 전체)
+
+        Returns:
+            {지표 이름: 마지막 indicator_date}
+        """
+        query = "SELECT indicator_name, MAX(indicator_date) AS last_date FROM market_indicators"
+        params: List = []
+        if source is not None:
+            query += " WHERE source = ?"
+            params.append(source)
+        query += " GROUP BY indicator_name"
+
+        with self._connection() as conn:
+            rows = conn.execute(query, params).fetchall()
+
+        return {row['indicator_name']: row['last_date'] for row in rows}
 
-        conn.commit()
-        conn.close()
+    @instrumented
+    def save_sync_watermark(
+        self,
+        indicator_name: str,
+        source: str,
+        last_date: Optional[str],
+        requested_from: Optional[str] = None,
+        rows_fetched: int = 0,
+        rows_changed: int = 0
+    ):
+        """
+        지표별 동기화 기록 저장 (지표당 마지막 1건 유지)
+
+        Args:
+            indicator_name: 지표 이름
+            source: 데이터 출처
+            last_date: 동기화 후 마지막 저장 날짜
+            requested_from: 요청 시작일 (API 형식)
+            rows_fetched: 수신 행 수
+            rows_changed: 삽입/갱신된 행 수
+        """
+        with self._connection() as conn:
+            conn.execute("""
+            INSERT INTO sync_watermarks
+            (indicator_name, source, last_date, requested_from, rows_fetched, rows_changed, synced_at)
+            VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(indicator_name, source) DO UPDATE SET
+                last_date = excluded.last_date,
+                requested_from = excluded.requested_from,
+                rows_fetched = excluded.rows_fetched,
+                rows_changed = excluded.rows_changed,
+                synced_at = excluded.synced_at
+            """, (indicator_name, source, last_date, requested_from, rows_fetched, rows_changed))
+
+    @instrumented
+    def get_sync_watermarks(self, source: Optional[str] = None) -> pd.DataFrame:
+        """지표별 마지막 동기화 기록 조회"""
+        query = (
+            "SELECT indicator_name, source, last_date, requested_from, "
+            "rows_fetched, rows_changed, synced_at FROM sync_watermarks"
+        )
+        params: List = []
+        if source is not None:
+            query += " WHERE source = ?"
+            params.append(source)
+        query += " ORDER BY indicator_name"
 
-        logger.info(f"시장 데이터 저장: {indicator_name} ({len(df)}개 레코드)")
+        with self._connection() as conn:
+            return pd.read_sql_query(query, conn, params=params)
 
+    @instrumented
     def get_market_data(
         self,
         indicator_name: Optional[str] = None,
@@ -367,9 +1029,24 @@ class DatabaseManager:
         Returns:
             DataFrame
         """
-        conn = self._get_connection()
+        query, params = self._market_data_query(indicator_name, start_date, end_date)
+
+        with self._connection() as conn:
+            df = pd.read_sql_query(query, conn, params=params)
 
-        query = "SELECT * FROM market_indicators WHERE 1=1"
+        return df
+
+    @staticmethod
+    def _market_data_query(
+        indicator_name: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> Tuple[str, List]:
+        """get_market_data 조회 쿼리 생성"""
+        query = (
+            "SELECT id, indicator_date, indicator_name, value, source "
+            "FROM market_indicators WHERE 1=1"
+        )
         params = []
 
         if indicator_name:
@@ -385,46 +1062,215 @@ class DatabaseManager:
             params.append(end_date)
 
         query += " ORDER BY indicator_date"
+        return query, params
 
-        df = pd.read_sql_query(query, conn, params=params)
-        conn.close()
-
-        return df
-
-    def get_correlation_data(self, lag_days: int = 30) -> pd.DataFrame:
+    @instrumented
+    def get_correlation_data(
+        self,
+        lag_days: int = 30,
+        as_cube: bool = False,
+        trading_days: bool = False,
+        indicators: Optional[List[str]] = None
+    ):
         """
         시차 분석용 데이터 조인 (톤 지수 + 시장 지표)
 
+        정수 일자 컬럼(meeting_day / indicator_day)의 범위 조건으로 조인하므로
+        회의마다 idx_market_indicators_day 인덱스 구간만 읽습니다.
+
         Args:
-            lag_days: 최대 시차 (일)
+            lag_days: 최대 시차 (일, trading_days=True면 관측일 수)
+            as_cube: True면 (회의 × 지표 × 시차) LagCube 반환
+            trading_days: 큐브의 시차를 달력일 대신 지표 관측일(영업일) 기준으로 계산
+            indicators: 대상 지표 (None이면 전체)
 
         Returns:
-            DataFrame with tone_index and market indicators
+            DataFrame with tone_index and market indicators (as_cube=True면 LagCube)
         """
-        conn = self._get_connection()
+        if as_cube:
+            return self.get_lag_cube(lag_days, trading_days=trading_days, indicators=indicators)
 
-        # 톤 결과와 시장 지표를 날짜로 조인
-        query = """
+        # 톤 결과와 시장 지표를 정수 일자 범위로 조인
+        indicator_filter = ""
+        params: List = [lag_days, lag_days]
+        if indicators:
+            indicator_filter = f" AND m.indicator_name IN ({', '.join('?' * len(indicators))})"
+            params += list(indicators)
+
+        query = f"""
         SELECT
             t.meeting_date,
             t.tone_index,
             t.tone_adjusted,
             m.indicator_name,
             m.value as indicator_value,
-            m.indicator_date
+            m.indicator_date,
+            m.indicator_day - t.meeting_day as lag_days
         FROM tone_results t
         LEFT JOIN market_indicators m
-            ON date(m.indicator_date) BETWEEN
-               date(t.meeting_date, '-' || ? || ' days') AND
-               date(t.meeting_date, '+' || ? || ' days')
+            ON m.indicator_day BETWEEN t.meeting_day - ? AND t.meeting_day + ?{indicator_filter}
         ORDER BY t.meeting_date, m.indicator_date
         """
 
-        df = pd.read_sql_query(query, conn, params=(lag_days, lag_days))
-        conn.close()
+        with self._connection() as conn:
+            df = pd.read_sql_query(query, conn, params=params)
 
         return df
 
+    @instrumented
+    def get_lag_cube(
+        self,
+        lag: int = 250,
+        trading_days: bool = True,
+        indicators: Optional[List[str]] = None
+    ) -> LagCube:
+        """
+        (회의 × 지표 × 시차) 큐브 생성
+
+        지표별 시계열을 한 번씩 읽은 뒤 NumPy 이진 탐색으로 회의별 시차 값을 모읍니다.
+        ±250 영업일처럼 넓은 창도 SQL 조인 없이 (회의 수 × 창 크기) 연산으로 처리됩니다.
+
+        Args:
+            lag: 최대 시차 (trading_days=True면 관측일 수, 아니면 달력일)
+            trading_days: 시차 단위 (True: 지표 관측일 기준, 시차 0 = 회의일 또는 그 이후 첫 관측일)
+            indicators: 대상 지표 (None이면 전체)
+
+        Returns:
+            LagCube
+        """
+        offsets = np.arange(-lag, lag + 1)
+
+        with self._connection() as conn:
+            meetings = conn.execute("""
+            SELECT meeting_date, meeting_day, tone_index
+            FROM tone_results
+            WHERE meeting_day IS NOT NULL
+            ORDER BY meeting_day
+            """).fetchall()
+
+            if indicators is None:
+                indicators = [row[0] for row in conn.execute(
+                    "SELECT DISTINCT indicator_name FROM market_indicators ORDER BY indicator_name"
+                )]
+
+            series = {}
+            for name in indicators:
+                rows = conn.execute("""
+                SELECT indicator_day, value
+                FROM market_indicators
+                WHERE indicator_name = ? AND indicator_day IS NOT NULL
+                ORDER BY indicator_date
+                """, (name,)).fetchall()
+                series[name] = rows
+
+        meeting_days = np.array([row['meeting_day'] for row in meetings], dtype=np.int64)
+        values = np.full((len(meetings), len(indicators), len(offsets)), np.nan)
+
+        for j, name in enumerate(indicators):
+            rows = series[name]
+            if not rows:
+                continue
+            days = np.array([row[0] for row in rows], dtype=np.int64)
+            data = np.array([np.nan if row[1] is None else row[1] for row in rows], dtype=np.float64)
+
+            # 같은 날 여러 출처가 있으면 마지막 값 사용
+            days, last = np.unique(days[::-1], return_index=True)
+            data = data[::-1][last]
+
+            if trading_days:
+                base = np.searchsorted(days, meeting_days, side="left")
+                idx = base[:, None] + offsets[None, :]
+                valid = (idx >= 0) & (idx < len(days))
+            else:
+                target = meeting_days[:, None] + offsets[None, :]
+                idx = np.searchsorted(days, target, side="left")
+                valid = idx < len(days)
+                valid[valid] &= days[idx[valid]] == target[valid]
+
+            values[:, j, :][valid] = data[idx[valid]]
+
+        return LagCube(
+            values=values,
+            meeting_dates=[row['meeting_date'] for row in meetings],
+            tone_index=np.array([row['tone_index'] for row in meetings], dtype=np.float64),
+            indicators=list(indicators),
+            offsets=offsets,
+            unit="trading" if trading_days else "calendar"
+        )
+
+    @instrumented
+    def search_documents(
+        self,
+        query: str,
+        limit: int = 20,
+        match_all: bool = True,
+        section: Optional[str] = None,
+        snippet_width: int = 60
+    ) -> List[SearchHit]:
+        """
+        의사록 전문 검색 (FTS5, 관련도 순)
+
+        Args:
+            query: 공백으로 구분한 검색어 (예: "가계부채 주택가격")
+            limit: 최대 결과 수
+            match_all: True면 모든 검색어 포함, False면 하나 이상 포함
+            section: "discussion" / "decision"으로 제한 (None이면 전체)
+            snippet_width: 스니펫에 포함할 출현 위치 앞뒤 글자 수
+
+        Returns:
+            SearchHit 리스트 (회의/섹션 단위)
+        """
+        from src.data.document_store import decompress_text
+
+        terms = query_terms(query)
+        if not terms:
+            return []
+
+        # FTS rowid = 문서 id * 섹션 수 + 섹션 번호 (DocumentStore._index_rows와 동일)
+        sections = len(SEARCH_SECTIONS)
+        sql = f"""
+        SELECT
+            d.meeting_date, f.rowid % {sections} AS section_idx, bm25(documents_fts) AS rank,
+            d.codec, d.cleaned_blob,
+            d.discussion_start, d.discussion_end, d.decision_start, d.decision_end
+        FROM documents_fts f
+        JOIN documents d ON d.id = f.rowid / {sections}
+        WHERE documents_fts MATCH ?
+        """
+        params: List = [build_match_query(terms, match_all)]
+        if section is not None:
+            sql += f" AND f.rowid % {sections} = ?"
+            params.append(SEARCH_SECTIONS.index(section))
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+
+        with self._connection() as conn:
+            rows = conn.execute(sql, params).fetchall()
+
+        hits = []
+        cleaned_cache: Dict[str, str] = {}
+        for row in rows:
+            meeting_date = row['meeting_date']
+            if meeting_date not in cleaned_cache:
+                cleaned_cache[meeting_date] = decompress_text(row['cleaned_blob'], row['codec'])
+            cleaned = cleaned_cache[meeting_date]
+
+            name = SEARCH_SECTIONS[row['section_idx']]
+            start, end = row[f'{name}_start'], row[f'{name}_end']
+            text = cleaned[start:end]
+            offsets = find_term_offsets(text, terms)
+
+            hits.append(SearchHit(
+                meeting_date=meeting_date,
+                section=name,
+                score=-row['rank'],
+                offsets=[(start + s, start + e) for s, e in offsets],
+                snippet=make_snippet(text, offsets, snippet_width)
+            ))
+
+        return hits
+
+    @instrumented
     def save_tone_result(
         self,
         meeting_date: str,
@@ -449,19 +1295,18 @@ class DatabaseManager:
             market_reaction_score: 시장 반응 점수
             news_sentiment_score: 뉴스 감성 점수
         """
-        conn = self._get_connection()
-
-        conn.execute("""
-        INSERT OR REPLACE INTO tone_results
-        (meeting_date, tone_index, tone_adjusted, hawkish_score, dovish_score,
-         interpretation, market_reaction_score, news_sentiment_score)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (meeting_date, tone_index, tone_adjusted, hawkish_score, dovish_score,
-              interpretation, market_reaction_score, news_sentiment_score))
+        with self._connection() as conn:
+            conn.execute("""
+            INSERT OR REPLACE INTO tone_results
+            (meeting_date, tone_index, tone_adjusted, hawkish_score, dovish_score,
+             interpretation, market_reaction_score, news_sentiment_score)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (meeting_date, tone_index, tone_adjusted, hawkish_score, dovish_score,
+                  interpretation, market_reaction_score, news_sentiment_score))
 
-        conn.commit()
-        conn.close()
+        self._invalidate("tone_results")
 
+    @instrumented
     def save_expert_comment(
         self,
         meeting_date: str,
@@ -478,16 +1323,15 @@ class DatabaseManager:
             comment: 주석 내용
             expert_name: 전문가 이름
         """
-        conn = self._get_connection()
-
-        conn.execute("""
-        INSERT INTO expert_comments (meeting_date, quote, comment, expert_name)
-        VALUES (?, ?, ?, ?)
-        """, (meeting_date, quote, comment, expert_name))
+        with self._connection() as conn:
+            conn.execute("""
+            INSERT INTO expert_comments (meeting_date, quote, comment, expert_name)
+            VALUES (?, ?, ?, ?)
+            """, (meeting_date, quote, comment, expert_name))
 
-        conn.commit()
-        conn.close()
+        self._invalidate("expert_comments")
 
+    @instrumented
     def get_expert_comments(self, meeting_date: str) -> List[Dict]:
         """
         특정 회의의 전문가 주석 조회
@@ -498,21 +1342,26 @@ class DatabaseManager:
         Returns:
             주석 리스트
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        return self._cached(
+            ("get_expert_comments", meeting_date),
+            ("expert_comments",),
+            lambda: self._load_expert_comments(meeting_date)
+        )
 
-        cursor.execute("""
-        SELECT quote, comment, expert_name, created_at
-        FROM expert_comments
-        WHERE meeting_date = ?
-        ORDER BY created_at DESC
-        """, (meeting_date,))
+    def _load_expert_comments(self, meeting_date: str) -> List[Dict]:
+        with self._connection() as conn:
+            cursor = conn.execute("""
+            SELECT quote, comment, expert_name, created_at
+            FROM expert_comments
+            WHERE meeting_date = ?
+            ORDER BY created_at DESC
+            """, (meeting_date,))
 
-        comments = [dict(row) for row in cursor.fetchall()]
+            comments = [dict(row) for row in cursor.fetchall()]
 
-        conn.close()
         return comments
 
+    @instrumented
     def save_model_parameter(self, name: str, value: float, description: str = ""):
         """
         모델 파라미터 저장 (α, β, γ 등)
@@ -522,16 +1371,57 @@ class DatabaseManager:
             value: 파라미터 값
             description: 설명
         """
-        conn = self._get_connection()
+        with self._connection() as conn:
+            conn.execute("""
+            INSERT OR REPLACE INTO model_parameters (parameter_name, parameter_value, description, updated_at)
+            VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+            """, (name, value, description))
 
-        conn.execute("""
-        INSERT OR REPLACE INTO model_parameters (parameter_name, parameter_value, description, updated_at)
-        VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-        """, (name, value, description))
+        self._invalidate("model_parameters")
+
+    @instrumented
+    def save_model_parameters(
+        self,
+        params: Dict[str, float],
+        descriptions: Optional[Dict[str, str]] = None
+    ):
+        """
+        모델 파라미터 일괄 저장 (단일 트랜잭션)
+
+        Args:
+            params: {파라미터명: 값}
+            descriptions: {파라미터명: 설명}
+        """
+        descriptions = descriptions or {}
+        with self._connection() as conn:
+            conn.executemany("""
+            INSERT OR REPLACE INTO model_parameters (parameter_name, parameter_value, description, updated_at)
+            VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+            """, [(name, value, descriptions.get(name, "")) for name, value in params.items()])
 
-        conn.commit()
-        conn.close()
+        self._invalidate("model_parameters")
 
+    @instrumented
+    def reset_all_settings(self, reason: str = "전체 초기화", expert_name: str = "System") -> int:
+        """
+        전체 키워드 가중치와 모델 파라미터를 기본값으로 복원 (단일 트랜잭션, 일부만 적용되지 않음)
+
+        Returns:
+            복원된 키워드 수
+        """
+        with self.transaction():
+            restored = self.reset_expert_weights(reason=reason, expert_name=expert_name)
+            self.save_model_parameters(
+                DEFAULT_MODEL_PARAMETERS,
+                {
+                    "alpha": "Text Tone Weight (Reset)",
+                    "beta": "Market Reaction Weight (Reset)",
+                    "gamma": "News Sentiment Weight (Reset)",
+                }
+            )
+        return restored
+
+    @instrumented
     def get_model_parameters(self) -> Dict[str, float]:
         """
         모델 파라미터 조회
@@ -539,25 +1429,21 @@ class DatabaseManager:
         Returns:
             {파라미터명: 값} 딕셔너리
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        return self._cached(("get_model_parameters",), ("model_parameters",), self._load_model_parameters)
 
-        cursor.execute("SELECT parameter_name, parameter_value FROM model_parameters")
+    def _load_model_parameters(self) -> Dict[str, float]:
+        with self._connection() as conn:
+            cursor = conn.execute("SELECT parameter_name, parameter_value FROM model_parameters")
 
-        params = {row['parameter_name']: row['parameter_value'] for row in cursor.fetchall()}
-
-        conn.close()
+            params = {row['parameter_name']: row['parameter_value'] for row in cursor.fetchall()}
 
         # 기본값 설정
-        if 'alpha' not in params:
-            params['alpha'] = 0.5
-        if 'beta' not in params:
-            params['beta'] = 0.3
-        if 'gamma' not in params:
-            params['gamma'] = 0.2
+        for name, value in DEFAULT_MODEL_PARAMETERS.items():
+            params.setdefault(name, value)
 
         return params
 
+    @instrumented
     def save_forecast(
         self,
         release_date: str,
@@ -578,22 +1464,21 @@ class DatabaseManager:
             source_url: 출처 URL
             description: 설명 (예: '2025년 11월 경제전망')
         """
-        conn = self._get_connection()
-        
         try:
-            conn.execute("""
-            INSERT OR REPLACE INTO economic_forecasts 
-            (release_date, target_year, gdp_growth, cpi_inflation, source_url, description)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """, (release_date, target_year, gdp_growth, cpi_inflation, source_url, description))
-            
-            conn.commit()
+            with self._connection() as conn:
+                conn.execute("""
+                INSERT OR REPLACE INTO economic_forecasts 
+                (release_date, target_year, gdp_growth, cpi_inflation, source_url, description)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """, (release_date, target_year, gdp_growth, cpi_inflation, source_url, description))
+
+            self._invalidate("economic_forecasts")
+
             logger.info(f"경제 전망 저장 완료: {release_date} (Year: {target_year})")
         except Exception as e:
             logger.error(f"경제 전망 저장 실패: {e}")
-        finally:
-            conn.close()
 
+    @instrumented
     def get_latest_forecast(self, target_date: Optional[str] = None) -> Optional[Dict]:
         """
         특정 시점 기준 가장 최신 경제 전망 조회
@@ -605,39 +1490,43 @@ class DatabaseManager:
         Returns:
             전망 데이터 딕셔너리 or None
         """
-        conn = self._get_connection()
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
         if target_date is None:
             target_date = datetime.now().strftime('%Y-%m-%d')
-            
-        # target_date 이전에 발표된 가장 최신 발표일 찾기
-        cursor.execute("""
-        SELECT release_date 
-        FROM economic_forecasts 
-        WHERE release_date <= ? 
-        ORDER BY release_date DESC 
-        LIMIT 1
-        """, (target_date,))
-        
-        row = cursor.fetchone()
-        if not row:
-            conn.close()
-            return None
-            
-        latest_release_date = row['release_date']
-        
-        # 해당 발표일의 모든 전망 데이터 조회
-        cursor.execute("""
-        SELECT * 
-        FROM economic_forecasts 
-        WHERE release_date = ?
-        ORDER BY target_year ASC
-        """, (latest_release_date,))
-        
-        rows = cursor.fetchall()
-        conn.close()
+
+        return self._cached(
+            ("get_latest_forecast", target_date),
+            ("economic_forecasts",),
+            lambda: self._load_latest_forecast(target_date)
+        )
+
+    def _load_latest_forecast(self, target_date: str) -> Optional[Dict]:
+        with self._connection() as conn:
+            cursor = conn.cursor()
+
+            # target_date 이전에 발표된 가장 최신 발표일 찾기
+            cursor.execute("""
+            SELECT release_date 
+            FROM economic_forecasts 
+            WHERE release_date <= ? 
+            ORDER BY release_date DESC 
+            LIMIT 1
+            """, (target_date,))
+
+            row = cursor.fetchone()
+            if not row:
+                return None
+
+            latest_release_date = row['release_date']
+
+            # 해당 발표일의 모든 전망 데이터 조회
+            cursor.execute("""
+            SELECT * 
+            FROM economic_forecasts 
+            WHERE release_date = ?
+            ORDER BY target_year ASC
+            """, (latest_release_date,))
+
+            rows = cursor.fetchall()
         
         if not rows:
             return None
@@ -658,12 +1547,100 @@ class DatabaseManager:
             
         return result
 
+    def _hot_queries(self) -> Dict[str, Tuple[str, List, List[str]]]:
+        """
+        실행 계획을 점검할 주요 쿼리
+
+        Returns:
+            {이름: (SQL, 파라미터, 전체 스캔을 허용하는 테이블/별칭)}
+        """
+        market_query, market_params = self._market_data_query('usd_krw', '2020-01-01', '2020-12-31')
+        return {
+            "get_market_data": (market_query, market_params, []),
+            # 회의(바깥 루프)는 전체 순회, 지표는 일자 인덱스 범위 탐색이어야 함
+            "get_correlation_data": (
+                """
+                SELECT t.meeting_date, m.indicator_name, m.value
+                FROM tone_results t
+                LEFT JOIN market_indicators m
+                    ON m.indicator_day BETWEEN t.meeting_day - ? AND t.meeting_day + ?
+                """,
+                [250, 250],
+                ["t"]
+            ),
+            # 키워드 테이블은 전체를 반환하므로 스캔 허용, 현재 가중치는 기본키 조회여야 함
+            "get_active_weights": (ACTIVE_WEIGHTS_QUERY, [], ["k"]),
+            "get_all_keywords": (ALL_KEYWORDS_QUERY, [], ["k"]),
+        }
+
+    def explain_query_plans(self) -> Dict[str, List[str]]:
+        """
+        주요 쿼리의 EXPLAIN QUERY PLAN 결과
+
+        Returns:
+            {쿼리 이름: [실행 계획 행, ...]}
+        """
+        plans = {}
+        with self._connection() as conn:
+            for name, (query, params, _) in self._hot_queries().items():
+                rows = conn.execute(f"EXPLAIN QUERY PLAN {query}", params).fetchall()
+                plans[name] = [row['detail'] for row in rows]
+        return plans
+
+    def check_query_plans(self) -> Dict[str, List[str]]:
+        """
+        주요 쿼리가 전체 테이블 스캔으로 퇴행하지 않았는지 확인
+
+        Returns:
+            {쿼리 이름: [실행 계획 행, ...]}
+
+        Raises:
+            QueryPlanError: 허용되지 않은 테이블에 SCAN이 있는 경우
+        """
+        plans = self.explain_query_plans()
+        hot_queries = self._hot_queries()
+        regressions = []
+
+        for name, details in plans.items():
+            allowed = set(hot_queries[name][2])
+            for detail in details:
+                words = detail.split()
+                if len(words) >= 2 and words[0] == "SCAN" and words[1] not in allowed:
+                    regressions.append(f"{name}: {detail}")
+
+        if regressions:
+            raise QueryPlanError("전체 테이블 스캔 감지:\n" + "\n".join(regressions))
+
+        return plans
+
     def close(self):
         """데이터베이스 연결 종료"""
-        # SQLite는 각 메서드에서 연결을 열고 닫으므로 여기서는 불필요
+        # 연결은 프로세스 공유 풀이 관리하므로 매니저 단위로 닫지 않음
+        # (전체 종료는 db_pool.close_all_pools())
         pass
 
 
+# 프로세스 공유 DatabaseManager (Streamlit 재실행마다 새로 만들지 않도록)
+_shared_managers: Dict[Path, DatabaseManager] = {}
+_shared_lock = threading.Lock()
+
+
+def get_database_manager(db_path: Optional[Path] = None) -> DatabaseManager:
+    """
+    DB 파일별 공유 DatabaseManager 반환 (없으면 생성)
+
+    Args:
+        db_path: 데이터베이스 파일 경로 (None이면 기본 경로 사용)
+    """
+    key = Path(db_path or DB_PATH).resolve()
+    with _shared_lock:
+        manager = _shared_managers.get(key)
+        if manager is None:
+            manager = DatabaseManager(key)
+            _shared_managers[key] = manager
+        return manager
+
+
 def main():
     """테스트 실행"""
     print("=" * 70)
@@ -692,6 +1669,14 @@ def main():
 
     params = db.get_model_parameters()
     print(f"\n모델 파라미터: {params}")
+    print(f"읽기 캐시: {db.cache_stats()}")
+
+    # 주요 쿼리 실행 계획 점검
+    print(f"\n스키마 버전: {db.schema_version()}")
+    for name, details in db.check_query_plans().items():
+        print(f"\n[{name}]")
+        for detail in details:
+            print(f"  {detail}")
 
     print(f"\n데이터베이스 위치: {DB_PATH}")
     print("=" * 70)
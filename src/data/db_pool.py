@@ -0,0 +1,182 @@
+"""
+SQLite 연결 풀 모듈
+
+DatabaseManager가 메서드마다 연결을 새로 열고 닫는 대신,
+프로세스 단위로 공유되는 연결 풀에서 연결을 빌려 씁니다.
+
+- WAL 저널 모드: 읽기와 쓰기가 서로를 막지 않음 (대시보드 세션 + 백그라운드 갱신 작업)
+- busy_timeout: 쓰기 잠금 경합 시 즉시 "database is locked" 대신 대기
+- 스레드 인식: 같은 스레드에서 중첩 사용 시 같은 연결/트랜잭션을 재사용
+  → 가장 바깥 블록이 끝날 때 한 번만 커밋 (오류 시 롤백)
+"""
+
+import queue
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 연결 생성 시 적용할 PRAGMA
+DEFAULT_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",       # WAL 모드에서는 NORMAL로도 커밋 내구성 유지 (전원 장애 제외)
+    "busy_timeout": 5000,          # ms
+    "temp_store": "MEMORY",
+    "cache_size": -20000,          # KiB 단위 (약 20MB)
+    "mmap_size": 268435456,        # 256MB
+}
+
+
+class ConnectionPool:
+    """스레드 인식 SQLite 연결 풀"""
+
+    def __init__(
+        self,
+        db_path: Path,
+        max_size: int = 8,
+        timeout: float = 30.0,
+        pragmas: Dict[str, object] = None
+    ):
+        """
+        Args:
+            db_path: 데이터베이스 파일 경로
+            max_size: 최대 연결 수 (동시에 연결을 빌린 스레드 수 상한)
+            timeout: 연결 대기 / 잠금 대기 시간 (초)
+            pragmas: 연결별 PRAGMA (None이면 DEFAULT_PRAGMAS)
+        """
+        self.db_path = Path(db_path)
+        self.max_size = max_size
+        self.timeout = timeout
+        self.pragmas = dict(DEFAULT_PRAGMAS if pragmas is None else pragmas)
+
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._all: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._trace_callback: Optional[Callable[[str], None]] = None
+
+        # 통계
+        self.opened = 0
+        self.closed = 0
+
+    def _create_connection(self) -> sqlite3.Connection:
+        """새 연결 생성 및 PRAGMA 적용"""
+        conn = sqlite3.connect(self.db_path, timeout=self.timeout, check_same_thread=False)
+        conn.row_factory = sqlite3.Row  # 딕셔너리 형태로 결과 반환
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+        if self._trace_callback is not None:
+            conn.set_trace_callback(self._trace_callback)
+        self.opened += 1
+        return conn
+
+    def _acquire(self) -> sqlite3.Connection:
+        """유휴 연결 대여 (없으면 생성, 상한 도달 시 대기)"""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if len(self._all) < self.max_size:
+                conn = self._create_connection()
+                self._all.append(conn)
+                return conn
+
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise TimeoutError(f"DB 연결 대기 시간 초과 ({self.timeout}초, 최대 {self.max_size}개)")
+
+    def _release(self, conn: sqlite3.Connection):
+        """연결 반환"""
+        self._idle.put(conn)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        연결 대여 컨텍스트
+
+        같은 스레드에서 중첩되면 바깥 블록의 연결을 그대로 사용하며,
+        가장 바깥 블록 종료 시 커밋 (예외 발생 시 롤백) 후 풀에 반환합니다.
+        """
+        local = self._local
+        if getattr(local, "conn", None) is not None:
+            yield local.conn
+            return
+
+        conn = self._acquire()
+        local.conn = conn
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            local.conn = None
+            self._release(conn)
+
+    def set_trace_callback(self, callback: Optional[Callable[[str], None]]):
+        """전체 연결(기존 + 이후 생성)에 SQL trace callback 설정 (None이면 해제)"""
+        with self._lock:
+            self._trace_callback = callback
+            for conn in self._all:
+                conn.set_trace_callback(callback)
+
+    def stats(self) -> Dict[str, int]:
+        """연결 통계 (누적 열림/닫힘, 현재 열린 연결/유휴 연결 수)"""
+        with self._lock:
+            return {
+                "opened": self.opened,
+                "closed": self.closed,
+                "open": len(self._all),
+                "idle": self._idle.qsize(),
+                "max_size": self.max_size,
+            }
+
+    def in_transaction(self) -> bool:
+        """현재 스레드가 연결(트랜잭션)을 사용 중인지 여부"""
+        return getattr(self._local, "conn", None) is not None
+
+    def close_all(self):
+        """유휴 연결 전체 종료 (사용 중인 연결은 반환된 뒤 다시 재사용됨)"""
+        with self._lock:
+            while True:
+                try:
+                    conn = self._idle.get_nowait()
+                except queue.Empty:
+                    break
+                conn.close()
+                self.closed += 1
+                if conn in self._all:
+                    self._all.remove(conn)
+
+
+# 프로세스 전역 풀 (DB 파일 경로별 1개)
+_pools: Dict[Path, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: Path, **kwargs) -> ConnectionPool:
+    """DB 파일 경로별 공유 연결 풀 반환 (없으면 생성)"""
+    key = Path(db_path).resolve()
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ConnectionPool(key, **kwargs)
+            _pools[key] = pool
+            logger.info(f"DB 연결 풀 생성: {key} (최대 {pool.max_size}개, WAL)")
+        return pool
+
+
+def close_all_pools():
+    """전체 연결 풀 종료 (프로세스 종료/테스트 정리용)"""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close_all()
+        _pools.clear()
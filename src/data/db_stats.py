@@ -0,0 +1,255 @@
+"""
+DatabaseManager 계측 모듈 (선택 사용)
+
+대시보드 부하 상황에서 실제 SQL 병목을 찾기 위한 계측 기능입니다.
+기본값은 비활성이며, 활성화 전에는 메서드 호출마다 플래그 확인 1회만 추가됩니다.
+
+- 메서드별 지연 시간 히스토그램 / 호출 수 / 오류 수 / 반환 행 수
+- 느린 호출 로그: 임계값(ms)을 넘은 호출의 실행 SQL과 실행 계획(EXPLAIN QUERY PLAN)
+- 연결 풀 열림/닫힘 횟수, 읽기 캐시 적중률은 DatabaseManager.stats()에서 함께 제공
+
+활성화:
+    db.enable_instrumentation(slow_query_ms=100)
+    또는 환경 변수 BOK_DB_STATS=1 (BOK_DB_SLOW_MS로 임계값 지정)
+"""
+
+import os
+import time
+import bisect
+import logging
+import functools
+import threading
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 히스토그램 구간 상한 (ms), 마지막 구간은 그 이상 전체
+HISTOGRAM_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+# 느린 호출 1건당 기록할 최대 SQL 문 수 / SQL 길이
+MAX_STATEMENTS_PER_CALL = 20
+MAX_SQL_LENGTH = 2000
+
+# 실행 계획을 조회할 SQL 문
+EXPLAINABLE_PREFIXES = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE", "REPLACE")
+
+
+def _count_rows(result) -> int:
+    """반환 값의 행 수 (DataFrame/리스트/딕셔너리 길이, WriteResult는 저장 행 수)"""
+    if result is None:
+        return 0
+    if hasattr(result, "written"):
+        return result.written
+    if hasattr(result, "values") and hasattr(result, "meeting_dates"):
+        return len(result.meeting_dates)
+    if isinstance(result, (pd.DataFrame, list, dict, tuple)):
+        return len(result)
+    return 1
+
+
+class MethodStats:
+    """메서드별 누적 통계"""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.rows = 0
+        self.buckets = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+
+    def add(self, seconds: float, rows: int, error: bool):
+        self.calls += 1
+        self.errors += int(error)
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.rows += rows
+        self.buckets[bisect.bisect_left(HISTOGRAM_BOUNDS_MS, seconds * 1000)] += 1
+
+    def percentile_ms(self, q: float) -> float:
+        """히스토그램 기반 분위수 추정 (해당 구간 상한, 마지막 구간은 최댓값)"""
+        if not self.calls:
+            return 0.0
+        target = q * self.calls
+        cumulative = 0
+        for i, count in enumerate(self.buckets):
+            cumulative += count
+            if cumulative >= target:
+                if i < len(HISTOGRAM_BOUNDS_MS):
+                    return min(float(HISTOGRAM_BOUNDS_MS[i]), self.max_seconds * 1000)
+                break
+        return self.max_seconds * 1000
+
+    def snapshot(self) -> Dict:
+        labels = [f"≤{bound}ms" for bound in HISTOGRAM_BOUNDS_MS] + [f">{HISTOGRAM_BOUNDS_MS[-1]}ms"]
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "total_ms": self.total_seconds * 1000,
+            "mean_ms": self.total_seconds * 1000 / self.calls if self.calls else 0.0,
+            "p50_ms": self.percentile_ms(0.5),
+            "p95_ms": self.percentile_ms(0.95),
+            "max_ms": self.max_seconds * 1000,
+            "rows": self.rows,
+            "histogram": dict(zip(labels, self.buckets)),
+        }
+
+
+class QueryStats:
+    """DB 파일별 계측 상태"""
+
+    def __init__(self, slow_query_ms: float = 100.0, max_slow_queries: int = 100):
+        """
+        Args:
+            slow_query_ms: 느린 호출 기준 (ms)
+            max_slow_queries: 보관할 느린 호출 로그 수 (오래된 것부터 삭제)
+        """
+        self.enabled = False
+        self.slow_query_ms = slow_query_ms
+        self.methods: Dict[str, MethodStats] = {}
+        self.slow_queries: "deque[Dict]" = deque(maxlen=max_slow_queries)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    # ------------------------------------------------------------------
+    # SQL 수집 (sqlite3 trace callback)
+    # ------------------------------------------------------------------
+
+    def trace(self, sql: str):
+        """연결의 trace callback: 측정 중인 호출이 있으면 실행 SQL 기록"""
+        statements = getattr(self._local, "statements", None)
+        if statements is not None:
+            statements.append(sql)
+
+    # ------------------------------------------------------------------
+    # 측정
+    # ------------------------------------------------------------------
+
+    def measure(self, name: str, func: Callable, explain: Callable[[str], List[str]]):
+        """
+        호출 시간 측정 및 기록
+
+        Args:
+            name: 메서드 이름
+            func: 실제 호출
+            explain: SQL 실행 계획 조회 함수 (느린 호출에만 사용)
+        """
+        outer = getattr(self._local, "statements", None)
+        statements: List[str] = []
+        self._local.statements = statements
+
+        start = time.perf_counter()
+        error = False
+        result = None
+        try:
+            result = func()
+            return result
+        except BaseException:
+            error = True
+            raise
+        finally:
+            seconds = time.perf_counter() - start
+            self._local.statements = None
+            try:
+                self._record(name, seconds, 0 if error else _count_rows(result), error, statements, explain)
+            finally:
+                if outer is not None:
+                    outer.extend(statements)
+                self._local.statements = outer
+
+    def _record(self, name, seconds, rows, error, statements, explain):
+        with self._lock:
+            method = self.methods.get(name)
+            if method is None:
+                method = self.methods[name] = MethodStats()
+            method.add(seconds, rows, error)
+
+        if seconds * 1000 < self.slow_query_ms:
+            return
+
+        entries = []
+        seen = set()
+        for sql in statements:
+            if len(entries) >= MAX_STATEMENTS_PER_CALL:
+                break
+            sql = sql.strip()
+            if sql in seen or not sql.upper().startswith(EXPLAINABLE_PREFIXES):
+                continue
+            seen.add(sql)
+            try:
+                plan = explain(sql)
+            except Exception as e:
+                plan = [f"(실행 계획 조회 실패: {e})"]
+            entries.append({"sql": sql[:MAX_SQL_LENGTH], "plan": plan})
+
+        record = {
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "method": name,
+            "duration_ms": seconds * 1000,
+            "rows": rows,
+            "error": error,
+            "statement_count": len(statements),
+            "statements": entries,
+        }
+        with self._lock:
+            self.slow_queries.append(record)
+        logger.warning(
+            f"느린 DB 호출: {name} {seconds * 1000:.1f}ms "
+            f"(SQL {len(statements)}개, 행 {rows}개)"
+        )
+
+    def snapshot(self) -> Dict:
+        """메서드별 통계 / 느린 호출 로그 스냅샷"""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "slow_query_ms": self.slow_query_ms,
+                "methods": {name: stats.snapshot() for name, stats in sorted(self.methods.items())},
+                "slow_queries": list(self.slow_queries),
+            }
+
+    def reset(self):
+        """누적 통계 / 느린 호출 로그 초기화"""
+        with self._lock:
+            self.methods.clear()
+            self.slow_queries.clear()
+
+
+def instrumented(method: Callable) -> Callable:
+    """DatabaseManager 메서드 계측 데코레이터 (계측 비활성 시 바로 호출)"""
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        stats = self.instrumentation
+        if not stats.enabled:
+            return method(self, *args, **kwargs)
+        return stats.measure(name, lambda: method(self, *args, **kwargs), self.explain_sql)
+
+    return wrapper
+
+
+# 프로세스 전역 계측 상태 (DB 파일 경로별 1개)
+_stats: Dict[Path, QueryStats] = {}
+_stats_lock = threading.Lock()
+
+
+def get_query_stats(db_path: Path) -> QueryStats:
+    """
+    DB 파일 경로별 공유 계측 상태 반환 (없으면 생성)
+
+    환경 변수 BOK_DB_STATS=1이면 생성 시 활성화 (BOK_DB_SLOW_MS: 느린 호출 기준 ms)
+    """
+    key = Path(db_path).resolve()
+    with _stats_lock:
+        stats = _stats.get(key)
+        if stats is None:
+            stats = QueryStats(slow_query_ms=float(os.getenv("BOK_DB_SLOW_MS", "100")))
+            stats.enabled = os.getenv("BOK_DB_STATS", "") not in ("", "0")
+            _stats[key] = stats
+        return stats
@@ -0,0 +1,267 @@
+"""
+단일 쓰기 스레드 모듈
+
+여러 분석가가 동시에 전문가 설정을 수정하면 Streamlit 세션 스레드마다
+SQLite에 직접 쓰면서 쓰기 잠금 경합이 생기고, 일괄 작업(모두 초기화)이
+중간에 실패하면 일부만 적용됩니다.
+
+DB 파일별로 쓰기 전용 스레드 하나를 두고 모든 쓰기를 제한 크기 큐로 보냅니다.
+- 큐에 쌓인 쓰기를 한 번에 꺼내 단일 트랜잭션으로 커밋 (배치)
+- 같은 대상(예: 같은 모델 파라미터)에 대한 대기 중 쓰기는 마지막 값만 실행 (병합)
+  (전문가 가중치는 저장마다 expert_weights 이력 행을 남기므로 병합하지 않음)
+- 제출 시 Future 반환 → 완료/오류 확인 가능 (병합된 쓰기도 최종 쓰기 결과로 완료)
+- 배치가 실패하면 작업별 트랜잭션으로 다시 실행하여 실패한 작업만 오류 처리
+- 큐가 가득 차면 제출이 대기하고, 시간 초과 시 TimeoutError
+"""
+
+import queue
+import logging
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Hashable, List, Optional
+
+from src.data.database import DatabaseManager, get_database_manager
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WriteOp:
+    """대기 중인 쓰기 작업"""
+    func: Callable
+    args: tuple
+    kwargs: dict
+    key: Optional[Hashable]                                 # 병합 키 (None이면 병합하지 않음)
+    futures: List[Future] = field(default_factory=list)
+
+    def run(self):
+        return self.func(*self.args, **self.kwargs)
+
+
+# 쓰기 스레드 종료 신호
+_STOP = object()
+
+
+class DatabaseWriter:
+    """DB 파일별 단일 쓰기 스레드"""
+
+    def __init__(
+        self,
+        db: DatabaseManager,
+        max_pending: int = 1000,
+        batch_size: int = 200,
+        linger: float = 0.005,
+        submit_timeout: float = 30.0
+    ):
+        """
+        Args:
+            db: 쓰기 대상 DatabaseManager
+            max_pending: 큐 최대 크기 (가득 차면 제출 대기)
+            batch_size: 한 트랜잭션에 묶을 최대 작업 수
+            linger: 첫 작업을 꺼낸 뒤 추가 작업을 기다리는 시간 (초)
+            submit_timeout: 큐가 가득 찼을 때 제출 대기 시간 (초)
+        """
+        self.db = db
+        self.batch_size = batch_size
+        self.linger = linger
+        self.submit_timeout = submit_timeout
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        self._closed = False
+
+        # 통계
+        self.submitted = 0
+        self.coalesced = 0
+        self.executed = 0
+        self.failed = 0
+        self.batches = 0
+
+        self._thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+        self._thread.start()
+
+    # ------------------------------------------------------------------
+    # 제출
+    # ------------------------------------------------------------------
+
+    def submit(self, func: Callable, *args, key: Optional[Hashable] = None, **kwargs) -> Future:
+        """
+        쓰기 작업 제출
+
+        Args:
+            func: 쓰기 스레드에서 실행할 함수 (보통 DatabaseManager 메서드)
+            key: 병합 키. 같은 키의 대기 중 작업은 마지막 작업만 실행
+            *args, **kwargs: func 인자
+
+        Returns:
+            Future (func 반환 값 또는 예외)
+        """
+        if self._closed:
+            raise RuntimeError("DB 쓰기 스레드가 종료되었습니다")
+
+        future: Future = Future()
+        op = WriteOp(func, args, kwargs, key, [future])
+        try:
+            self._queue.put(op, timeout=self.submit_timeout)
+        except queue.Full:
+            raise TimeoutError(f"DB 쓰기 큐 대기 시간 초과 ({self.submit_timeout}초, 최대 {self._queue.maxsize}개)")
+
+        with self._lock:
+            self.submitted += 1
+        return future
+
+    def save_expert_weight(
+        self,
+        keyword: str,
+        adjusted_weight: float,
+        reason: str = "",
+        expert_name: str = "User"
+    ) -> Future:
+        """
+        전문가 가중치 저장
+
+        저장마다 expert_weights에 감사 이력이 남아야 하므로 병합하지 않습니다
+        (같은 배치 안에서 제출 순서대로 모두 실행, 최종 활성 가중치는 마지막 값).
+        """
+        return self.submit(self.db.save_expert_weight, keyword, adjusted_weight, reason, expert_name)
+
+    def save_model_parameter(self, name: str, value: float, description: str = "") -> Future:
+        """모델 파라미터 저장 (같은 파라미터의 대기 중 저장은 마지막 값으로 병합)"""
+        return self.submit(
+            self.db.save_model_parameter, name, value, description,
+            key=("model_parameter", name)
+        )
+
+    def flush(self, timeout: Optional[float] = None):
+        """지금까지 제출한 쓰기가 모두 커밋될 때까지 대기"""
+        self.submit(lambda: None).result(timeout=timeout)
+
+    def close(self, timeout: Optional[float] = None):
+        """남은 쓰기를 처리한 뒤 쓰기 스레드 종료"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    # ------------------------------------------------------------------
+    # 쓰기 스레드
+    # ------------------------------------------------------------------
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            stop = item is _STOP
+            batch: List[WriteOp] = [] if stop else [item]
+
+            # 잠시 기다리며 함께 커밋할 작업 수집
+            while not stop and len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get(timeout=self.linger)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+
+            if batch:
+                self._execute(self._coalesce(batch))
+            if stop:
+                break
+
+    def _coalesce(self, batch: List[WriteOp]) -> List[WriteOp]:
+        """같은 병합 키의 작업은 마지막 작업만 남김 (앞선 작업의 Future는 마지막 작업에 연결)"""
+        last_index: Dict[Hashable, int] = {}
+        for i, op in enumerate(batch):
+            if op.key is not None:
+                last_index[op.key] = i
+
+        ops = []
+        for i, op in enumerate(batch):
+            if op.key is not None and last_index[op.key] != i:
+                batch[last_index[op.key]].futures.extend(op.futures)
+                with self._lock:
+                    self.coalesced += 1
+                continue
+            ops.append(op)
+        return ops
+
+    def _execute(self, ops: List[WriteOp]):
+        """작업 목록을 단일 트랜잭션으로 실행 (실패 시 작업별 재실행)"""
+        # 모든 Future가 취소된 작업은 실행하지 않음
+        for op in ops:
+            op.futures = [future for future in op.futures if future.set_running_or_notify_cancel()]
+        ops = [op for op in ops if op.futures]
+        if not ops:
+            return
+
+        try:
+            with self.db.transaction():
+                results = [op.run() for op in ops]
+        except Exception as e:
+            logger.warning(f"DB 쓰기 배치 실패, 작업별로 재실행: {e}")
+            for op in ops:
+                self._execute_one(op)
+            return
+
+        with self._lock:
+            self.batches += 1
+            self.executed += len(ops)
+        for op, result in zip(ops, results):
+            for future in op.futures:
+                future.set_result(result)
+
+    def _execute_one(self, op: WriteOp):
+        try:
+            with self.db.transaction():
+                result = op.run()
+        except Exception as e:
+            logger.error(f"DB 쓰기 실패: {e}")
+            with self._lock:
+                self.failed += 1
+            for future in op.futures:
+                future.set_exception(e)
+            return
+
+        with self._lock:
+            self.batches += 1
+            self.executed += 1
+        for future in op.futures:
+            future.set_result(result)
+
+    def stats(self) -> Dict[str, int]:
+        """쓰기 스레드 통계"""
+        with self._lock:
+            return {
+                "pending": self._queue.qsize(),
+                "submitted": self.submitted,
+                "coalesced": self.coalesced,
+                "executed": self.executed,
+                "failed": self.failed,
+                "batches": self.batches,
+            }
+
+
+# 프로세스 공유 쓰기 스레드 (DB 파일 경로별 1개)
+_writers: Dict[Path, DatabaseWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_database_writer(db_path: Optional[Path] = None) -> DatabaseWriter:
+    """
+    DB 파일별 공유 쓰기 스레드 반환 (없으면 생성)
+
+    Args:
+        db_path: 데이터베이스 파일 경로 (None이면 기본 경로 사용)
+    """
+    db = get_database_manager(db_path)
+    key = db.pool.db_path
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None:
+            writer = DatabaseWriter(db)
+            _writers[key] = writer
+        return writer
@@ -0,0 +1,489 @@
+"""
+압축 의사록 문서 저장소
+
+documents 테이블에 의사록 원문과 정제 텍스트를 압축 BLOB으로 저장하고,
+토의 내용 / 의결 문구 섹션은 정제 텍스트 기준 오프셋으로 함께 저장합니다.
+분석 시 data/texts/*.txt를 다시 읽고 섹션을 다시 나누는 대신
+DB에서 섹션이 나뉜 텍스트를 바로 가져올 수 있습니다.
+
+- 키: 회의 날짜 (UNIQUE) + 원문 내용 해시 (sha256) → 내용이 같으면 재수집 생략
+- 압축: zstandard가 있으면 zstd, 없으면 zlib (행별 codec 컬럼에 기록)
+- 지연 해제: 텍스트는 처음 접근할 때 압축 해제 (메타데이터만 조회하면 해제 비용 없음)
+- 섹션 분리 규칙이 바뀌면(sections_version 불일치) 재수집 시 다시 분리
+- 수집 시 섹션 텍스트를 전문 검색 인덱스(documents_fts)에 함께 반영
+
+사용법:
+    python -m src.data.document_store [텍스트 디렉토리] [--force]
+"""
+
+import sys
+import zlib
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# 프로젝트 루트를 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.data.database import DatabaseManager, get_database_manager
+from src.data.search_index import SEARCH_INDEX_VERSION, SECTIONS as SEARCH_SECTIONS, index_text
+from src.nlp.preprocessor import TextPreprocessor, ProcessedMinutes
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+TEXTS_DIR = PROJECT_ROOT / "data" / "texts"
+
+# 코덱별 기본 압축 레벨
+DEFAULT_LEVELS = {"zstd": 10, "zlib": 9}
+
+DOCUMENT_COLUMNS = """
+meeting_date, content_hash, codec, sections_version,
+discussion_start, discussion_end, decision_start, decision_end,
+raw_length, stored_bytes, source_path
+"""
+
+
+def compress_text(text: str, codec: str, level: Optional[int] = None) -> bytes:
+    """텍스트 압축"""
+    data = text.encode("utf-8")
+    level = DEFAULT_LEVELS[codec] if level is None else level
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=level).compress(data)
+    if codec == "zlib":
+        return zlib.compress(data, level)
+    raise ValueError(f"지원하지 않는 압축 코덱: {codec}")
+
+
+def decompress_text(blob: bytes, codec: str) -> str:
+    """텍스트 압축 해제"""
+    if codec == "zstd":
+        if not ZSTD_AVAILABLE:
+            raise ImportError("zstd로 압축된 문서를 읽으려면 zstandard를 설치해주세요: pip install zstandard")
+        data = zstandard.ZstdDecompressor().decompress(blob)
+    elif codec == "zlib":
+        data = zlib.decompress(blob)
+    else:
+        raise ValueError(f"지원하지 않는 압축 코덱: {codec}")
+    return data.decode("utf-8")
+
+
+def content_hash(text: str) -> str:
+    """원문 내용 해시"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class StoredDocument:
+    """저장된 의사록 문서 (텍스트는 접근 시 압축 해제)"""
+    meeting_date: str
+    content_hash: str
+    codec: str
+    sections_version: str
+    discussion_span: Tuple[int, int]   # 정제 텍스트 기준 토의 내용 오프셋
+    decision_span: Tuple[int, int]     # 정제 텍스트 기준 의결 문구 오프셋
+    raw_length: int                    # 원문 글자 수
+    stored_bytes: int                  # 압축 BLOB 크기 합계
+    source_path: Optional[str] = None
+    raw_blob: bytes = field(default=b"", repr=False)
+    cleaned_blob: bytes = field(default=b"", repr=False)
+
+    @cached_property
+    def raw_text(self) -> str:
+        return decompress_text(self.raw_blob, self.codec)
+
+    @cached_property
+    def cleaned_text(self) -> str:
+        return decompress_text(self.cleaned_blob, self.codec)
+
+    @property
+    def discussion_section(self) -> str:
+        start, end = self.discussion_span
+        return self.cleaned_text[start:end]
+
+    @property
+    def decision_section(self) -> str:
+        start, end = self.decision_span
+        return self.cleaned_text[start:end]
+
+    def is_current(self) -> bool:
+        """현재 전처리기의 섹션 분리 규칙으로 저장되었는지 여부"""
+        return self.sections_version == TextPreprocessor.sections_version()
+
+    def to_processed_minutes(self) -> ProcessedMinutes:
+        """
+        ProcessedMinutes로 변환 (섹션까지 채움, 문장/위원 발언은 비어 있음)
+
+        ToneAnalyzer.analyze_processed_minutes에 바로 전달할 수 있습니다.
+        """
+        return ProcessedMinutes(
+            meeting_date=self.meeting_date,
+            raw_text=self.raw_text,
+            discussion_section=self.discussion_section,
+            decision_section=self.decision_section,
+            cleaned_text=self.cleaned_text
+        )
+
+
+class DocumentStore:
+    """documents 테이블 기반 압축 문서 저장소"""
+
+    def __init__(
+        self,
+        db: Optional[DatabaseManager] = None,
+        codec: Optional[str] = None,
+        level: Optional[int] = None,
+        preprocessor: Optional[TextPreprocessor] = None
+    ):
+        """
+        Args:
+            db: DatabaseManager (None이면 프로세스 공유 매니저)
+            codec: "zstd" 또는 "zlib" (None이면 zstandard 설치 여부로 결정)
+            level: 압축 레벨 (None이면 코덱별 기본값)
+            preprocessor: 정제/섹션 분리에 사용할 전처리기 (None이면 KSS 없는 기본 전처리기)
+        """
+        self.db = db or get_database_manager()
+        self.codec = codec or ("zstd" if ZSTD_AVAILABLE else "zlib")
+        if self.codec == "zstd" and not ZSTD_AVAILABLE:
+            raise ImportError("zstd 압축을 사용하려면 zstandard를 설치해주세요: pip install zstandard")
+        self.level = level
+        self.preprocessor = preprocessor or TextPreprocessor(use_kss=False, cache_sentences=False)
+
+    # ------------------------------------------------------------------
+    # 수집
+    # ------------------------------------------------------------------
+
+    def _existing_versions(self) -> Dict[str, Tuple[str, str]]:
+        """회의 날짜별 (내용 해시, 섹션 버전)"""
+        with self.db.transaction() as conn:
+            rows = conn.execute(
+                "SELECT meeting_date, content_hash, sections_version FROM documents"
+            ).fetchall()
+        return {row["meeting_date"]: (row["content_hash"], row["sections_version"]) for row in rows}
+
+    @staticmethod
+    def _index_rows(doc_id: int, cleaned: str, spans) -> List[Tuple[int, str]]:
+        """섹션별 (FTS rowid, 색인 텍스트)"""
+        return [
+            (doc_id * len(SEARCH_SECTIONS) + i, index_text(cleaned[start:end]))
+            for i, (start, end) in enumerate(spans)
+            if end > start
+        ]
+
+    def _write(self, conn, meeting_date: str, text: str, digest: str, source_path: Optional[str]):
+        """정제/섹션 분리 후 압축하여 저장 (검색 인덱스 동기화 포함)"""
+        cleaned = self.preprocessor.clean_text(text)
+        (ds, de), (cs, ce) = self.preprocessor.section_spans(cleaned)
+        raw_blob = compress_text(text, self.codec, self.level)
+        cleaned_blob = compress_text(cleaned, self.codec, self.level)
+
+        old = conn.execute("""
+        SELECT id, codec, cleaned_blob, discussion_start, discussion_end,
+               decision_start, decision_end, search_version
+        FROM documents WHERE meeting_date = ?
+        """, (meeting_date,)).fetchone()
+
+        # 기존 색인 제거 (contentless 테이블은 색인 당시의 텍스트로 삭제)
+        indexable = True
+        if old is not None and old["search_version"] is not None:
+            if old["search_version"] == SEARCH_INDEX_VERSION:
+                old_spans = [(old["discussion_start"], old["discussion_end"]),
+                             (old["decision_start"], old["decision_end"])]
+                old_cleaned = decompress_text(old["cleaned_blob"], old["codec"])
+                conn.executemany(
+                    "INSERT INTO documents_fts (documents_fts, rowid, body) VALUES ('delete', ?, ?)",
+                    self._index_rows(old["id"], old_cleaned, old_spans)
+                )
+            else:
+                # 이전 규칙으로 색인된 문서 → ensure_search_index()에서 전체 재구축
+                indexable = False
+
+        conn.execute("""
+        INSERT INTO documents
+        (meeting_date, content_hash, codec, raw_blob, cleaned_blob,
+         discussion_start, discussion_end, decision_start, decision_end,
+         sections_version, raw_length, stored_bytes, source_path, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+        ON CONFLICT(meeting_date) DO UPDATE SET
+            content_hash = excluded.content_hash,
+            codec = excluded.codec,
+            raw_blob = excluded.raw_blob,
+            cleaned_blob = excluded.cleaned_blob,
+            discussion_start = excluded.discussion_start,
+            discussion_end = excluded.discussion_end,
+            decision_start = excluded.decision_start,
+            decision_end = excluded.decision_end,
+            sections_version = excluded.sections_version,
+            raw_length = excluded.raw_length,
+            stored_bytes = excluded.stored_bytes,
+            source_path = excluded.source_path,
+            updated_at = excluded.updated_at
+        """, (
+            meeting_date, digest, self.codec, raw_blob, cleaned_blob,
+            ds, de, cs, ce,
+            TextPreprocessor.sections_version(), len(text),
+            len(raw_blob) + len(cleaned_blob), source_path
+        ))
+
+        doc_id = old["id"] if old is not None else conn.execute(
+            "SELECT id FROM documents WHERE meeting_date = ?", (meeting_date,)
+        ).fetchone()["id"]
+
+        if indexable:
+            conn.executemany(
+                "INSERT INTO documents_fts (rowid, body) VALUES (?, ?)",
+                self._index_rows(doc_id, cleaned, [(ds, de), (cs, ce)])
+            )
+        conn.execute(
+            "UPDATE documents SET search_version = ? WHERE id = ?",
+            (SEARCH_INDEX_VERSION if indexable else None, doc_id)
+        )
+
+    def ensure_search_index(self) -> bool:
+        """
+        색인되지 않았거나 이전 규칙으로 색인된 문서가 있으면 검색 인덱스 전체 재구축
+
+        Returns:
+            재구축 여부
+        """
+        with self.db.transaction() as conn:
+            stale = conn.execute("""
+            SELECT COUNT(*) FROM documents
+            WHERE content_hash IS NOT NULL AND (search_version IS NULL OR search_version != ?)
+            """, (SEARCH_INDEX_VERSION,)).fetchone()[0]
+        if stale:
+            self.rebuild_search_index()
+        return bool(stale)
+
+    def rebuild_search_index(self) -> int:
+        """
+        저장된 전체 문서로 검색 인덱스 재구축
+
+        Returns:
+            색인된 문서 수
+        """
+        with self.db.transaction() as conn:
+            conn.execute("INSERT INTO documents_fts (documents_fts) VALUES ('delete-all')")
+            rows = conn.execute("""
+            SELECT id, codec, cleaned_blob, discussion_start, discussion_end, decision_start, decision_end
+            FROM documents WHERE content_hash IS NOT NULL
+            """).fetchall()
+            for row in rows:
+                spans = [(row["discussion_start"], row["discussion_end"]),
+                         (row["decision_start"], row["decision_end"])]
+                conn.executemany(
+                    "INSERT INTO documents_fts (rowid, body) VALUES (?, ?)",
+                    self._index_rows(row["id"], decompress_text(row["cleaned_blob"], row["codec"]), spans)
+                )
+            conn.execute(
+                "UPDATE documents SET search_version = ? WHERE content_hash IS NOT NULL",
+                (SEARCH_INDEX_VERSION,)
+            )
+
+        logger.info(f"검색 인덱스 재구축: {len(rows)}개 문서")
+        return len(rows)
+
+    def ingest_text(
+        self,
+        meeting_date: str,
+        text: str,
+        source_path: Optional[str] = None,
+        force: bool = False
+    ) -> str:
+        """
+        의사록 텍스트 1건 저장
+
+        Args:
+            meeting_date: 회의 날짜 (YYYY_MM_DD)
+            text: 원문 텍스트
+            source_path: 원본 파일 경로 (기록용)
+            force: 내용이 같아도 다시 저장
+
+        Returns:
+            "inserted" / "updated" / "unchanged"
+        """
+        digest = content_hash(text)
+        version = TextPreprocessor.sections_version()
+
+        with self.db.transaction() as conn:
+            row = conn.execute(
+                "SELECT content_hash, sections_version FROM documents WHERE meeting_date = ?",
+                (meeting_date,)
+            ).fetchone()
+            if row and not force and (row["content_hash"], row["sections_version"]) == (digest, version):
+                return "unchanged"
+            self._write(conn, meeting_date, text, digest, source_path)
+
+        self.ensure_search_index()
+        return "updated" if row else "inserted"
+
+    def ingest_directory(self, dir_path: Path = TEXTS_DIR, force: bool = False) -> Dict[str, int]:
+        """
+        디렉토리 내 의사록 텍스트 일괄 저장 (단일 트랜잭션)
+
+        내용 해시와 섹션 버전이 같은 문서는 정제/압축 없이 건너뜁니다.
+
+        Args:
+            dir_path: 텍스트 파일 디렉토리 (minutes_YYYY_MM_DD.txt)
+            force: 전체 문서 다시 저장
+
+        Returns:
+            {"inserted": n, "updated": n, "unchanged": n, "failed": n}
+        """
+        counts = {"inserted": 0, "updated": 0, "unchanged": 0, "failed": 0}
+        existing = self._existing_versions()
+        version = TextPreprocessor.sections_version()
+
+        with self.db.transaction() as conn:
+            for filepath in sorted(Path(dir_path).glob("*.txt")):
+                meeting_date = filepath.stem.replace("minutes_", "")
+                try:
+                    text = filepath.read_text(encoding="utf-8")
+                except (OSError, UnicodeDecodeError) as e:
+                    logger.error(f"문서 읽기 실패 [{filepath}]: {e}")
+                    counts["failed"] += 1
+                    continue
+
+                digest = content_hash(text)
+                previous = existing.get(meeting_date)
+                if previous is not None and not force and previous == (digest, version):
+                    counts["unchanged"] += 1
+                    continue
+
+                self._write(conn, meeting_date, text, digest, str(filepath))
+                counts["updated" if previous is not None else "inserted"] += 1
+
+        self.ensure_search_index()
+
+        logger.info(
+            f"문서 저장소 수집: 신규 {counts['inserted']}개, 갱신 {counts['updated']}개, "
+            f"유지 {counts['unchanged']}개, 실패 {counts['failed']}개"
+        )
+        return counts
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _to_document(row) -> StoredDocument:
+        return StoredDocument(
+            meeting_date=row["meeting_date"],
+            content_hash=row["content_hash"],
+            codec=row["codec"],
+            sections_version=row["sections_version"],
+            discussion_span=(row["discussion_start"], row["discussion_end"]),
+            decision_span=(row["decision_start"], row["decision_end"]),
+            raw_length=row["raw_length"],
+            stored_bytes=row["stored_bytes"],
+            source_path=row["source_path"],
+            raw_blob=row["raw_blob"],
+            cleaned_blob=row["cleaned_blob"]
+        )
+
+    def get(self, meeting_date: str) -> Optional[StoredDocument]:
+        """회의 날짜로 문서 조회 (없으면 None)"""
+        with self.db.transaction() as conn:
+            row = conn.execute(f"""
+            SELECT {DOCUMENT_COLUMNS}, raw_blob, cleaned_blob
+            FROM documents
+            WHERE meeting_date = ? AND content_hash IS NOT NULL
+            """, (meeting_date,)).fetchone()
+        return self._to_document(row) if row else None
+
+    def iter_documents(self, meeting_dates: Optional[List[str]] = None) -> Iterator[StoredDocument]:
+        """
+        저장된 문서 순회 (회의 날짜 순)
+
+        Args:
+            meeting_dates: 대상 회의 날짜 (None이면 전체)
+        """
+        query = f"""
+        SELECT {DOCUMENT_COLUMNS}, raw_blob, cleaned_blob
+        FROM documents
+        WHERE content_hash IS NOT NULL
+        """
+        params: List = []
+        if meeting_dates:
+            query += f" AND meeting_date IN ({', '.join('?' * len(meeting_dates))})"
+            params = list(meeting_dates)
+        query += " ORDER BY meeting_date"
+
+        with self.db.transaction() as conn:
+            rows = conn.execute(query, params).fetchall()
+
+        stale = 0
+        for row in rows:
+            document = self._to_document(row)
+            if not document.is_current():
+                stale += 1
+            yield document
+
+        if stale:
+            logger.warning(f"섹션 분리 규칙이 바뀐 문서 {stale}개: ingest_directory()로 다시 수집하세요")
+
+    def meeting_dates(self) -> List[str]:
+        """저장된 회의 날짜 목록"""
+        with self.db.transaction() as conn:
+            rows = conn.execute(
+                "SELECT meeting_date FROM documents WHERE content_hash IS NOT NULL ORDER BY meeting_date"
+            ).fetchall()
+        return [row["meeting_date"] for row in rows]
+
+    def stats(self) -> Dict[str, float]:
+        """저장소 통계 (문서 수, 원문 크기, 압축 크기)"""
+        with self.db.transaction() as conn:
+            row = conn.execute("""
+            SELECT
+                COUNT(*) AS documents,
+                COALESCE(SUM(raw_length), 0) AS raw_chars,
+                COALESCE(SUM(stored_bytes), 0) AS stored_bytes
+            FROM documents
+            WHERE content_hash IS NOT NULL
+            """).fetchone()
+        return {
+            "documents": row["documents"],
+            "raw_chars": row["raw_chars"],
+            "stored_bytes": row["stored_bytes"],
+            "codec": self.codec,
+        }
+
+
+def main():
+    """의사록 텍스트 수집 실행"""
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    force = "--force" in sys.argv[1:]
+    texts_dir = Path(args[0]) if args else TEXTS_DIR
+
+    print("=" * 70)
+    print("의사록 문서 저장소 수집")
+    print("=" * 70)
+
+    if not texts_dir.exists():
+        print(f"텍스트 디렉토리가 없습니다: {texts_dir}")
+        return
+
+    store = DocumentStore()
+    counts = store.ingest_directory(texts_dir, force=force)
+    stats = store.stats()
+
+    print(f"\n대상: {texts_dir} (코덱: {store.codec})")
+    print(f"신규 {counts['inserted']}개 / 갱신 {counts['updated']}개 / "
+          f"유지 {counts['unchanged']}개 / 실패 {counts['failed']}개")
+    print(f"저장 문서 수: {stats['documents']}개")
+    print(f"원문: {stats['raw_chars']:,}자 → 압축 저장: {stats['stored_bytes']:,} bytes")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
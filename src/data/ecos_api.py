@@ -3,17 +3,38 @@
 
 ECOS API를 통해 기준금리, 시장금리, 물가지수 등 거시경제 지표를 수집합니다.
 API 키는 https://ecos.bok.or.kr/api/ 에서 발급받을 수 있습니다.
+
+응답은 data/cache/ecos에 캐시되어 유효 기간 내 재요청은 API를 호출하지 않습니다.
+(오프라인 재생: EcosAPI(cache_mode="offline") 또는 환경 변수 ECOS_CACHE_MODE=offline)
+실제 ECOS가 아닌 base_url(로컬 대체 서버 등)의 응답은 data/cache/ecos-<URL 해시>에
+따로 저장되어 실제 응답 캐시와 섞이지 않습니다.
+
+요청은 연결 재사용 세션과 API 키별 공유 토큰 버킷을 거치며, 일시적 오류(연결 실패,
+시간 초과, 429/5xx)는 지수 백오프로 재시도합니다. get_all_indicators는 지표들을
+스레드 풀에서 동시에 조회합니다.
 """
 
 import requests
 import pandas as pd
+import numpy as np
 import logging
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Callable, Iterator, Tuple
 from datetime import datetime
 from pathlib import Path
 from dataclasses import dataclass
 import json
+import hashlib
 import os
+import sys
+import time
+import random
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from requests.adapters import HTTPAdapter
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from src.data.http_cache import ResponseCache, CACHE_DIR
+from src.data.rate_limiter import TokenBucket, get_rate_limiter
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -23,6 +44,12 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 ECOS_DIR = DATA_DIR / "ecos"
 
+# 1970-01-01의 율리우스 일수 정수 (SQLite CAST(julianday(date) AS INTEGER)와 같은 기준)
+JULIAN_EPOCH_DAY = 2440587
+
+# 주기별 ECOS TIME 형식
+TIME_FORMATS = {"D": "%Y%m%d", "M": "%Y%m", "A": "%Y"}
+
 
 @dataclass
 class StatCode:
@@ -47,19 +74,112 @@ class StatCode:
     STOCK_INDEX = "802Y001"  # KOSPI
 
 
+def _time_to_day(times: List[str], period_type: str) -> np.ndarray:
+    """ECOS TIME 문자열을 율리우스 일수 정수로 변환 (분기/반기/연은 기간 시작일)"""
+    if period_type in TIME_FORMATS:
+        dates = pd.to_datetime(times, format=TIME_FORMATS[period_type])
+    elif period_type == "Q":
+        dates = pd.PeriodIndex(times, freq="Q").start_time
+    elif period_type == "S":
+        # 'YYYYS1' / 'YYYYS2' → 1월 / 7월
+        dates = pd.to_datetime([f"{t[:4]}{(int(t[-1]) - 1) * 6 + 1:02d}" for t in times], format="%Y%m")
+    else:
+        raise ValueError(f"알 수 없는 주기: {period_type}")
+    return dates.values.astype("datetime64[D]").astype(np.int64) + JULIAN_EPOCH_DAY
+
+
+def _typed_page(rows: List[Dict], period_type: str, with_item: bool) -> Dict[str, np.ndarray]:
+    """응답 행 목록을 정수 일자 / 실수 값 배열로 변환"""
+    page = {
+        "day": _time_to_day([row["TIME"] for row in rows], period_type),
+        "value": pd.to_numeric(
+            pd.Series([row.get("DATA_VALUE") for row in rows], dtype=object), errors="coerce"
+        ).to_numpy(np.float64),
+    }
+    if with_item:
+        page["item_code1"] = np.array([row.get("ITEM_CODE1", "") for row in rows], dtype=object)
+    return page
+
+
+def _series_frame(df: pd.DataFrame, column: str) -> pd.DataFrame:
+    """fetch_series 결과(day, value)를 날짜 / 지표 컬럼 DataFrame으로 변환"""
+    return pd.DataFrame({
+        "date": pd.to_datetime(df["day"].to_numpy() - JULIAN_EPOCH_DAY, unit="D"),
+        column: df["value"].to_numpy(),
+    })
+
+
 class EcosAPI:
     """한국은행 ECOS API 클라이언트"""
 
     BASE_URL = "https://ecos.bok.or.kr/api/StatisticSearch"
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        use_cache: bool = True,
+        cache_mode: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        max_workers: int = 4,
+        requests_per_second: float = 5.0,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        timeout: float = 30.0,
+        page_size: int = 10000,
+        page_workers: int = 4,
+        base_url: Optional[str] = None
+    ):
         """
         ECOS API 클라이언트 초기화
 
         Args:
             api_key: ECOS API 인증키. None이면 환경변수 ECOS_API_KEY에서 읽음
+            use_cache: 응답 디스크 캐시 사용 여부
+            cache_mode: normal / offline / refresh (None이면 환경 변수 ECOS_CACHE_MODE)
+            cache: 사용할 캐시 (None이면 data/cache/ecos)
+                   base_url이 실제 ECOS가 아니면 같은 모드/TTL로 '<디렉토리>-<URL 해시>'를 사용
+            max_workers: 동시 조회 스레드 수 (1이면 순차 조회)
+            requests_per_second: API 키별 초당 최대 요청 수 (같은 키의 인스턴스끼리 공유)
+            max_retries: 일시적 오류 시 재시도 횟수
+            backoff: 첫 재시도 대기 시간 (초, 재시도마다 2배)
+            timeout: 요청 시간 제한 (초)
+            page_size: 요청 1회당 최대 행 수 (초과분은 나누어 요청)
+            page_workers: 시계열 1개의 페이지 동시 요청 수
+            base_url: StatisticSearch 엔드포인트 (None이면 환경 변수 ECOS_BASE_URL, 없으면 실제 ECOS)
+                      로컬 대체 서버(standin_server) 사용 시 지정
         """
         self.api_key = api_key or "LZUNMUPZQ4FFUITEF1R7"
+        self.BASE_URL = (base_url or os.getenv("ECOS_BASE_URL") or self.BASE_URL).rstrip("/")
+        self.max_workers = max(1, max_workers)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.page_size = page_size
+        self.page_workers = max(1, page_workers)
+
+        # 연결 재사용 세션 (동시 조회 스레드 × 페이지 동시 요청 수만큼 연결 유지)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers * self.page_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # API 키별 공유 속도 제한
+        self.rate_limiter: TokenBucket = get_rate_limiter(
+            f"ecos:{self.BASE_URL}:{self.api_key}", rate=requests_per_second
+        )
+
+        if cache is None and use_cache:
+            cache = ResponseCache(CACHE_DIR / "ecos", mode=cache_mode)
+        if cache is not None and self.BASE_URL != EcosAPI.BASE_URL:
+            # 캐시 키에는 URL이 없으므로 대체 서버 응답은 엔드포인트별 디렉토리에 분리
+            # (키 체계는 그대로 → 녹화 응답 재생은 기존 디렉토리를 그대로 사용 가능)
+            url_hash = hashlib.sha256(self.BASE_URL.encode("utf-8")).hexdigest()[:12]
+            cache = ResponseCache(
+                cache.cache_dir.with_name(f"{cache.cache_dir.name}-{url_hash}"),
+                mode=cache.mode,
+                ttls=cache.ttls
+            )
+        self.cache = cache
 
         if not self.api_key:
             logger.warning("ECOS API 키가 설정되지 않았습니다. 환경변수 ECOS_API_KEY를 설정하거나 api_key를 전달해주세요.")
@@ -77,12 +197,13 @@ class EcosAPI:
         item_code2: str = "?",
         item_code3: str = "?",
         item_code4: str = "?",
-        count: int = 100000
+        count: int = 100000,
+        start_row: int = 1
     ) -> str:
-        """API 요청 URL 생성"""
+        """API 요청 URL 생성 (start_row부터 count행)"""
         # URL 형식: BASE_URL/API_KEY/json/kr/시작/끝/통계코드/주기/시작일/종료일/항목1/항목2/항목3/항목4
         return (
-            f"{self.BASE_URL}/{self.api_key}/json/kr/1/{count}/"
+            f"{self.BASE_URL}/{self.api_key}/json/kr/{start_row}/{start_row + count - 1}/"
             f"{stat_code}/{period_type}/{start_date}/{end_date}/"
             f"{item_code1}/{item_code2}/{item_code3}/{item_code4}"
         )
@@ -99,7 +220,7 @@ class EcosAPI:
         item_code4: str = "?",
     ) -> Optional[pd.DataFrame]:
         """
-        ECOS API에서 데이터 조회
+        ECOS API에서 데이터 조회 (page_size행 단위로 나누어 요청)
 
         Args:
             stat_code: 통계코드
@@ -108,8 +229,142 @@ class EcosAPI:
             end_date: 종료일 (기본값: 현재)
             item_code1~4: 항목 코드 (기본값: ? = 전체)
 
+        Returns:
+            DataFrame 또는 None (요청 실패 / 데이터 없음 / 일부 페이지 누락)
+        """
+        pages = self._fetch_pages(
+            stat_code, period_type, start_date, end_date,
+            (item_code1, item_code2, item_code3, item_code4),
+            convert=pd.DataFrame
+        )
+        if pages is None:
+            return None
+
+        df = pd.concat(pages, ignore_index=True) if len(pages) > 1 else pages[0]
+        logger.info(f"데이터 수신: {len(df)}건")
+
+        return df
+
+    def fetch_series(
+        self,
+        stat_code: str,
+        period_type: str = "M",
+        start_date: str = "201501",
+        end_date: Optional[str] = None,
+        item_code1: str = "?",
+        item_code2: str = "?",
+        item_code3: str = "?",
+        item_code4: str = "?",
+    ) -> Optional[pd.DataFrame]:
+        """
+        ECOS 시계열을 정수 일자 / 실수 값 컬럼으로 조회
+
+        페이지마다 응답 JSON을 바로 숫자 배열로 변환하고 버리므로, 행 수가 많아도
+        문자열 행 전체를 DataFrame으로 만드는 fetch_data보다 메모리를 적게 씁니다.
+
+        Args:
+            fetch_data와 동일
+
         Returns:
             DataFrame 또는 None
+            - day (int64): 율리우스 일수 정수 (market_indicators.indicator_day와 같은 기준,
+              기간 주기는 기간 시작일)
+            - value (float64): 값 (숫자가 아니면 NaN)
+            - item_code1 (category): item_code1이 '?'(전체)일 때만 포함
+        """
+        with_item = item_code1 == "?"
+        pages = self._fetch_pages(
+            stat_code, period_type, start_date, end_date,
+            (item_code1, item_code2, item_code3, item_code4),
+            convert=lambda rows: _typed_page(rows, period_type, with_item)
+        )
+        if pages is None:
+            return None
+
+        df = pd.DataFrame({
+            "day": np.concatenate([page["day"] for page in pages]),
+            "value": np.concatenate([page["value"] for page in pages]),
+        })
+        if with_item:
+            df["item_code1"] = pd.Categorical(np.concatenate([page["item_code1"] for page in pages]))
+        logger.info(f"데이터 수신: {len(df)}건")
+
+        return df
+
+    def _fetch_page(
+        self,
+        stat_code: str,
+        period_type: str,
+        start_date: str,
+        end_date: str,
+        item_codes: Tuple[str, ...],
+        start_row: int,
+        read_cache: bool = True
+    ) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        start_row부터 page_size행 조회
+
+        Args:
+            read_cache: False면 캐시를 읽지 않고 요청 (응답은 캐시에 저장)
+
+        Returns:
+            (응답의 StatisticSearch 항목 (list_total_count, row) 또는 None, 캐시 응답 여부)
+        """
+        url = self._build_url(
+            stat_code, period_type, start_date, end_date, *item_codes,
+            count=self.page_size, start_row=start_row
+        )
+
+        # 캐시 키 (API 키 제외)
+        params = {
+            "stat_code": stat_code,
+            "period_type": period_type,
+            "start_date": start_date,
+            "end_date": end_date,
+            "item_codes": list(item_codes),
+            "rows": [start_row, start_row + self.page_size - 1],
+        }
+
+        data, from_cache = self._get_json(url, params, read_cache)
+        if data is None:
+            return None, from_cache
+
+        # API 에러 체크
+        if "StatisticSearch" not in data:
+            error_msg = data.get("RESULT", {}).get("MESSAGE", "Unknown error")
+            if start_row == 1:
+                logger.error(f"API 에러: {error_msg}")
+            else:
+                logger.error(f"API 에러 ({start_row}행부터): {error_msg}")
+            return None, from_cache
+
+        return data["StatisticSearch"], from_cache
+
+    def _fetch_pages(
+        self,
+        stat_code: str,
+        period_type: str,
+        start_date: str,
+        end_date: Optional[str],
+        item_codes: Tuple[str, ...],
+        convert: Callable[[List[Dict]], Any],
+        refresh: bool = False
+    ) -> Optional[List[Any]]:
+        """
+        전체 행을 page_size 단위로 나누어 조회 (첫 페이지의 전체 행 수로 나머지 페이지를 동시 요청)
+
+        페이지는 각자의 키와 저장 시각으로 캐시되므로, 한 번의 조회 안에서 서로 다른 시점의
+        응답이 섞이지 않도록 합니다.
+        - 첫 페이지를 새로 요청했으면 나머지 페이지도 캐시를 읽지 않음
+        - 첫 페이지가 캐시 응답인데 나머지 중 하나라도 새로 요청되었으면(만료/없음)
+          전체를 캐시 없이 다시 조회
+
+        Args:
+            convert: 페이지 행 목록 변환 함수 (응답 JSON은 변환 후 바로 버림)
+            refresh: True면 캐시를 읽지 않고 모든 페이지 요청
+
+        Returns:
+            순서대로 변환된 페이지 리스트. 요청 실패 / 데이터 없음 / 행 수 불일치(잘림)면 None
         """
         if not self.api_key:
             logger.error("API 키가 설정되지 않았습니다.")
@@ -118,47 +373,157 @@ class EcosAPI:
         if end_date is None:
             end_date = datetime.now().strftime("%Y%m")
 
-        url = self._build_url(
-            stat_code=stat_code,
-            period_type=period_type,
-            start_date=start_date,
-            end_date=end_date,
-            item_code1=item_code1,
-            item_code2=item_code2,
-            item_code3=item_code3,
-            item_code4=item_code4
+        first, first_cached = self._fetch_page(
+            stat_code, period_type, start_date, end_date, item_codes, 1, read_cache=not refresh
         )
+        if first is None:
+            return None
 
-        try:
-            logger.info(f"ECOS API 요청: {stat_code}")
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
+        rows = first.get("row", [])
+        if not rows:
+            logger.warning(f"데이터 없음: {stat_code}")
+            return None
+
+        total = int(first.get("list_total_count", len(rows)))
+        received = len(rows)
+        pages = [convert(rows)]
+        del first, rows
+
+        starts = list(range(1 + self.page_size, total + 1, self.page_size))
+        mixed = False
+        if starts:
+            logger.info(f"분할 조회: {stat_code} {total}건 ({len(starts) + 1}페이지)")
+            rest: List[Any] = [None] * len(starts)
+            with ThreadPoolExecutor(max_workers=self.page_workers, thread_name_prefix="ecos-page") as executor:
+                futures = {
+                    executor.submit(
+                        self._fetch_page, stat_code, period_type, start_date, end_date, item_codes, start_row,
+                        first_cached
+                    ): i
+                    for i, start_row in enumerate(starts)
+                }
+                for future in as_completed(futures):
+                    page, page_cached = future.result()
+                    if page is None:
+                        for other in futures:
+                            other.cancel()
+                        logger.error(f"페이지 조회 실패로 중단: {stat_code} ({starts[futures[future]]}행부터)")
+                        return None
+                    mixed = mixed or page_cached != first_cached
+                    page_rows = page.get("row", [])
+                    received += len(page_rows)
+                    rest[futures[future]] = convert(page_rows)
+            pages.extend(rest)
+
+        # 캐시 응답과 새 응답이 섞이면 같은 시점의 결과가 아님
+        if mixed:
+            if first_cached and not refresh and not (self.cache is not None and self.cache.offline):
+                logger.info(f"캐시된 페이지 일부 만료, 전체 다시 요청: {stat_code}")
+                return self._fetch_pages(
+                    stat_code, period_type, start_date, end_date, item_codes, convert, refresh=True
+                )
+            logger.error(f"서로 다른 시점의 페이지 응답이 섞여 중단: {stat_code}")
+            return None
 
-            data = response.json()
+        # 잘림 검사: 받은 행 수가 응답의 전체 행 수와 다르면 불완전한 결과
+        if received != total:
+            logger.error(f"응답 잘림: {stat_code} 전체 {total}건 중 {received}건만 수신")
+            return None
 
-            # API 에러 체크
-            if "StatisticSearch" not in data:
-                error_msg = data.get("RESULT", {}).get("MESSAGE", "Unknown error")
-                logger.error(f"API 에러: {error_msg}")
-                return None
+        return pages
 
-            # 데이터 추출
-            rows = data["StatisticSearch"].get("row", [])
-            if not rows:
-                logger.warning(f"데이터 없음: {stat_code}")
-                return None
+    @staticmethod
+    def _is_cacheable(data: Any) -> bool:
+        """정상 응답 또는 '해당 데이터 없음'(INFO-200)만 캐시 (인증키 오류/한도 초과 등은 제외)"""
+        if not isinstance(data, dict):
+            return False
+        if "StatisticSearch" in data:
+            return True
+        return data.get("RESULT", {}).get("CODE") == "INFO-200"
 
-            df = pd.DataFrame(rows)
-            logger.info(f"데이터 수신: {len(df)}건")
+    def _get_json(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        read_cache: bool = True
+    ) -> Tuple[Optional[Any], bool]:
+        """
+        캐시를 거쳐 API 응답 JSON 조회
 
-            return df
+        Args:
+            url: 요청 URL
+            params: 캐시 키 파라미터
+            read_cache: False면 유효한 캐시가 있어도 요청 (오프라인 모드에서는 무시)
+
+        Returns:
+            (응답 JSON 또는 None (요청 실패 / 오프라인 모드 캐시 없음),
+             캐시 응답 여부 (요청 실패 시 대체한 만료 캐시 포함))
+        """
+        stat_code = params["stat_code"]
+        key = ResponseCache.make_key(**params)
+
+        if self.cache is not None and (read_cache or self.cache.offline):
+            data = self.cache.get(key, params["period_type"])
+            if data is not None:
+                logger.info(f"ECOS 캐시 사용: {stat_code}")
+                return data, True
+            if self.cache.offline:
+                logger.warning(f"오프라인 모드: 캐시된 응답 없음 ({stat_code})")
+                return None, True
+
+        try:
+            logger.info(f"ECOS API 요청: {stat_code}")
+            data = self._request(url)
 
         except requests.RequestException as e:
             logger.error(f"API 요청 실패: {e}")
-            return None
+            return (self.cache.get_stale(key) if self.cache is not None else None), True
         except json.JSONDecodeError as e:
             logger.error(f"JSON 파싱 실패: {e}")
-            return None
+            return (self.cache.get_stale(key) if self.cache is not None else None), True
+
+        if self.cache is not None and self._is_cacheable(data):
+            self.cache.put(key, data, params)
+
+        return data, False
+
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """일시적 오류 여부 (연결 실패 / 시간 초과 / 429 / 5xx / 잘린 응답)"""
+        if isinstance(error, requests.HTTPError):
+            status = error.response.status_code if error.response is not None else None
+            return status is None or status == 429 or status >= 500
+        return isinstance(error, (requests.ConnectionError, requests.Timeout, json.JSONDecodeError))
+
+    def _request(self, url: str) -> Any:
+        """
+        속도 제한 + 재시도를 거친 GET 요청
+
+        Returns:
+            응답 JSON
+
+        Raises:
+            requests.RequestException / json.JSONDecodeError: 재시도 후에도 실패한 경우
+        """
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire()
+            try:
+                response = self.session.get(url, timeout=self.timeout)
+                response.raise_for_status()
+                return response.json()
+            except (requests.RequestException, json.JSONDecodeError) as e:
+                if attempt >= self.max_retries or not self._is_retryable(e):
+                    raise
+
+                # 지수 백오프 + 지터 (서버가 Retry-After를 주면 그 이상 대기)
+                delay = self.backoff * (2 ** attempt) * random.uniform(1.0, 1.5)
+                response = getattr(e, "response", None)
+                retry_after = response.headers.get("Retry-After") if response is not None else None
+                if retry_after and retry_after.isdigit():
+                    delay = max(delay, float(retry_after))
+
+                logger.warning(f"API 요청 재시도 {attempt + 1}/{self.max_retries} ({delay:.1f}초 후): {e}")
+                time.sleep(delay)
 
     def get_base_rate(
         self,
@@ -171,7 +536,7 @@ class EcosAPI:
         Returns:
             날짜, 기준금리가 포함된 DataFrame
         """
-        df = self.fetch_data(
+        df = self.fetch_series(
             stat_code=StatCode.BASE_RATE,
             period_type="D",
             start_date=start_date,
@@ -180,10 +545,7 @@ class EcosAPI:
         )
 
         if df is not None:
-            df = df[["TIME", "DATA_VALUE"]].copy()
-            df.columns = ["date", "base_rate"]
-            df["base_rate"] = pd.to_numeric(df["base_rate"], errors="coerce")
-            df["date"] = pd.to_datetime(df["date"], format="%Y%m%d")
+            df = _series_frame(df, "base_rate")
 
         return df
 
@@ -199,7 +561,7 @@ class EcosAPI:
             날짜, 3년물 금리, 10년물 금리가 포함된 DataFrame
         """
         # 국고채 3년
-        df_3y = self.fetch_data(
+        df_3y = self.fetch_series(
             stat_code=StatCode.MARKET_RATE,
             period_type="D",
             start_date=start_date,
@@ -208,7 +570,7 @@ class EcosAPI:
         )
 
         # 국고채 10년
-        df_10y = self.fetch_data(
+        df_10y = self.fetch_series(
             stat_code=StatCode.MARKET_RATE,
             period_type="D",
             start_date=start_date,
@@ -219,16 +581,7 @@ class EcosAPI:
         if df_3y is None or df_10y is None:
             return None
 
-        df_3y = df_3y[["TIME", "DATA_VALUE"]].copy()
-        df_3y.columns = ["date", "ktb_3y"]
-
-        df_10y = df_10y[["TIME", "DATA_VALUE"]].copy()
-        df_10y.columns = ["date", "ktb_10y"]
-
-        df = pd.merge(df_3y, df_10y, on="date", how="outer")
-        df["ktb_3y"] = pd.to_numeric(df["ktb_3y"], errors="coerce")
-        df["ktb_10y"] = pd.to_numeric(df["ktb_10y"], errors="coerce")
-        df["date"] = pd.to_datetime(df["date"], format="%Y%m%d")
+        df = pd.merge(_series_frame(df_3y, "ktb_3y"), _series_frame(df_10y, "ktb_10y"), on="date", how="outer")
         df["term_spread"] = df["ktb_10y"] - df["ktb_3y"]  # 장단기 금리차
 
         return df.sort_values("date")
@@ -244,7 +597,7 @@ class EcosAPI:
         Returns:
             날짜, CPI, 전년동월비가 포함된 DataFrame
         """
-        df = self.fetch_data(
+        df = self.fetch_series(
             stat_code=StatCode.CPI,
             period_type="M",
             start_date=start_date,
@@ -253,10 +606,7 @@ class EcosAPI:
         )
 
         if df is not None:
-            df = df[["TIME", "DATA_VALUE"]].copy()
-            df.columns = ["date", "cpi"]
-            df["cpi"] = pd.to_numeric(df["cpi"], errors="coerce")
-            df["date"] = pd.to_datetime(df["date"] + "01", format="%Y%m%d")
+            df = _series_frame(df, "cpi")
             # 전년동월비 계산
             df["cpi_yoy"] = df["cpi"].pct_change(12) * 100
 
@@ -273,7 +623,7 @@ class EcosAPI:
         Returns:
             날짜, CSI가 포함된 DataFrame
         """
-        df = self.fetch_data(
+        df = self.fetch_series(
             stat_code=StatCode.CSI,
             period_type="M",
             start_date=start_date,
@@ -282,10 +632,7 @@ class EcosAPI:
         )
 
         if df is not None:
-            df = df[["TIME", "DATA_VALUE"]].copy()
-            df.columns = ["date", "csi"]
-            df["csi"] = pd.to_numeric(df["csi"], errors="coerce")
-            df["date"] = pd.to_datetime(df["date"] + "01", format="%Y%m%d")
+            df = _series_frame(df, "csi")
 
         return df
 
@@ -300,7 +647,7 @@ class EcosAPI:
         Returns:
             날짜, 환율이 포함된 DataFrame
         """
-        df = self.fetch_data(
+        df = self.fetch_series(
             stat_code=StatCode.EXCHANGE_RATE,
             period_type="D",
             start_date=start_date,
@@ -309,13 +656,55 @@ class EcosAPI:
         )
 
         if df is not None:
-            df = df[["TIME", "DATA_VALUE"]].copy()
-            df.columns = ["date", "usd_krw"]
-            df["usd_krw"] = pd.to_numeric(df["usd_krw"], errors="coerce")
-            df["date"] = pd.to_datetime(df["date"], format="%Y%m%d")
+            df = _series_frame(df, "usd_krw")
 
         return df
 
+    def _indicator_fetchers(self) -> Dict[str, Tuple[str, Callable]]:
+        """get_all_indicators 수집 대상: {이름: (로그 라벨, 조회 메서드)}"""
+        return {
+            "base_rate": ("기준금리", self.get_base_rate),
+            "ktb_rates": ("국고채 금리", self.get_ktb_rates),
+            "cpi": ("소비자물가지수", self.get_cpi),
+            "csi": ("소비자심리지수", self.get_csi),
+            "exchange_rate": ("원/달러 환율", self.get_exchange_rate),
+        }
+
+    def iter_indicators(
+        self,
+        start_date: str = "201501",
+        end_date: Optional[str] = None
+    ) -> Iterator[Tuple[str, Optional[pd.DataFrame]]]:
+        """
+        주요 경제지표를 동시에 조회하여 완료되는 순서대로 반환
+
+        Args:
+            start_date: 시작일
+            end_date: 종료일
+
+        Yields:
+            (지표 이름, DataFrame 또는 None)
+        """
+        fetchers = self._indicator_fetchers()
+
+        if self.max_workers == 1:
+            for name, (_, fetch) in fetchers.items():
+                yield name, fetch(start_date, end_date)
+            return
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ecos") as executor:
+            futures = {
+                executor.submit(fetch, start_date, end_date): name
+                for name, (_, fetch) in fetchers.items()
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    yield name, future.result()
+                except Exception as e:
+                    logger.error(f"지표 조회 실패: {name} ({e})")
+                    yield name, None
+
     def get_all_indicators(
         self,
         start_date: str = "201501",
@@ -323,7 +712,7 @@ class EcosAPI:
         save: bool = True
     ) -> Dict[str, pd.DataFrame]:
         """
-        모든 주요 경제지표 일괄 조회
+        모든 주요 경제지표 일괄 조회 (max_workers > 1이면 동시 조회)
 
         Args:
             start_date: 시작일
@@ -333,48 +722,27 @@ class EcosAPI:
         Returns:
             지표별 DataFrame 딕셔너리
         """
+        fetchers = self._indicator_fetchers()
         indicators = {}
 
         logger.info("경제지표 수집 시작...")
+        started = time.perf_counter()
 
-        # 기준금리
-        df = self.get_base_rate(start_date, end_date)
-        if df is not None:
-            indicators["base_rate"] = df
-            logger.info(f"기준금리: {len(df)}건")
-
-        # 국고채 금리
-        df = self.get_ktb_rates(start_date, end_date)
-        if df is not None:
-            indicators["ktb_rates"] = df
-            logger.info(f"국고채 금리: {len(df)}건")
-
-        # CPI
-        df = self.get_cpi(start_date, end_date)
-        if df is not None:
-            indicators["cpi"] = df
-            logger.info(f"소비자물가지수: {len(df)}건")
+        for name, df in self.iter_indicators(start_date, end_date):
+            if df is not None:
+                indicators[name] = df
+                logger.info(f"{fetchers[name][0]}: {len(df)}건")
 
-        # CSI
-        df = self.get_csi(start_date, end_date)
-        if df is not None:
-            indicators["csi"] = df
-            logger.info(f"소비자심리지수: {len(df)}건")
-
-        # 환율
-        df = self.get_exchange_rate(start_date, end_date)
-        if df is not None:
-            indicators["exchange_rate"] = df
-            logger.info(f"원/달러 환율: {len(df)}건")
+                # 저장
+                if save:
+                    filepath = ECOS_DIR / f"{name}.csv"
+                    df.to_csv(filepath, index=False, encoding="utf-8-sig")
+                    logger.info(f"저장 완료: {filepath}")
 
-        # 저장
-        if save and indicators:
-            for name, df in indicators.items():
-                filepath = ECOS_DIR / f"{name}.csv"
-                df.to_csv(filepath, index=False, encoding="utf-8-sig")
-                logger.info(f"저장 완료: {filepath}")
+        logger.info(f"경제지표 수집 완료: {len(indicators)}/{len(fetchers)}개 ({time.perf_counter() - started:.1f}초)")
 
-        return indicators
+        # 완료 순서와 관계없이 기존 순서로 반환
+        return {name: indicators[name] for name in fetchers if name in indicators}
 
 
 def main():
@@ -398,6 +766,8 @@ def main():
     print("=" * 60)
     for name, df in indicators.items():
         print(f"{name}: {len(df)}건")
+    if api.cache is not None:
+        print(f"응답 캐시: {api.cache.stats()}")
 
 
 if __name__ == "__main__":
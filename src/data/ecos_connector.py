@@ -19,7 +19,7 @@ import sys
 # 기존 ECOS API 모듈 임포트
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from src.data.ecos_api import EcosAPI, StatCode
-from src.data.database import DatabaseManager
+from src.data.database import DatabaseManager, WriteResult, get_database_manager
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -45,7 +45,7 @@ class EcosConnector:
             db_manager: 데이터베이스 매니저
         """
         self.ecos_api = EcosAPI(api_key)
-        self.db = db_manager or DatabaseManager()
+        self.db = db_manager or get_database_manager()
 
     def fetch_and_save_all_indicators(
         self,
@@ -64,43 +64,58 @@ class EcosConnector:
         # 모든 지표 수집
         indicators = self.ecos_api.get_all_indicators(start_date, end_date, save=True)
 
-        # 데이터베이스에 저장
-        for name, df in indicators.items():
-            if df.empty:
-                continue
+        # 데이터베이스에 저장 (전체 지표를 하나의 트랜잭션으로)
+        with self.db.transaction():
+            for name, df in indicators.items():
+                if df.empty:
+                    continue
 
-            # 날짜 컬럼 이름 통일
-            if 'date' not in df.columns:
-                continue
+                # 날짜 컬럼 이름 통일
+                if 'date' not in df.columns:
+                    continue
 
-            # 각 지표별로 처리
-            if name == "base_rate":
-                self._save_indicator(df, 'base_rate', 'base_rate')
+                # 각 지표별로 처리
+                if name == "base_rate":
+                    self._save_indicator(df, 'base_rate', 'base_rate')
 
-            elif name == "ktb_rates":
-                self._save_indicator(df, 'ktb_3y', 'ktb_3y')
-                self._save_indicator(df, 'ktb_10y', 'ktb_10y')
-                self._save_indicator(df, 'term_spread', 'term_spread')
+                elif name == "ktb_rates":
+                    self._save_indicator(df, 'ktb_3y', 'ktb_3y')
+                    self._save_indicator(df, 'ktb_10y', 'ktb_10y')
+                    self._save_indicator(df, 'term_spread', 'term_spread')
 
-            elif name == "cpi":
-                self._save_indicator(df, 'cpi', 'cpi')
-                if 'cpi_yoy' in df.columns:
-                    self._save_indicator(df, 'cpi_yoy', 'cpi_yoy')
+                elif name == "cpi":
+                    self._save_indicator(df, 'cpi', 'cpi')
+                    if 'cpi_yoy' in df.columns:
+                        self._save_indicator(df, 'cpi_yoy', 'cpi_yoy')
 
-            elif name == "csi":
-                self._save_indicator(df, 'csi', 'csi')
+                elif name == "csi":
+                    self._save_indicator(df, 'csi', 'csi')
 
-            elif name == "exchange_rate":
-                self._save_indicator(df, 'usd_krw', 'usd_krw')
+                elif name == "exchange_rate":
+                    self._save_indicator(df, 'usd_krw', 'usd_krw')
 
         logger.info("ECOS 지표 DB 저장 완료")
 
+    def sync_indicators(self, full: bool = False):
+        """
+        저장된 마지막 날짜 이후만 요청하는 증분 동기화 (값이 바뀐 행만 저장)
+
+        Args:
+            full: True면 전체 구간 재동기화
+
+        Returns:
+            지표별 SyncResult 리스트
+        """
+        from src.data.ecos_sync import EcosSync
+
+        return EcosSync(self.ecos_api, self.db).sync(full=full)
+
     def _save_indicator(
         self,
         df: pd.DataFrame,
         value_column: str,
         indicator_name: str
-    ):
+    ) -> Optional[WriteResult]:
         """
         개별 지표를 데이터베이스에 저장
 
@@ -108,9 +123,12 @@ class EcosConnector:
             df: DataFrame (must have 'date' column)
             value_column: 값이 있는 컬럼명
             indicator_name: 지표명
+
+        Returns:
+            WriteResult (값 컬럼이 없으면 None)
         """
         if value_column not in df.columns:
-            return
+            return None
 
         # 데이터 준비
         df_save = df[['date', value_column]].copy()
@@ -118,9 +136,10 @@ class EcosConnector:
         df_save = df_save.dropna()
 
         # DB 저장
-        self.db.save_market_data(df_save, indicator_name, source='ECOS')
+        result = self.db.save_market_data(df_save, indicator_name, source='ECOS')
 
-        logger.info(f"저장: {indicator_name} ({len(df_save)}개 레코드)")
+        logger.info(f"저장: {indicator_name} ({result.written}/{result.received}개 레코드)")
+        return result
 
     def calculate_lag_correlation(
         self,
@@ -0,0 +1,206 @@
+"""
+ECOS 지표 증분 동기화 모듈
+
+EcosConnector.fetch_and_save_all_indicators는 매번 2015년부터 현재까지 전체 이력을
+요청하고 모든 행을 다시 씁니다. 이 모듈은 지표별로 market_indicators에 저장된
+마지막 날짜를 읽어 그 이후 구간만 요청합니다.
+
+- 마지막 날짜에서 overlap만큼 겹쳐 요청하여 최근 수정(revision)된 값도 반영
+- 파생 지표(CPI 전년동월비 등)는 계산에 필요한 만큼 추가로 요청 (lookback)
+- 값이 바뀐 행만 삽입/갱신 (DatabaseManager.save_market_data(only_changed=True))
+- 지표별 동기화 기록(sync_watermarks)에 요청 시작일 / 수신 / 변경 행 수 저장
+
+사용:
+    python -m src.data.ecos_sync          # 증분 동기화
+    python -m src.data.ecos_sync --full   # 2015년부터 전체 재동기화
+"""
+
+import sys
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from src.data.ecos_api import EcosAPI
+from src.data.database import DatabaseManager, get_database_manager
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+SOURCE = "ECOS"
+
+# 저장된 데이터가 없을 때 시작일 (기존 전체 수집과 동일)
+DEFAULT_START = date(2015, 1, 1)
+
+
+@dataclass(frozen=True)
+class SyncGroup:
+    """EcosAPI 조회 메서드 1개와 그 결과로 저장되는 지표들"""
+    name: str                   # get_all_indicators 결과 키
+    fetch_method: str           # EcosAPI 메서드 이름
+    period_type: str            # D: 일, M: 월
+    indicators: Tuple[str, ...] # 저장할 값 컬럼 (= 지표 이름)
+    lookback: int = 0           # 파생 지표 계산에 필요한 추가 기간 수
+
+
+# EcosConnector.fetch_and_save_all_indicators와 같은 지표 구성
+SYNC_GROUPS: Tuple[SyncGroup, ...] = (
+    SyncGroup("base_rate", "get_base_rate", "D", ("base_rate",)),
+    SyncGroup("ktb_rates", "get_ktb_rates", "D", ("ktb_3y", "ktb_10y", "term_spread")),
+    SyncGroup("cpi", "get_cpi", "M", ("cpi", "cpi_yoy"), lookback=12),
+    SyncGroup("csi", "get_csi", "M", ("csi",)),
+    SyncGroup("exchange_rate", "get_exchange_rate", "D", ("usd_krw",)),
+)
+
+
+@dataclass
+class SyncResult:
+    """지표별 동기화 결과"""
+    indicator: str
+    requested_from: str         # API 요청 시작일
+    fetched: int                # 수신 행 수
+    changed: int                # 삽입/갱신된 행 수
+    last_date: Optional[str]    # 동기화 후 마지막 저장 날짜
+
+
+def _shift_months(day: date, months: int) -> date:
+    """월 단위 이동 (해당 월 1일)"""
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+class EcosSync:
+    """ECOS 지표 증분 동기화"""
+
+    def __init__(
+        self,
+        ecos_api: Optional[EcosAPI] = None,
+        db: Optional[DatabaseManager] = None,
+        overlap_days: int = 7,
+        overlap_months: int = 2
+    ):
+        """
+        Args:
+            ecos_api: ECOS API 클라이언트
+            db: 데이터베이스 매니저
+            overlap_days: 일별 지표 재요청 기간 (수정 값 반영)
+            overlap_months: 월별 지표 재요청 기간
+        """
+        self.ecos_api = ecos_api or EcosAPI()
+        self.db = db or get_database_manager()
+        self.overlap_days = overlap_days
+        self.overlap_months = overlap_months
+
+    def _start_date(self, group: SyncGroup, latest: Dict[str, str]) -> date:
+        """
+        그룹의 요청 시작일
+
+        그룹 내 지표 중 가장 뒤처진 마지막 날짜 기준 (하나라도 없으면 전체 구간)
+        """
+        dates = [latest.get(name) for name in group.indicators]
+        if any(d is None for d in dates):
+            return DEFAULT_START
+
+        last = min(datetime.strptime(d[:10], "%Y-%m-%d").date() for d in dates)
+        if group.period_type == "D":
+            start = last - timedelta(days=self.overlap_days + group.lookback)
+        else:
+            start = _shift_months(last, -(self.overlap_months + group.lookback))
+        return max(start, DEFAULT_START)
+
+    @staticmethod
+    def _api_date(day: date, period_type: str) -> str:
+        """API 날짜 형식 (일: YYYYMMDD, 월: YYYYMM)"""
+        return day.strftime("%Y%m%d" if period_type == "D" else "%Y%m")
+
+    def sync(self, full: bool = False, groups: Optional[List[str]] = None) -> List[SyncResult]:
+        """
+        지표 동기화
+
+        Args:
+            full: True면 저장된 날짜와 관계없이 전체 구간 요청
+            groups: 동기화할 그룹 이름 (None이면 전체)
+
+        Returns:
+            지표별 SyncResult 리스트 (요청 실패 그룹은 제외)
+        """
+        latest = {} if full else self.db.get_latest_indicator_dates(source=SOURCE)
+        today = date.today()
+        results: List[SyncResult] = []
+
+        for group in SYNC_GROUPS:
+            if groups is not None and group.name not in groups:
+                continue
+
+            start = self._start_date(group, latest)
+            start_str = self._api_date(start, group.period_type)
+            end_str = self._api_date(today, group.period_type)
+
+            logger.info(f"동기화: {group.name} ({start_str} ~ {end_str})")
+            df = getattr(self.ecos_api, group.fetch_method)(start_str, end_str)
+            if df is None:
+                logger.warning(f"동기화 실패 (응답 없음): {group.name}")
+                continue
+
+            # 그룹 내 지표를 하나의 트랜잭션으로 저장
+            with self.db.transaction():
+                for indicator in group.indicators:
+                    results.append(self._save(df, indicator, start_str, latest.get(indicator)))
+
+        changed = sum(r.changed for r in results)
+        fetched = sum(r.fetched for r in results)
+        logger.info(f"동기화 완료: {len(results)}개 지표, 수신 {fetched}행, 변경 {changed}행")
+        return results
+
+    def _save(
+        self,
+        df: pd.DataFrame,
+        indicator: str,
+        requested_from: str,
+        previous_last: Optional[str] = None
+    ) -> SyncResult:
+        """지표 1개 저장 (변경된 행만) 및 동기화 기록"""
+        if indicator not in df.columns:
+            return SyncResult(indicator, requested_from, 0, 0, previous_last)
+
+        df_save = df[['date', indicator]].copy()
+        df_save.columns = ['date', 'value']
+        df_save = df_save.dropna()
+
+        result = self.db.save_market_data(df_save, indicator, source=SOURCE, only_changed=True)
+
+        last_date = previous_last
+        if not df_save.empty:
+            fetched_last = df_save['date'].max().strftime('%Y-%m-%d')
+            last_date = max(fetched_last, previous_last[:10]) if previous_last else fetched_last
+        self.db.save_sync_watermark(
+            indicator,
+            SOURCE,
+            last_date,
+            requested_from=requested_from,
+            rows_fetched=len(df_save),
+            rows_changed=result.written
+        )
+        return SyncResult(indicator, requested_from, len(df_save), result.written, last_date)
+
+
+def main():
+    """증분 동기화 실행"""
+    full = "--full" in sys.argv[1:]
+
+    syncer = EcosSync()
+    results = syncer.sync(full=full)
+
+    print("\n" + "=" * 60)
+    print("ECOS 지표 동기화 " + ("(전체)" if full else "(증분)"))
+    print("=" * 60)
+    for r in results:
+        print(f"{r.indicator:<12} 요청 {r.requested_from}~  수신 {r.fetched:>5}행  변경 {r.changed:>5}행  마지막 {r.last_date}")
+
+
+if __name__ == "__main__":
+    main()
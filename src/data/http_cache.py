@@ -0,0 +1,220 @@
+"""
+HTTP 응답 디스크 캐시 모듈
+
+ECOS API는 일일 호출 한도가 있는데, 지표 갱신이나 CI 실행마다 같은 통계를
+2015년부터 전부 다시 내려받고 있었습니다. 요청 파라미터로 만든 키의 해시를
+파일 이름으로 하는 JSON 응답 캐시를 두어 중복 호출을 없앱니다.
+
+- 키: (통계코드, 주기, 시작일, 종료일, 항목코드...) — API 키는 포함하지 않음
+- 주기별 TTL: 일별 자료는 짧게, 연간 자료는 길게
+- 캐시 모드
+    normal  : 유효한 캐시는 그대로 사용, 만료/없음이면 요청 (요청 실패 시 만료 캐시로 대체)
+    offline : 네트워크 없이 캐시만 사용 (만료 여부 무시, 없으면 None)
+    refresh : 캐시를 읽지 않고 항상 요청 후 저장
+- 환경 변수 ECOS_CACHE_MODE로 기본 모드 지정 (예: CI에서 offline)
+"""
+
+import os
+import gzip
+import json
+import time
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# 프로젝트 루트 디렉토리
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+CACHE_DIR = PROJECT_ROOT / "data" / "cache"
+
+CACHE_MODES = ("normal", "offline", "refresh")
+
+# 주기별 캐시 유효 시간 (초)
+DEFAULT_TTLS = {
+    "D": 6 * 3600,          # 일: 6시간
+    "M": 24 * 3600,         # 월: 1일
+    "Q": 7 * 24 * 3600,     # 분기: 7일
+    "A": 30 * 24 * 3600,    # 연: 30일
+}
+DEFAULT_TTL = 24 * 3600
+
+# 캐시 파일 형식 버전 (형식이 바뀌면 증가 → 기존 파일은 캐시 없음으로 처리)
+CACHE_FORMAT_VERSION = 1
+
+
+class ResponseCache:
+    """요청 키 해시 기반 JSON 응답 디스크 캐시"""
+
+    def __init__(
+        self,
+        cache_dir: Path = CACHE_DIR / "ecos",
+        mode: Optional[str] = None,
+        ttls: Optional[Dict[str, float]] = None
+    ):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리
+            mode: normal / offline / refresh (None이면 환경 변수 ECOS_CACHE_MODE, 기본 normal)
+            ttls: 주기별 유효 시간 (초), 지정한 주기만 기본값을 덮어씀
+        """
+        mode = mode or os.getenv("ECOS_CACHE_MODE", "normal")
+        if mode not in CACHE_MODES:
+            raise ValueError(f"알 수 없는 캐시 모드: {mode} (가능: {', '.join(CACHE_MODES)})")
+
+        self.cache_dir = Path(cache_dir)
+        self.mode = mode
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.stores = 0
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def offline(self) -> bool:
+        return self.mode == "offline"
+
+    # ------------------------------------------------------------------
+    # 키 / 경로
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def make_key(**params) -> str:
+        """요청 파라미터로 캐시 키 생성 (순서 무관, SHA-256)"""
+        canonical = json.dumps(params, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        # 파일 수가 많아져도 디렉토리 하나가 커지지 않도록 앞 2글자로 분산
+        return self.cache_dir / key[:2] / f"{key}.json.gz"
+
+    def ttl_for(self, period_type: str) -> float:
+        return self.ttls.get(period_type, DEFAULT_TTL)
+
+    # ------------------------------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------------------------------
+
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, EOFError, json.JSONDecodeError) as e:
+            logger.warning(f"손상된 캐시 파일 무시: {path.name} ({e})")
+            return None
+        if entry.get("version") != CACHE_FORMAT_VERSION:
+            return None
+        return entry
+
+    def get(self, key: str, period_type: str) -> Optional[Any]:
+        """
+        유효한 캐시 응답 반환 (없거나 만료되면 None)
+
+        offline 모드에서는 만료 여부와 관계없이 반환, refresh 모드에서는 항상 None
+        """
+        if self.mode == "refresh":
+            return None
+
+        entry = self._read(key)
+        if entry is None:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        age = time.time() - entry["fetched_at"]
+        if not self.offline and age > self.ttl_for(period_type):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return entry["payload"]
+
+    def get_stale(self, key: str) -> Optional[Any]:
+        """만료 여부와 관계없이 캐시 응답 반환 (요청 실패 시 대체용)"""
+        entry = self._read(key)
+        if entry is None:
+            return None
+        with self._lock:
+            self.stale_hits += 1
+        logger.warning(f"요청 실패로 만료된 캐시 사용 ({(time.time() - entry['fetched_at']) / 3600:.1f}시간 전 응답)")
+        return entry["payload"]
+
+    def put(self, key: str, payload: Any, params: Optional[Dict[str, Any]] = None):
+        """
+        응답 저장 (임시 파일에 쓴 뒤 교체하여 동시 실행 중에도 손상되지 않음)
+
+        Args:
+            key: make_key() 결과
+            payload: JSON 직렬화 가능한 응답
+            params: 키를 만든 요청 파라미터 (디버깅용으로 함께 저장)
+        """
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "version": CACHE_FORMAT_VERSION,
+            "fetched_at": time.time(),
+            "params": params or {},
+            "payload": payload,
+        }
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self.stores += 1
+
+    # ------------------------------------------------------------------
+    # 관리
+    # ------------------------------------------------------------------
+
+    def purge_expired(self, max_age: Optional[float] = None) -> int:
+        """
+        만료된 캐시 파일 삭제
+
+        Args:
+            max_age: 이보다 오래된 파일 삭제 (초). None이면 가장 긴 주기별 TTL
+
+        Returns:
+            삭제된 파일 수
+        """
+        max_age = max_age if max_age is not None else max(self.ttls.values())
+        cutoff = time.time() - max_age
+        removed = 0
+        for path in self.cache_dir.glob("*/*.json.gz"):
+            if path.stat().st_mtime < cutoff:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def clear(self) -> int:
+        """캐시 파일 전체 삭제"""
+        removed = 0
+        for path in self.cache_dir.glob("*/*.json.gz"):
+            path.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "mode": self.mode,
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,189 @@
+"""
+읽기 쿼리 결과 캐시 모듈
+
+대시보드는 재실행(rerender)마다 같은 인자로 모델 파라미터, 키워드 목록,
+경제 전망, 전문가 주석을 다시 조회합니다. 조회 결과를 프로세스 메모리에
+(메서드, 인자) 키로 보관하고, 테이블별 세대(generation) 번호로 무효화합니다.
+
+- 쓰기 메서드는 커밋 후 관련 테이블의 세대를 올림 → 다음 조회부터 새 데이터
+- 항목은 로드 직전의 세대 스냅샷과 함께 저장 → 동시 쓰기와 경합해도 이전 데이터가 새 세대로 저장되지 않음
+- 크기 제한 LRU 방출, 적중/실패 카운터
+- 반환 값은 복사본 (호출 측 수정이 캐시에 반영되지 않음)
+- 다른 프로세스의 쓰기 감지: 조회마다 DB 파일과 WAL 파일의 (수정 시각, 크기)를
+  확인하여 바뀌었으면 전체 항목을 버림 (예: 대시보드 실행 중 수집 스크립트가 갱신)
+
+같은 DB 파일을 쓰는 DatabaseManager 인스턴스끼리는 캐시를 공유합니다.
+이 프로세스의 쓰기는 커밋 후 bump()에서 파일 상태를 다시 기록하므로 테이블별 세대로만
+무효화되고, 전체 비우기는 다른 프로세스의 쓰기에만 일어납니다.
+(마지막 조회 이후 ~ 이 프로세스의 커밋 사이에 들어온 다른 프로세스의 쓰기는 놓칠 수 있음)
+"""
+
+import os
+import copy
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def _copy_value(value):
+    """캐시 값 복사 (DataFrame은 DataFrame.copy, 나머지는 deepcopy)"""
+    if isinstance(value, pd.DataFrame):
+        return value.copy()
+    return copy.deepcopy(value)
+
+
+class QueryCache:
+    """테이블 세대 기반 무효화를 지원하는 LRU 쿼리 캐시"""
+
+    def __init__(self, max_entries: int = 256, db_path: Optional[Path] = None):
+        """
+        Args:
+            max_entries: 최대 항목 수 (초과 시 가장 오래 사용하지 않은 항목부터 방출)
+            db_path: 변경을 감시할 SQLite DB 파일 (None이면 다른 프로세스의 쓰기를 감지하지 않음)
+        """
+        self.max_entries = max_entries
+        self.enabled = True
+
+        self._entries: "OrderedDict[Hashable, Tuple[Tuple[int, ...], object]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        # 외부 변경 감지용 파일 (DB 본체 + WAL)과 마지막으로 확인한 상태
+        self._watch_paths: Tuple[str, ...] = ()
+        if db_path is not None:
+            self._watch_paths = (str(db_path), f"{db_path}-wal")
+        self._file_state = self._read_file_state()
+        self._epoch = 0
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.external_flushes = 0
+
+    def _read_file_state(self) -> Tuple[Tuple[int, int], ...]:
+        """감시 파일별 (수정 시각 ns, 크기), 파일이 없으면 (0, 0)"""
+        state = []
+        for path in self._watch_paths:
+            try:
+                st = os.stat(path)
+                state.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                state.append((0, 0))
+        return tuple(state)
+
+    def check_external_changes(self) -> bool:
+        """
+        DB/WAL 파일이 마지막 확인 이후 바뀌었으면 전체 항목 무효화
+
+        Returns:
+            무효화했으면 True
+        """
+        if not self._watch_paths:
+            return False
+        state = self._read_file_state()
+        with self._lock:
+            if state == self._file_state:
+                return False
+            self._file_state = state
+            # 세대 스냅샷에 포함되는 epoch를 올려 진행 중인 로드 결과도 저장 시 무효가 되도록 함
+            self._epoch += 1
+            self._entries.clear()
+            self.external_flushes += 1
+        return True
+
+    def generation(self, tables: Iterable[str]) -> Tuple[int, ...]:
+        """테이블별 현재 세대 스냅샷 (맨 앞은 외부 변경 epoch)"""
+        with self._lock:
+            return (self._epoch,) + tuple(self._generations.get(table, 0) for table in tables)
+
+    def bump(self, *tables: str):
+        """
+        테이블 세대 증가 (해당 테이블을 읽은 캐시 항목 무효화)
+
+        커밋 후 호출되므로 현재 DB/WAL 파일 상태를 이 프로세스의 쓰기 결과로 기록하여
+        다음 조회에서 외부 변경으로 보지 않도록 합니다.
+        """
+        state = self._read_file_state()
+        with self._lock:
+            for table in tables:
+                self._generations[table] = self._generations.get(table, 0) + 1
+            self._file_state = state
+
+    def get_or_load(self, key: Hashable, tables: Tuple[str, ...], loader: Callable[[], object]):
+        """
+        캐시 조회, 없거나 무효화되었으면 loader 실행 후 저장
+
+        Args:
+            key: (메서드명, 인자...) 형태의 해시 가능한 키
+            tables: 결과가 의존하는 테이블
+            loader: 실제 조회 함수
+
+        Returns:
+            조회 결과 (복사본)
+        """
+        if not self.enabled:
+            return loader()
+
+        self.check_external_changes()
+        generation = self.generation(tables)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == generation:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return _copy_value(entry[1])
+            self.misses += 1
+
+        value = loader()
+
+        with self._lock:
+            self._entries[key] = (generation, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+        return _copy_value(value)
+
+    def clear(self):
+        """전체 항목 삭제 (세대 번호와 통계는 유지)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """캐시 통계"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "external_flushes": self.external_flushes,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+
+# 프로세스 전역 캐시 (DB 파일 경로별 1개)
+_caches: Dict[Path, QueryCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_query_cache(db_path: Path, **kwargs) -> QueryCache:
+    """DB 파일 경로별 공유 쿼리 캐시 반환 (없으면 생성)"""
+    key = Path(db_path).resolve()
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = QueryCache(db_path=key, **kwargs)
+            _caches[key] = cache
+        return cache
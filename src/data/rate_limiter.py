@@ -0,0 +1,116 @@
+"""
+요청 속도 제한 모듈 (토큰 버킷)
+
+여러 스레드가 동시에 같은 외부 API를 호출할 때 초당 요청 수를 제한합니다.
+API 키별로 프로세스 공유 버킷을 두어 클라이언트 인스턴스가 여러 개여도
+합산 호출 속도가 한도를 넘지 않습니다.
+
+    limiter = get_rate_limiter("ecos:<api_key>", rate=5, burst=5)
+    limiter.acquire()   # 토큰이 생길 때까지 대기
+"""
+
+import time
+import threading
+from typing import Dict, Optional
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷"""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        """
+        Args:
+            rate: 초당 토큰 보충 수 (= 지속 가능한 초당 요청 수)
+            burst: 버킷 크기 (연속 요청 허용 수, None이면 rate와 동일하되 최소 1)
+        """
+        if rate <= 0:
+            raise ValueError(f"rate는 0보다 커야 합니다: {rate}")
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else max(rate, 1.0))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+        # 통계
+        self.acquired = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> float:
+        """
+        토큰 획득 (부족하면 대기)
+
+        Args:
+            tokens: 필요한 토큰 수
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+
+        Returns:
+            대기한 시간 (초)
+
+        Raises:
+            TimeoutError: timeout 내에 토큰을 얻지 못한 경우
+        """
+        if tokens > self.capacity:
+            raise ValueError(f"버킷 크기({self.capacity})보다 많은 토큰 요청: {tokens}")
+
+        start = time.monotonic()
+        slept = False
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    self.acquired += 1
+                    if not slept:
+                        return 0.0
+                    waited = now - start
+                    self.waits += 1
+                    self.wait_seconds += waited
+                    return waited
+                wait = (tokens - self._tokens) / self.rate
+
+            if timeout is not None and time.monotonic() - start + wait > timeout:
+                raise TimeoutError(f"속도 제한 대기 시간 초과 ({timeout}초)")
+            # 잠금 밖에서 대기 (다른 스레드의 획득/통계 조회를 막지 않음)
+            time.sleep(wait)
+            slept = True
+
+    def stats(self) -> Dict[str, float]:
+        """버킷 통계"""
+        with self._lock:
+            self._refill(time.monotonic())
+            return {
+                "rate": self.rate,
+                "capacity": self.capacity,
+                "tokens": self._tokens,
+                "acquired": self.acquired,
+                "waits": self.waits,
+                "wait_seconds": self.wait_seconds,
+            }
+
+
+# 프로세스 공유 버킷 (이름별 1개)
+_limiters: Dict[str, TokenBucket] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(name: str, rate: float, burst: Optional[float] = None) -> TokenBucket:
+    """
+    이름별 공유 토큰 버킷 반환 (없으면 생성, 이미 있으면 기존 설정 유지)
+
+    Args:
+        name: 버킷 이름 (예: "ecos:<api_key>")
+        rate: 초당 요청 수
+        burst: 연속 요청 허용 수
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            limiter = TokenBucket(rate, burst)
+            _limiters[name] = limiter
+        return limiter
@@ -0,0 +1,122 @@
+"""
+의사록 전문 검색 인덱스 토큰화 모듈
+
+SQLite FTS5 내장 trigram 토크나이저는 3글자 미만 검색어("물가", "금리")를
+찾지 못하므로, 색인/검색 시 한글 구간을 글자 바이그램으로 펼친 뒤
+unicode61 토크나이저로 색인합니다.
+
+    "가계부채가 확대" → "가계 계부 부채 채가 가 확대 대"
+    검색어 "가계부채"  → 구문 "가계 계부 부채"
+
+- 영문/숫자 구간은 단어 단위 그대로 색인 (대소문자 무시)
+- 1글자 한글 검색어는 해당 글자로 시작하는 토큰 접두사 검색
+  (구간 마지막 글자는 뒤따르는 바이그램이 없으므로 1글자 토큰으로도 색인)
+- 색인 테이블은 본문을 저장하지 않는(contentless) FTS5 테이블이며,
+  스니펫/오프셋은 문서 저장소의 정제 텍스트에서 계산
+"""
+
+import re
+from typing import List, Tuple
+
+# 토큰화 규칙이 바뀌면 증가 → 문서 저장소 수집 시 인덱스 재구축
+SEARCH_INDEX_VERSION = 2
+
+# 색인 대상 섹션 (FTS rowid = 문서 id * 섹션 수 + 섹션 번호)
+SECTIONS = ("discussion", "decision")
+
+HANGUL_RUN = re.compile(r'[가-힣]+')
+WORD_PATTERN = re.compile(r'[가-힣]+|[0-9A-Za-z]+')
+
+
+def _hangul_bigrams(run: str) -> List[str]:
+    if len(run) == 1:
+        return [run]
+    return [run[i:i + 2] for i in range(len(run) - 1)]
+
+
+def _hangul_index_tokens(run: str) -> List[str]:
+    """색인용 한글 토큰 (바이그램 + 마지막 글자, 1글자 검색어의 접두사 검색용)"""
+    tokens = _hangul_bigrams(run)
+    if len(run) > 1:
+        tokens.append(run[-1])
+    return tokens
+
+
+def index_text(text: str) -> str:
+    """색인용 텍스트 (한글 구간은 바이그램, 영문/숫자는 단어)"""
+    tokens: List[str] = []
+    for word in WORD_PATTERN.findall(text):
+        if HANGUL_RUN.fullmatch(word):
+            tokens.extend(_hangul_index_tokens(word))
+        else:
+            tokens.append(word.lower())
+    return " ".join(tokens)
+
+
+def query_terms(query: str) -> List[str]:
+    """검색어를 단어 목록으로 분리 (FTS 문법 문자 제거)"""
+    return WORD_PATTERN.findall(query)
+
+
+def build_match_query(terms: List[str], match_all: bool = True) -> str:
+    """
+    FTS5 MATCH 식 생성
+
+    Args:
+        terms: query_terms() 결과
+        match_all: True면 모든 단어 포함(AND), False면 하나 이상 포함(OR)
+    """
+    clauses = []
+    for term in terms:
+        if HANGUL_RUN.fullmatch(term):
+            if len(term) == 1:
+                clauses.append(f'"{term}"*')
+            else:
+                clauses.append('"' + " ".join(_hangul_bigrams(term)) + '"')
+        else:
+            clauses.append(f'"{term.lower()}"')
+    return (" AND " if match_all else " OR ").join(clauses)
+
+
+def find_term_offsets(text: str, terms: List[str]) -> List[Tuple[int, int]]:
+    """텍스트 내 검색어 출현 구간 (대소문자 무시, 시작 위치 순)"""
+    if not terms:
+        return []
+    pattern = re.compile("|".join(re.escape(term) for term in sorted(terms, key=len, reverse=True)), re.IGNORECASE)
+    return [(m.start(), m.end()) for m in pattern.finditer(text)]
+
+
+def make_snippet(
+    text: str,
+    offsets: List[Tuple[int, int]],
+    width: int = 60,
+    marker: Tuple[str, str] = ("**", "**")
+) -> str:
+    """
+    첫 출현 위치 주변 스니펫 (검색어 강조)
+
+    Args:
+        text: 원본 텍스트
+        offsets: find_term_offsets() 결과
+        width: 출현 위치 앞뒤로 포함할 글자 수
+        marker: 강조 시작/끝 문자열 (기본값: Markdown 굵게)
+    """
+    if not offsets:
+        return text[:width * 2].replace("\n", " ")
+
+    start = max(0, offsets[0][0] - width)
+    end = min(len(text), offsets[0][1] + width)
+
+    parts = ["…" if start > 0 else ""]
+    cursor = start
+    for hit_start, hit_end in offsets:
+        if hit_start < cursor:
+            continue
+        if hit_end > end:
+            break
+        parts.append(text[cursor:hit_start])
+        parts.append(f"{marker[0]}{text[hit_start:hit_end]}{marker[1]}")
+        cursor = hit_end
+    parts.append(text[cursor:end])
+    parts.append("…" if end < len(text) else "")
+    return "".join(parts).replace("\n", " ")
@@ -0,0 +1,558 @@
+"""
+외부 서비스 로컬 대체(stand-in) HTTP 서버
+
+네트워크 없이 수집 파이프라인의 처리량 / 동시성 / 재시도 동작을 측정하기 위한
+로컬 서버입니다. 실제 서비스와 같은 URL 형태와 JSON/HTML 형식으로 응답합니다.
+
+- ECOS      GET  /api/StatisticSearch/{키}/json/kr/{시작행}/{끝행}/{통계코드}/{주기}/{시작일}/{종료일}/{항목1~4}
+             녹화 응답(EcosAPI 응답 캐시 디렉토리)이 있으면 그대로, 없으면 합성 시계열
+- 한국은행  GET  /portal/singl/crncyPolicyDrcMtg/listYear.do?pYear=YYYY   (의사록 목록 HTML)
+             GET  /portal/singl/newsData/listCont.do?pageIndex=&pageUnit=  (보도자료 목록 HTML)
+             GET  /portal/cmmn/file/fileDown.do?atchFileId=&fileSn=         (첨부 파일)
+- BigKinds  POST /api/news/search.do                                      (뉴스 검색 JSON)
+- FRED      GET  /fred/series/observations?series_id=&observation_start=&observation_end=
+             (IndexergoScraper의 미국 국채 금리 출처)
+
+모든 응답에 지연 시간 / 오류율(503) / 초당 요청 한도(429 + Retry-After)를 적용할 수 있습니다.
+합성 값은 (통계코드, 항목, 시점)에서 결정되므로 겹치는 구간을 다시 요청해도 같은 값입니다.
+
+사용:
+    python -m src.data.standin_server --port 8765 --latency-ms 50 --error-rate 0.05 --rate-limit 20
+    ECOS_BASE_URL=http://127.0.0.1:8765/api/StatisticSearch BOK_BASE_URL=http://127.0.0.1:8765 ...
+
+    python -m src.data.standin_server --bench   # 동시 조회 / 재시도 벤치마크
+"""
+
+import sys
+import json
+import math
+import time
+import zlib
+import random
+import logging
+import argparse
+import functools
+import threading
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from src.data.http_cache import ResponseCache
+from src.data.rate_limiter import TokenBucket
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+ECOS_PATH = "/api/StatisticSearch"
+BOK_MEETING_PATH = "/portal/singl/crncyPolicyDrcMtg/listYear.do"
+BOK_NEWS_PATH = "/portal/singl/newsData/listCont.do"
+BOK_FILE_PATH = "/portal/cmmn/file/fileDown.do"
+BIGKINDS_SEARCH_PATH = "/api/news/search.do"
+FRED_PATH = "/fred/series/observations"
+
+# ECOS 주기 코드 (합성 데이터는 D/M/Q/A만 생성, 나머지는 '데이터 없음')
+ECOS_PERIODS = ("D", "M", "Q", "S", "A", "SM")
+
+# 항목 코드가 '?'(전체)일 때 합성하는 항목 수
+WILDCARD_ITEMS = 2
+
+# 금융통화위원회 통화정책방향 결정회의 월 (연 8회)
+MEETING_MONTHS = (1, 2, 4, 5, 7, 8, 10, 11)
+
+
+@dataclass
+class StandinConfig:
+    """대체 서버 동작 설정"""
+    latency_ms: float = 0.0                 # 응답 지연 (ms)
+    jitter_ms: float = 0.0                  # 지연 변동 폭 (0 ~ jitter_ms 추가)
+    error_rate: float = 0.0                 # 503 응답 비율 (0~1)
+    rate_limit: Optional[float] = None      # 초당 요청 한도 (초과 시 429, None이면 무제한)
+    seed: Optional[int] = None              # 지연/오류 난수 시드 (재현용)
+    recordings_dir: Optional[Path] = None   # ECOS 녹화 응답 (EcosAPI 응답 캐시 디렉토리)
+
+
+@dataclass
+class StandinStats:
+    """요청 통계"""
+    requests: int = 0
+    by_route: Dict[str, int] = field(default_factory=dict)
+    by_status: Dict[int, int] = field(default_factory=dict)
+    recorded: int = 0                       # 녹화 응답으로 응답한 ECOS 요청 수
+
+
+# ----------------------------------------------------------------------
+# 합성 데이터
+# ----------------------------------------------------------------------
+
+def _noise(*parts) -> float:
+    """키에서 결정되는 [-0.5, 0.5) 난수"""
+    return zlib.crc32("|".join(map(str, parts)).encode("utf-8")) / 2 ** 32 - 0.5
+
+
+def _ecos_times(period_type: str, start: str, end: str) -> List[str]:
+    """요청 구간의 ECOS TIME 목록"""
+    if period_type == "D":
+        first = pd.Timestamp(start[:8] if len(start) >= 8 else start[:6] + "01")
+        last = pd.Timestamp(end[:8]) if len(end) >= 8 else pd.Timestamp(end[:6] + "01") + pd.offsets.MonthEnd(0)
+        return [d.strftime("%Y%m%d") for d in pd.bdate_range(first, last)]
+    if period_type == "M":
+        return [p.strftime("%Y%m") for p in pd.period_range(pd.Period(start[:6], "M"), pd.Period(end[:6], "M"))]
+    if period_type == "Q":
+        first = pd.Period(start[:4] + "Q" + (start[-1] if "Q" in start else "1"), "Q")
+        last = pd.Period(end[:4] + "Q" + (end[-1] if "Q" in end else "4"), "Q")
+        return [f"{p.year}Q{p.quarter}" for p in pd.period_range(first, last)]
+    if period_type == "A":
+        return [str(y) for y in range(int(start[:4]), int(end[:4]) + 1)]
+    return []
+
+
+def _period_start(time_key: str, period_type: str) -> date:
+    """ECOS TIME의 기간 시작일"""
+    if period_type == "D":
+        return date(int(time_key[:4]), int(time_key[4:6]), int(time_key[6:8]))
+    if period_type == "M":
+        return date(int(time_key[:4]), int(time_key[4:6]), 1)
+    if period_type == "Q":
+        return date(int(time_key[:4]), (int(time_key[-1]) - 1) * 3 + 1, 1)
+    return date(int(time_key[:4]), 1, 1)
+
+
+def _ecos_value(stat_code: str, item: str, day: date, time_key: str) -> float:
+    """합성 값 (항목별 수준 + 완만한 주기 변동 + 잡음, 시점에서 결정)"""
+    level = 1.0 + abs(_noise(stat_code, item)) * 200
+    wave = math.sin(day.toordinal() / 200.0) * level * 0.05
+    return round(level + wave + _noise(stat_code, item, time_key) * level * 0.01, 4)
+
+
+@functools.lru_cache(maxsize=64)
+def synthetic_ecos_rows(
+    stat_code: str,
+    period_type: str,
+    start_date: str,
+    end_date: str,
+    item_codes: Tuple[str, ...]
+) -> List[Dict[str, str]]:
+    """ECOS StatisticSearch 형식의 합성 행 전체 (페이지 요청마다 다시 만들지 않도록 캐시, 수정 금지)"""
+    if item_codes[0] == "?":
+        items = [f"I{i + 1:03d}" for i in range(WILDCARD_ITEMS)]
+    else:
+        items = [item_codes[0]]
+    times = _ecos_times(period_type, start_date, end_date)
+
+    rows = []
+    for item in items:
+        for time_key in times:
+            rows.append({
+                "STAT_CODE": stat_code,
+                "STAT_NAME": f"합성 통계 {stat_code}",
+                "ITEM_CODE1": item,
+                "ITEM_NAME1": f"항목 {item}",
+                "ITEM_CODE2": item_codes[1] if item_codes[1] != "?" else "",
+                "UNIT_NAME": "",
+                "TIME": time_key,
+                "DATA_VALUE": str(_ecos_value(stat_code, item, _period_start(time_key, period_type), time_key)),
+            })
+    return rows
+
+
+def _meeting_dates(year: int) -> List[date]:
+    """연도별 합성 회의 날짜 (해당 월 두 번째 목요일)"""
+    dates = []
+    for month in MEETING_MONTHS:
+        first = date(year, month, 1)
+        dates.append(first + timedelta(days=(3 - first.weekday()) % 7 + 7))
+    return dates
+
+
+def bok_meeting_html(year: int) -> str:
+    """통화정책방향 결정회의 목록 HTML (BOKMinutesCrawler.parse_policy_meeting_page 형식)"""
+    weekdays = "월화수목금토일"
+    rows = []
+    for i, day in enumerate(_meeting_dates(year), 1):
+        file_id = f"{year}{i:02d}"
+        rows.append(
+            "<tr>"
+            f"<th>{day.month:02d}월 {day.day:02d}일({weekdays[day.weekday()]})</th>"
+            f'<td><a href="{BOK_FILE_PATH}?atchFileId=D{file_id}&fileSn=1">결정문</a></td>'
+            f'<td><a href="{BOK_FILE_PATH}?atchFileId=P{file_id}&fileSn=1">기자간담회</a></td>'
+            f'<td><a href="{BOK_FILE_PATH}?atchFileId=M{file_id}&fileSn=1">HWP</a> '
+            f'<a href="{BOK_FILE_PATH}?atchFileId=M{file_id}&fileSn=2">PDF</a></td>'
+            f'<td><a href="{BOK_FILE_PATH}?atchFileId=I{file_id}&fileSn=1">이슈</a></td>'
+            "</tr>"
+        )
+    return (
+        "<html><body><table class=\"tb-type01\"><thead><tr>"
+        "<th>회의일</th><th>결정문</th><th>기자간담회</th><th>의사록</th><th>금융·경제 이슈</th>"
+        "</tr></thead><tbody>" + "".join(rows) + "</tbody></table></body></html>"
+    )
+
+
+def bok_news_html(page_index: int, page_unit: int, menu_no: str) -> str:
+    """보도자료 목록 HTML (BOKMinutesCrawler.parse_news_page 형식, 최신순)"""
+    meetings = [d for year in range(date.today().year, 2014, -1) for d in reversed(_meeting_dates(year))]
+    meetings = [d for d in meetings if d <= date.today()]
+    start = (page_index - 1) * page_unit
+
+    items = []
+    for n, day in enumerate(meetings[start:start + page_unit], start + 1):
+        published = day + timedelta(days=14)
+        items.append(
+            f'<li><a href="/portal/bbs/B0000245/view.do?nttId={100000 - n}&menuNo={menu_no}">'
+            f"금융통화위원회 의사록({day.year}년 {day.month}월 {day.day}일 개최)</a>"
+            f"<span class=\"date\">{published:%Y.%m.%d}</span></li>"
+        )
+    return "<html><body><ul class=\"bdList\">" + "".join(items) + "</ul></body></html>"
+
+
+def bigkinds_search(body: Dict) -> Dict:
+    """BigKinds 뉴스 검색 응답 (return_object.documents)"""
+    argument = body.get("argument", {})
+    query = argument.get("query", "")
+    published = argument.get("published_at", {})
+    start = pd.Timestamp(published.get("from", date.today() - timedelta(days=30)))
+    end = pd.Timestamp(published.get("until", date.today()))
+    offset = int(argument.get("return_from", 0))
+    size = int(argument.get("return_size", 10))
+
+    days = max((end - start).days + 1, 1)
+    total = days * 3
+    documents = []
+    for n in range(offset, min(offset + size, total)):
+        published_at = start + pd.Timedelta(days=n // 3, hours=9 + n % 3 * 4)
+        tone = "상승" if _noise(query, n) > 0 else "둔화"
+        documents.append({
+            "news_id": f"standin.{published_at:%Y%m%d}.{n:06d}",
+            "title": f"[{query}] 한국은행, 물가 {tone} 우려 속 통화정책 점검 ({n + 1})",
+            "content": f"한국은행 금융통화위원회는 물가 {tone} 흐름과 가계부채 추이를 점검했다.",
+            "published_at": published_at.isoformat(),
+            "provider": ("경제신문", "통신사", "방송사")[n % 3],
+            "byline": "기자",
+            "category": ["경제>금융_재테크"],
+        })
+    return {"result": 0, "return_object": {"total_hits": total, "documents": documents}}
+
+
+def fred_observations(series_id: str, start: str, end: str) -> Dict:
+    """FRED series/observations 응답 (영업일, 값은 문자열)"""
+    base = {"DGS3MO": 4.5, "DGS2": 4.0, "DGS10": 4.3, "DGS30": 4.5}.get(series_id, 3.0)
+    observations = [
+        {"date": f"{d:%Y-%m-%d}", "value": f"{base + math.sin(d.toordinal() / 60) * 0.5 + _noise(series_id, d.date()) * 0.05:.2f}"}
+        for d in pd.bdate_range(start, end)
+    ]
+    return {"series_id": series_id, "count": len(observations), "observations": observations}
+
+
+# ----------------------------------------------------------------------
+# 서버
+# ----------------------------------------------------------------------
+
+class _Handler(BaseHTTPRequestHandler):
+    """요청 처리 (StandinServer 설정을 server.standin으로 참조)"""
+
+    protocol_version = "HTTP/1.1"
+    # keep-alive 연결에서 헤더/본문 분할 전송 시 Nagle + 지연 ACK로 생기는 ~40ms 대기 방지
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def do_GET(self):
+        self.server.standin.handle(self, "GET")
+
+    def do_POST(self):
+        self.server.standin.handle(self, "POST")
+
+
+class StandinServer:
+    """ECOS / 한국은행 / BigKinds / FRED 로컬 대체 서버"""
+
+    def __init__(self, config: Optional[StandinConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        """
+        Args:
+            config: 지연 / 오류율 / 요청 한도 설정
+            host: 바인딩 주소
+            port: 포트 (0이면 빈 포트 자동 선택)
+        """
+        self.config = config or StandinConfig()
+        self.stats = StandinStats()
+        self._lock = threading.Lock()
+        self._random = random.Random(self.config.seed)
+        self._limiter = TokenBucket(self.config.rate_limit) if self.config.rate_limit else None
+        self._recordings = (
+            ResponseCache(self.config.recordings_dir, mode="offline")
+            if self.config.recordings_dir else None
+        )
+
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.standin = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def ecos_url(self) -> str:
+        """EcosAPI(base_url=...)에 전달할 주소"""
+        return self.url + ECOS_PATH
+
+    def start(self) -> "StandinServer":
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="standin-server", daemon=True)
+        self._thread.start()
+        logger.info(f"대체 서버 시작: {self.url}")
+        return self
+
+    def stop(self):
+        """서버 종료"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "StandinServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def serve_forever(self):
+        """현재 스레드에서 서버 실행 (Ctrl+C로 종료)"""
+        logger.info(f"대체 서버 실행: {self.url}")
+        try:
+            self._httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._httpd.server_close()
+
+    def snapshot(self) -> Dict:
+        """요청 통계 스냅샷"""
+        with self._lock:
+            return {
+                "requests": self.stats.requests,
+                "by_route": dict(self.stats.by_route),
+                "by_status": dict(self.stats.by_status),
+                "recorded": self.stats.recorded,
+            }
+
+    # ------------------------------------------------------------------
+    # 요청 처리
+    # ------------------------------------------------------------------
+
+    def handle(self, handler: BaseHTTPRequestHandler, method: str):
+        parsed = urlparse(handler.path)
+        route, status, content_type, body, headers = self._dispatch(handler, method, parsed)
+
+        with self._lock:
+            self.stats.requests += 1
+            self.stats.by_route[route] = self.stats.by_route.get(route, 0) + 1
+            self.stats.by_status[status] = self.stats.by_status.get(status, 0) + 1
+
+        handler.send_response(status)
+        handler.send_header("Content-Type", content_type)
+        handler.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def _dispatch(self, handler, method, parsed) -> Tuple[str, int, str, bytes, Dict[str, str]]:
+        config = self.config
+
+        # 지연
+        with self._lock:
+            delay = config.latency_ms + self._random.uniform(0, config.jitter_ms)
+            fail = self._random.random() < config.error_rate
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+        # 요청 한도 초과 → 429
+        if self._limiter is not None:
+            try:
+                self._limiter.acquire(timeout=0)
+            except TimeoutError:
+                return "rate_limited", 429, "application/json", b'{"error": "rate limited"}', {"Retry-After": "1"}
+
+        # 오류 주입 → 503
+        if fail:
+            return "error", 503, "application/json", b'{"error": "injected failure"}', {}
+
+        params = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        path = parsed.path
+
+        if path.startswith(ECOS_PATH + "/"):
+            # 전체 항목 코드 '?'가 쿼리 문자열 시작으로 해석되지 않도록 원래 경로 사용
+            return "ecos", 200, "application/json; charset=utf-8", self._ecos(handler.path), {}
+
+        if path == BOK_MEETING_PATH:
+            html = bok_meeting_html(int(params.get("pYear", date.today().year)))
+            return "bok_meetings", 200, "text/html; charset=utf-8", html.encode("utf-8"), {}
+
+        if path == BOK_NEWS_PATH:
+            html = bok_news_html(
+                int(params.get("pageIndex", 1)), int(params.get("pageUnit", 10)), params.get("menuNo", "200789")
+            )
+            return "bok_news", 200, "text/html; charset=utf-8", html.encode("utf-8"), {}
+
+        if path == BOK_FILE_PATH:
+            content = f"%PDF-1.4\n% stand-in {params.get('atchFileId', '')}/{params.get('fileSn', '')}\n%%EOF\n"
+            return "bok_file", 200, "application/octet-stream", content.encode("ascii"), {}
+
+        if path == BIGKINDS_SEARCH_PATH and method == "POST":
+            length = int(handler.headers.get("Content-Length", 0))
+            try:
+                request = json.loads(handler.rfile.read(length) or b"{}")
+            except json.JSONDecodeError:
+                return "bigkinds", 400, "application/json", b'{"result": -1, "reason": "invalid json"}', {}
+            return "bigkinds", 200, "application/json; charset=utf-8", _json(bigkinds_search(request)), {}
+
+        if path == FRED_PATH:
+            today = date.today()
+            payload = fred_observations(
+                params.get("series_id", "DGS10"),
+                params.get("observation_start", f"{today - timedelta(days=365)}"),
+                params.get("observation_end", f"{today}"),
+            )
+            return "fred", 200, "application/json; charset=utf-8", _json(payload), {}
+
+        return "not_found", 404, "text/plain; charset=utf-8", b"not found", {}
+
+    def _ecos(self, path: str) -> bytes:
+        """ECOS StatisticSearch 응답 (녹화 응답 우선, 없으면 합성)"""
+        # /api/StatisticSearch/{키}/json/kr/{시작행}/{끝행}/{통계코드}/{주기}/{시작일}/{종료일}/{항목1~4}
+        parts = path[len(ECOS_PATH) + 1:].split("/")
+        if len(parts) < 10:
+            return _ecos_error("ERROR-100", "필수 값이 누락되어 있습니다.")
+        if not (parts[3].isdigit() and parts[4].isdigit()):
+            return _ecos_error("ERROR-301", "조회건수 값의 타입이 유효하지 않습니다.")
+
+        start_row, end_row = int(parts[3]), int(parts[4])
+        if start_row < 1 or end_row < start_row:
+            return _ecos_error("ERROR-301", "조회건수 값의 타입이 유효하지 않습니다.")
+        stat_code, period_type, start_date, end_date = parts[5:9]
+        if period_type not in ECOS_PERIODS:
+            return _ecos_error("ERROR-101", f"주기 값이 유효하지 않습니다: {period_type}")
+        item_codes = [code or "?" for code in (parts[9:13] + ["?"] * 4)[:4]]
+
+        if self._recordings is not None:
+            key = ResponseCache.make_key(
+                stat_code=stat_code,
+                period_type=period_type,
+                start_date=start_date,
+                end_date=end_date,
+                item_codes=item_codes,
+                rows=[start_row, end_row],
+            )
+            payload = self._recordings.get(key, period_type)
+            if payload is not None:
+                with self._lock:
+                    self.stats.recorded += 1
+                return _json(payload)
+
+        try:
+            rows = synthetic_ecos_rows(stat_code, period_type, start_date, end_date, tuple(item_codes))
+        except (ValueError, IndexError):
+            # 주기와 맞지 않는 날짜 (예: 월 주기에 'abc', 분기 주기에 '2024Q9')
+            return _ecos_error("ERROR-101", "주기와 다른 형식의 날짜 형식입니다.")
+        if not rows:
+            return _json({"RESULT": {"CODE": "INFO-200", "MESSAGE": "해당하는 데이터가 없습니다."}})
+        return _json({
+            "StatisticSearch": {
+                "list_total_count": len(rows),
+                "row": rows[start_row - 1:end_row],
+            }
+        })
+
+
+def _json(payload) -> bytes:
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def _ecos_error(code: str, message: str) -> bytes:
+    """ECOS 오류 응답 (HTTP 200 + RESULT)"""
+    return _json({"RESULT": {"CODE": code, "MESSAGE": message}})
+
+
+# ----------------------------------------------------------------------
+# 실행
+# ----------------------------------------------------------------------
+
+def run_benchmark(config: StandinConfig, start_date: str = "20150101"):
+    """EcosAPI.get_all_indicators를 대체 서버에 대해 순차/동시 조회로 실행하여 비교"""
+    from src.data.ecos_api import EcosAPI
+
+    with StandinServer(config) as server:
+        print("=" * 70)
+        print(f"대체 서버 벤치마크: {server.url}")
+        print(f"지연 {config.latency_ms}ms(+{config.jitter_ms}) / 오류율 {config.error_rate:.0%} / "
+              f"요청 한도 {config.rate_limit or '없음'}/초")
+        print("=" * 70)
+
+        for workers in (1, 4, 8):
+            before = server.snapshot()
+            api = EcosAPI(
+                use_cache=False,
+                base_url=server.ecos_url,
+                max_workers=workers,
+                requests_per_second=config.rate_limit or 1000,
+                backoff=0.1,
+                page_size=1000,
+            )
+            started = time.perf_counter()
+            indicators = api.get_all_indicators(start_date=start_date, save=False)
+            elapsed = time.perf_counter() - started
+
+            after = server.snapshot()
+            requests_made = after["requests"] - before["requests"]
+            errors = sum(
+                count - before["by_status"].get(status, 0)
+                for status, count in after["by_status"].items() if status != 200
+            )
+            rows = sum(len(df) for df in indicators.values())
+            print(f"workers={workers}: {elapsed:6.2f}초, 요청 {requests_made}회 (오류/한도 {errors}회), "
+                  f"지표 {len(indicators)}개, {rows}행, {requests_made / elapsed:.1f} req/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ECOS / 한국은행 / BigKinds / FRED 로컬 대체 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="응답 지연 (ms)")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="지연 변동 폭 (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 응답 비율 (0~1)")
+    parser.add_argument("--rate-limit", type=float, default=None, help="초당 요청 한도 (초과 시 429)")
+    parser.add_argument("--seed", type=int, default=None, help="지연/오류 난수 시드")
+    parser.add_argument("--recordings", type=Path, default=None, help="ECOS 녹화 응답 디렉토리 (예: data/cache/ecos)")
+    parser.add_argument("--bench", action="store_true", help="EcosAPI 동시 조회 벤치마크 실행 후 종료")
+    args = parser.parse_args()
+
+    config = StandinConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        seed=args.seed,
+        recordings_dir=args.recordings,
+    )
+
+    if args.bench:
+        run_benchmark(config)
+        return
+
+    server = StandinServer(config, host=args.host, port=args.port)
+    print(f"ECOS_BASE_URL={server.ecos_url}")
+    print(f"BOK_BASE_URL={server.url}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
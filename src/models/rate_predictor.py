@@ -14,7 +14,10 @@ from dataclasses import dataclass
 from pathlib import Path
 import json
 from datetime import datetime, timedelta
+import sys
 
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from src.nlp.results_store import ToneResultStore
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -124,7 +127,11 @@ class RatePredictor:
         MODEL_DIR.mkdir(parents=True, exist_ok=True)
 
     def load_tone_data(self) -> pd.DataFrame:
-        """톤 분석 결과 로드"""
+        """톤 분석 결과 로드 (컬럼형 저장소 우선, 없으면 CSV)"""
+        store = ToneResultStore(DATA_DIR / "analysis" / "tone_index_results")
+        if store.exists():
+            return store.load()
+
         tone_path = DATA_DIR / "analysis" / "tone_index_results.csv"
 
         if not tone_path.exists():
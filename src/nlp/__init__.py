@@ -9,6 +9,9 @@
 """
 from .preprocessor import TextPreprocessor
 from .sentiment_dict import SentimentDictionary
+from .keyword_matcher import KeywordMatcher
+from .ngram_matcher import NgramMatcher
+from .sentence_cache import SentenceSpanCache
 from .tone_analyzer import ToneAnalyzer
 
-__all__ = ['TextPreprocessor', 'SentimentDictionary', 'ToneAnalyzer']
+__all__ = ['TextPreprocessor', 'SentimentDictionary', 'KeywordMatcher', 'NgramMatcher', 'SentenceSpanCache', 'ToneAnalyzer']
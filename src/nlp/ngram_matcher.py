@@ -0,0 +1,150 @@
+"""
+N-gram 감성 표현 매칭 모듈
+
+NGRAM_HAWKISH / NGRAM_DOVISH 같은 복합 표현("물가 상승 압력")을
+토큰 사이 간격(gap)을 허용하면서 한 번의 스트리밍 패스로 매칭합니다.
+
+- 토큰화: N-gram 구성 단어 전체를 KeywordMatcher로 스캔
+  ("물가상승" 같은 복합어와 "압력이" 같은 조사 결합형도 토큰으로 인식)
+- 매칭: N-gram 트라이 위에서 진행 중인 부분 매칭을 노드별로 하나씩만 유지
+  → 표현 수가 늘어나도 중첩 루프 없이 토큰 수에 비례하는 시간
+"""
+
+import re
+import json
+import hashlib
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from .keyword_matcher import KeywordMatcher
+from .sentiment_dict import KeywordHit, NGRAM_HAWKISH, NGRAM_DOVISH
+
+# N-gram 표현 기본 가중치 (단일 키워드보다 문맥이 명확하므로 높게 설정)
+DEFAULT_NGRAM_WEIGHT = 1.5
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+class NgramMatcher:
+    """간격 허용 N-gram 매처"""
+
+    def __init__(
+        self,
+        ngrams: Iterable[Tuple[Sequence[str], str, float]],
+        max_gap: int = 2
+    ):
+        """
+        N-gram 트라이 컴파일
+
+        Args:
+            ngrams: (단어 튜플, 극성, 가중치) 리스트
+            max_gap: 연속된 구성 단어 사이에 허용할 최대 어절 수
+        """
+        self.max_gap = max_gap
+
+        # 트라이: 노드별 자식 / 종결 정보 (표현 문자열, 극성, 가중치)
+        self._children: List[Dict[str, int]] = [{}]
+        self._terminal: List[List[Tuple[str, str, float]]] = [[]]
+        self._ngrams: List[Tuple[Tuple[str, ...], str, float]] = []
+        vocabulary = set()
+
+        for words, polarity, weight in ngrams:
+            self._ngrams.append((tuple(words), polarity, weight))
+            node = 0
+            for word in words:
+                vocabulary.add(word)
+                child = self._children[node].get(word)
+                if child is None:
+                    child = len(self._children)
+                    self._children[node][word] = child
+                    self._children.append({})
+                    self._terminal.append([])
+                node = child
+            self._terminal[node].append((" ".join(words), polarity, weight))
+
+        self.ngram_count = sum(len(t) for t in self._terminal)
+        self._tokenizer = KeywordMatcher(
+            ((word, word) for word in sorted(vocabulary)),
+            overlap="longest"
+        )
+
+    @classmethod
+    def from_defaults(
+        cls,
+        weight: float = DEFAULT_NGRAM_WEIGHT,
+        max_gap: int = 2
+    ) -> "NgramMatcher":
+        """sentiment_dict의 기본 N-gram 사전으로 매처 생성"""
+        ngrams = [(words, "hawkish", weight) for words in NGRAM_HAWKISH]
+        ngrams += [(words, "dovish", weight) for words in NGRAM_DOVISH]
+        return cls(ngrams, max_gap=max_gap)
+
+    def fingerprint(self) -> str:
+        """N-gram 사전 및 간격 설정 해시 (증분 분석 매니페스트용)"""
+        payload = json.dumps([self.max_gap, sorted(self._ngrams)], ensure_ascii=False).encode("utf-8")
+        return hashlib.sha1(payload).hexdigest()[:16]
+
+    def find_matches(self, text: str) -> List[KeywordHit]:
+        """
+        텍스트 내 N-gram 표현 매칭 (단일 패스)
+
+        Args:
+            text: 분석할 텍스트
+
+        Returns:
+            KeywordHit 리스트 (term은 공백으로 연결한 표현, 오프셋은 첫 단어 시작 ~ 마지막 단어 끝)
+        """
+        # 어절 경계 (공백 시작 위치) → 토큰의 어절 번호 계산용
+        word_breaks = [m.start() for m in WHITESPACE_PATTERN.finditer(text)]
+
+        children = self._children
+        terminal = self._terminal
+        max_distance = self.max_gap + 1
+
+        # 진행 중인 부분 매칭: {트라이 노드: (시작 오프셋, 마지막 토큰 어절 번호)}
+        active: Dict[int, Tuple[int, int]] = {}
+        hits = []
+
+        for start, end, word in self._tokenizer.find_all(text):
+            word_idx = bisect_right(word_breaks, start)
+
+            advanced: Dict[int, Tuple[int, int]] = {}
+
+            # 기존 부분 매칭 확장 (간격 제한을 넘은 부분 매칭은 제거)
+            for node, (ngram_start, last_idx) in list(active.items()):
+                if word_idx - last_idx > max_distance:
+                    del active[node]
+                    continue
+                child = children[node].get(word)
+                if child is not None:
+                    previous = advanced.get(child)
+                    if previous is None or previous[0] < ngram_start:
+                        advanced[child] = (ngram_start, word_idx)
+
+            # 새로운 매칭 시작
+            child = children[0].get(word)
+            if child is not None:
+                advanced[child] = (start, word_idx)
+
+            for node, state in advanced.items():
+                for term, polarity, weight in terminal[node]:
+                    hits.append(KeywordHit(term, polarity, weight, state[0], end))
+                if children[node]:
+                    active[node] = state
+
+        hits.sort(key=lambda h: (h.start, h.end))
+        return hits
+
+    def match_in_text(self, text: str) -> Dict[str, List[Tuple[str, float]]]:
+        """
+        N-gram 매칭 결과를 표현별 가중 빈도로 집계
+
+        Returns:
+            {"hawkish": [(ngram, weight), ...], "dovish": [(ngram, weight), ...]}
+        """
+        scores: Dict[str, Dict[str, float]] = {"hawkish": {}, "dovish": {}}
+        for hit in self.find_matches(text):
+            bucket = scores[hit.polarity]
+            bucket[hit.term] = bucket.get(hit.term, 0.0) + hit.weight
+
+        return {polarity: list(bucket.items()) for polarity, bucket in scores.items()}
@@ -9,15 +9,49 @@
 """
 
 import re
+import time
+import hashlib
 import logging
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+from .sentence_cache import SentenceSpanCache
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
+# 프로세스 풀 워커별 전처리기 (문장 분리 캐시 미스 처리용)
+_worker_preprocessor: Optional["TextPreprocessor"] = None
+
+
+def _init_split_worker(preprocessor: "TextPreprocessor"):
+    """프로세스 풀 워커 초기화: 전처리기 수신 (KSS는 __setstate__에서 재로드)"""
+    global _worker_preprocessor
+    _worker_preprocessor = preprocessor
+
+
+def _split_in_worker(text: str) -> Optional[List[Tuple[int, int]]]:
+    """워커에서 KSS 문장 분리 (실패 시 None)"""
+    return _worker_preprocessor._split_with_kss(text)
+
+
+@dataclass
+class MemberSpan:
+    """위원 발언 구간 (원문 오프셋 기준, 발언 텍스트는 필요할 때 생성)"""
+    member: str                 # 위원 표현 (예: "한 위원")
+    start: int                  # 발언 시작 오프셋 (앞뒤 공백 제외)
+    end: int                    # 발언 끝 오프셋
+    source: str = field(default="", repr=False, compare=False)  # 원문
+
+    @property
+    def opinion(self) -> str:
+        """정규화된 발언 텍스트"""
+        return TextPreprocessor.normalize_fragment(self.source[self.start:self.end])
+
+
 @dataclass
 class ProcessedMinutes:
     """전처리된 의사록 데이터"""
@@ -28,10 +62,27 @@ class ProcessedMinutes:
     decision_section: str = ""    # 의결 문구
     # 문장 리스트
     sentences: List[str] = field(default_factory=list)
-    # 위원별 발언
-    member_opinions: List[Dict[str, str]] = field(default_factory=list)
+    # 위원별 발언 구간 (토의 내용 기준 오프셋)
+    member_spans: List[MemberSpan] = field(default_factory=list)
     # 전처리된 전체 텍스트
     cleaned_text: str = ""
+    # 단계별 소요 시간 (초)
+    stage_timings: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def member_opinions(self) -> List[Dict[str, str]]:
+        """위원별 발언 ([{"member": ..., "opinion": ...}], 조회 시 생성)"""
+        return member_opinions_from_spans(self.member_spans, TextPreprocessor.MIN_OPINION_LENGTH)
+
+
+def member_opinions_from_spans(spans: List[MemberSpan], min_length: int) -> List[Dict[str, str]]:
+    """발언 구간을 정규화된 발언 딕셔너리로 변환 (정규화 후 min_length 이하 제외)"""
+    opinions = []
+    for span in spans:
+        opinion = span.opinion
+        if len(opinion) > min_length:
+            opinions.append({"member": span.member, "opinion": opinion})
+    return opinions
 
 
 class TextPreprocessor:
@@ -63,6 +114,15 @@ class TextPreprocessor:
         re.MULTILINE
     )
 
+    # 위원 표현으로 인정하는 라벨 (MEMBER_PATTERN의 '[가-힣]{1,3} 위원' 매칭 중
+    # "금융위원", "경우 위원", "고승범 위원" 같은 비(非)위원 표현 제외)
+    MEMBER_LABEL_PATTERN = re.compile(
+        r'(?:한|동|일부|다른|또\s*다른|여러|모든|몇몇|대부분의?|다수의?)\s*(?:금통)?위원|위원들은?'
+    )
+
+    # 이 길이 이하의 (정규화된) 발언은 제외
+    MIN_OPINION_LENGTH = 20
+
     # 섹션 구분 패턴
     DISCUSSION_START_PATTERNS = [
         r'토의\s*내용',
@@ -79,15 +139,40 @@ class TextPreprocessor:
         r'금융통화위원회는.*의결',
     ]
 
-    def __init__(self, use_kss: bool = True):
+    # 페이지 헤더 / 페이지 번호 라인 / 특수 괄호 (모두 삭제 대상 → 1회 치환)
+    CLEANUP_PATTERN = re.compile(
+        r'---\s*페이지\s*\d+\s*---'
+        r'|^\s*-?\s*\d+\s*-?\s*$'
+        r'|[「」『』【】]',
+        re.MULTILINE
+    )
+    PAGE_HEADER_PATTERN = re.compile(
+        r'---\s*페이지\s*\d+\s*---'
+        r'|^\s*-?\s*\d+\s*-?\s*$',
+        re.MULTILINE
+    )
+    BRACKET_PATTERN = re.compile(r'[「」『』【】]')
+
+    # 연속 줄바꿈 / 연속 공백 (1회 치환)
+    WHITESPACE_PATTERN = re.compile(r'\n\s*\n+| {2,}')
+
+    def __init__(
+        self,
+        use_kss: bool = True,
+        sentence_cache: Optional[SentenceSpanCache] = None,
+        cache_sentences: bool = True
+    ):
         """
         전처리기 초기화
 
         Args:
             use_kss: Korean Sentence Splitter 사용 여부
+            sentence_cache: KSS 문장 분리 결과 캐시 (None이면 기본 위치 data/cache/sentences)
+            cache_sentences: KSS 문장 분리 결과 캐시 사용 여부
         """
         self.use_kss = use_kss
         self._kss = None
+        self.sentence_cache = (sentence_cache or SentenceSpanCache()) if cache_sentences else None
 
         if use_kss:
             try:
@@ -98,13 +183,50 @@ class TextPreprocessor:
                 logger.warning("KSS를 설치해주세요: pip install kss")
                 self.use_kss = False
 
+        self._section_pattern = self._compile_section_pattern()
+        # 누적 단계별 소요 시간 (초)
+        self.stage_totals: Dict[str, float] = {}
+
+    @classmethod
+    def _compile_section_pattern(cls) -> "re.Pattern":
+        """
+        섹션 시작 패턴 전체를 하나의 교대(alternation) 패턴으로 컴파일
+
+        그룹 이름 d{i} / c{i}는 각 리스트 내 우선순위 i를 나타냄
+        """
+        patterns = list(cls.DISCUSSION_START_PATTERNS) + list(cls.DECISION_START_PATTERNS)
+        groups = [f"(?P<d{i}>{p})" for i, p in enumerate(cls.DISCUSSION_START_PATTERNS)]
+        groups += [f"(?P<c{i}>{p})" for i, p in enumerate(cls.DECISION_START_PATTERNS)]
+        combined = "|".join(groups)
+
+        # 모든 패턴이 일반 문자로 시작하면 첫 글자 집합 전방탐색을 붙여
+        # 후보가 아닌 위치를 빠르게 건너뜀
+        if all(p and p[0] not in ".^$*+?{}[]\\|()" for p in patterns):
+            first_chars = "".join(sorted({p[0] for p in patterns}))
+            combined = f"(?=[{first_chars}])(?:{combined})"
+
+        return re.compile(combined, re.IGNORECASE)
+
+    def __getstate__(self):
+        """프로세스 간 전달 시 KSS 모듈 참조 제외"""
+        state = self.__dict__.copy()
+        state["_kss"] = None
+        return state
+
+    def __setstate__(self, state):
+        """KSS 모듈 재로드"""
+        self.__dict__.update(state)
+        if self.use_kss:
+            try:
+                import kss
+                self._kss = kss
+            except ImportError:
+                self.use_kss = False
+
     def remove_page_headers(self, text: str) -> str:
         """페이지 헤더/푸터 제거"""
-        # "--- 페이지 N ---" 형태 제거
-        text = re.sub(r'---\s*페이지\s*\d+\s*---', '', text)
-        # 페이지 번호만 있는 라인 제거
-        text = re.sub(r'^\s*-?\s*\d+\s*-?\s*$', '', text, flags=re.MULTILINE)
-        return text
+        # "--- 페이지 N ---" 형태 및 페이지 번호만 있는 라인 제거
+        return self.PAGE_HEADER_PATTERN.sub('', text)
 
     def remove_stopwords(self, text: str) -> str:
         """불용어 제거 (단, 문맥 보존을 위해 완전 제거는 하지 않음)"""
@@ -113,16 +235,41 @@ class TextPreprocessor:
         text = re.sub(r'\s+', ' ', text)
         return text.strip()
 
+    @staticmethod
+    def _collapse_whitespace(match: "re.Match") -> str:
+        """연속 줄바꿈은 빈 줄 하나로, 연속 공백은 공백 하나로"""
+        return '\n\n' if match.group(0)[0] == '\n' else ' '
+
+    @classmethod
+    def normalize_fragment(cls, text: str) -> str:
+        """텍스트 정규화 (인스턴스 없이 사용 가능)"""
+        # 특수문자 정리 (괄호 내용 보존)
+        text = cls.BRACKET_PATTERN.sub('', text)
+        # 연속 공백 / 연속 줄바꿈 제거
+        text = cls.WHITESPACE_PATTERN.sub(cls._collapse_whitespace, text)
+        return text.strip()
+
     def normalize_text(self, text: str) -> str:
         """텍스트 정규화"""
-        # 특수문자 정리 (괄호 내용 보존)
-        text = re.sub(r'[「」『』【】]', '', text)
-        # 연속 공백 제거
-        text = re.sub(r' +', ' ', text)
-        # 연속 줄바꿈 제거
-        text = re.sub(r'\n\s*\n+', '\n\n', text)
+        return self.normalize_fragment(text)
+
+    def clean_text(self, text: str) -> str:
+        """
+        페이지 헤더 제거 + 정규화 (remove_page_headers → normalize_text와 동일한 결과를 2회 치환으로 수행)
+        """
+        text = self.CLEANUP_PATTERN.sub('', text)
+        text = self.WHITESPACE_PATTERN.sub(self._collapse_whitespace, text)
         return text.strip()
 
+    @classmethod
+    def sections_version(cls) -> str:
+        """정제/섹션 분리 규칙 해시 (저장된 섹션 오프셋의 유효성 확인용)"""
+        payload = "\0".join(
+            [cls.CLEANUP_PATTERN.pattern, cls.WHITESPACE_PATTERN.pattern]
+            + list(cls.DISCUSSION_START_PATTERNS) + ["|"] + list(cls.DECISION_START_PATTERNS)
+        )
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:12]
+
     def extract_sections(self, text: str) -> Tuple[str, str]:
         """
         의사록에서 토의 내용과 의결 문구 섹션 분리
@@ -130,42 +277,187 @@ class TextPreprocessor:
         Returns:
             (토의 내용, 의결 문구) 튜플
         """
-        discussion = ""
-        decision = ""
-
-        # 토의 내용 섹션 찾기
-        discussion_match = None
-        for pattern in self.DISCUSSION_START_PATTERNS:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                discussion_match = match
-                break
-
-        # 의결 사항 섹션 찾기
-        decision_match = None
-        for pattern in self.DECISION_START_PATTERNS:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                decision_match = match
-                break
+        (ds, de), (cs, ce) = self.section_spans(text)
+        return text[ds:de], text[cs:ce]
+
+    @staticmethod
+    def _strip_span(text: str, start: int, end: int) -> Tuple[int, int]:
+        """text[start:end].strip()에 해당하는 오프셋"""
+        segment = text[start:end]
+        stripped = segment.lstrip()
+        if not stripped:
+            return start, start
+        start += len(segment) - len(stripped)
+        return start, start + len(stripped.rstrip())
+
+    def section_spans(self, text: str) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+        """
+        토의 내용 / 의결 문구 섹션의 오프셋 (앞뒤 공백 제외)
+
+        Returns:
+            ((토의 시작, 토의 끝), (의결 시작, 의결 끝)), 섹션이 없으면 빈 구간
+        """
+        discussion = (0, 0)
+        decision = (0, 0)
+
+        # 전체 섹션 패턴을 한 번에 스캔하여 패턴별 첫 출현 위치 기록
+        # - 매칭 끝이 아니라 시작 다음 위치부터 재탐색 ('위원.*의견' 같은 긴 매칭이
+        #   그 안에 있는 다른 패턴의 출현을 가리지 않도록)
+        # - 양쪽 모두 최우선 패턴을 찾으면 결과가 바뀌지 않으므로 스캔 종료
+        first_start: Dict[str, int] = {}
+        search = self._section_pattern.search
+        match = search(text)
+        while match:
+            group = match.lastgroup
+            if group not in first_start:
+                first_start[group] = match.start()
+                if "d0" in first_start and "c0" in first_start:
+                    break
+            match = search(text, match.start() + 1)
+
+        # 리스트 순서(우선순위)상 가장 먼저 매칭된 패턴 채택
+        discussion_start = next(
+            (first_start[f"d{i}"] for i in range(len(self.DISCUSSION_START_PATTERNS)) if f"d{i}" in first_start),
+            None
+        )
+        decision_start = next(
+            (first_start[f"c{i}"] for i in range(len(self.DECISION_START_PATTERNS)) if f"c{i}" in first_start),
+            None
+        )
 
         # 섹션 추출
-        if discussion_match and decision_match:
-            if discussion_match.start() < decision_match.start():
-                discussion = text[discussion_match.start():decision_match.start()]
-                decision = text[decision_match.start():]
+        end = len(text)
+        if discussion_start is not None and decision_start is not None:
+            if discussion_start < decision_start:
+                discussion = (discussion_start, decision_start)
+                decision = (decision_start, end)
             else:
-                decision = text[decision_match.start():discussion_match.start()]
-                discussion = text[discussion_match.start():]
-        elif discussion_match:
-            discussion = text[discussion_match.start():]
-        elif decision_match:
-            decision = text[decision_match.start():]
+                decision = (decision_start, discussion_start)
+                discussion = (discussion_start, end)
+        elif discussion_start is not None:
+            discussion = (discussion_start, end)
+        elif decision_start is not None:
+            decision = (decision_start, end)
         else:
             # 섹션 구분이 없으면 전체를 토의 내용으로
-            discussion = text
+            discussion = (0, end)
+
+        return self._strip_span(text, *discussion), self._strip_span(text, *decision)
+
+    # 기본 문장 구분자 (마침표, 물음표, 느낌표 뒤 공백)
+    SENTENCE_BOUNDARY_PATTERN = re.compile(r'(?<=[.?!])\s+')
+
+    def splitter_version(self) -> str:
+        """문장 분리기 버전 (캐시 키 / 분석 버전에 사용)"""
+        if self.use_kss and self._kss:
+            return f"kss-{getattr(self._kss, '__version__', 'unknown')}"
+        return "regex"
+
+    def split_sentence_spans(self, text: str) -> List[Tuple[int, int]]:
+        """
+        문장 분리 (원문 기준 오프셋)
+
+        KSS 사용 시 결과를 디스크 캐시에서 먼저 조회하고, 없으면 분리 후 저장
+
+        Args:
+            text: 입력 텍스트
+
+        Returns:
+            [(start, end), ...] 문장별 오프셋 리스트 (앞뒤 공백 제외)
+        """
+        if self.use_kss and self._kss:
+            version = self.splitter_version()
+            if self.sentence_cache is not None:
+                spans = self.sentence_cache.get(text, version)
+                if spans is not None:
+                    return spans
+
+            spans = self._split_with_kss(text)
+            if spans is not None:
+                if self.sentence_cache is not None:
+                    self.sentence_cache.put(text, version, spans)
+                return spans
+
+        # 기본 문장 분리 (마침표, 물음표, 느낌표 기준)
+        spans = []
+        pos = 0
+        boundaries = [m.span() for m in self.SENTENCE_BOUNDARY_PATTERN.finditer(text)]
+        boundaries.append((len(text), len(text)))
+
+        for sep_start, sep_end in boundaries:
+            segment = text[pos:sep_start]
+            stripped = segment.strip()
+            if stripped and len(segment) > 10:
+                start = pos + (len(segment) - len(segment.lstrip()))
+                spans.append((start, start + len(stripped)))
+            pos = sep_end
+
+        return spans
+
+    def _split_with_kss(self, text: str) -> Optional[List[Tuple[int, int]]]:
+        """KSS 문장 분리 (실패 시 None → 기본 분리 사용, 캐시하지 않음)"""
+        try:
+            sentences = self._kss.split_sentences(text)
+            return self._locate_sentences(text, sentences)
+        except Exception as e:
+            logger.warning(f"KSS 문장 분리 실패, 기본 분리 사용: {e}")
+            return None
+
+    def warm_sentence_cache(self, texts: List[str], workers: int = 1) -> int:
+        """
+        캐시에 없는 텍스트의 KSS 문장 분리를 미리 수행 (프로세스 풀 병렬)
+
+        Args:
+            texts: 문장 분리할 텍스트 리스트 (split_sentence_spans에 전달될 텍스트와 동일해야 함)
+            workers: 병렬 처리 프로세스 수 (1이면 순차 처리)
 
-        return discussion.strip(), decision.strip()
+        Returns:
+            새로 분리하여 캐시에 저장한 텍스트 수
+        """
+        if not (self.use_kss and self._kss) or self.sentence_cache is None:
+            return 0
+
+        version = self.splitter_version()
+        missing = list({
+            text: None for text in texts if not self.sentence_cache.contains(text, version)
+        })
+        if not missing:
+            return 0
+
+        if workers > 1 and len(missing) > 1:
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(missing)),
+                initializer=_init_split_worker,
+                initargs=(self,)
+            ) as pool:
+                all_spans = list(pool.map(_split_in_worker, missing))
+        else:
+            all_spans = [self._split_with_kss(text) for text in missing]
+
+        stored = 0
+        for text, spans in zip(missing, all_spans):
+            if spans is not None:
+                self.sentence_cache.put(text, version, spans)
+                stored += 1
+
+        logger.info(f"문장 분리 캐시 갱신: {stored}/{len(missing)}개 텍스트 (workers={workers})")
+        return stored
+
+    def _locate_sentences(self, text: str, sentences: List[str]) -> List[Tuple[int, int]]:
+        """분리된 문장 문자열을 원문 오프셋으로 변환"""
+        spans = []
+        cursor = 0
+        for sentence in sentences:
+            sentence = sentence.strip()
+            if not sentence:
+                continue
+            start = text.find(sentence, cursor)
+            if start < 0:
+                logger.debug(f"원문에서 문장 위치를 찾을 수 없음: {sentence[:30]}")
+                continue
+            spans.append((start, start + len(sentence)))
+            cursor = start + len(sentence)
+        return spans
 
     def split_sentences(self, text: str) -> List[str]:
         """
@@ -177,16 +469,57 @@ class TextPreprocessor:
         Returns:
             문장 리스트
         """
-        if self.use_kss and self._kss:
-            try:
-                sentences = self._kss.split_sentences(text)
-                return [s.strip() for s in sentences if s.strip()]
-            except Exception as e:
-                logger.warning(f"KSS 문장 분리 실패, 기본 분리 사용: {e}")
+        return [text[start:end] for start, end in self.split_sentence_spans(text)]
+
+    def find_member_spans(
+        self,
+        text: str,
+        min_length: Optional[int] = None,
+        start: int = 0,
+        end: Optional[int] = None
+    ) -> List[MemberSpan]:
+        """
+        위원별 발언 구간 추출 (단일 finditer 패스, 발언 텍스트는 생성하지 않음)
 
-        # 기본 문장 분리 (마침표, 물음표, 느낌표 기준)
-        sentences = re.split(r'(?<=[.?!])\s+', text)
-        return [s.strip() for s in sentences if s.strip() and len(s) > 10]
+        위원 표현 매칭 끝부터 다음 위원 표현 시작까지를 해당 위원의 발언으로 보며,
+        바로 다음에 다른 위원 표현이 이어지면 뒤의 위원 표현을 사용합니다.
+
+        Args:
+            text: 입력 텍스트
+            min_length: 앞뒤 공백 제외 길이가 이 값 이하인 구간은 제외
+                        (None이면 MIN_OPINION_LENGTH)
+            start: 탐색 시작 오프셋 (예: 토의 내용 섹션 시작)
+            end: 탐색 끝 오프셋 (None이면 텍스트 끝), 반환 오프셋은 text 기준
+
+        Returns:
+            MemberSpan 리스트 (원문 순서)
+        """
+        if min_length is None:
+            min_length = self.MIN_OPINION_LENGTH
+        if end is None:
+            end = len(text)
+
+        spans = []
+        previous = None
+        for match in self.MEMBER_PATTERN.finditer(text, start, end):
+            if previous is not None:
+                self._append_member_span(spans, text, previous, match.start(), min_length)
+            previous = match
+        if previous is not None:
+            self._append_member_span(spans, text, previous, end, min_length)
+
+        return spans
+
+    @staticmethod
+    def _append_member_span(spans: List[MemberSpan], text: str, match, end: int, min_length: int):
+        """위원 표현 매칭 뒤 ~ end 구간을 발언 구간으로 추가"""
+        start = match.end()
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        if end - start > min_length:
+            spans.append(MemberSpan(member=match.group(0).strip(), start=start, end=end, source=text))
 
     def extract_member_opinions(self, text: str) -> List[Dict[str, str]]:
         """
@@ -195,31 +528,11 @@ class TextPreprocessor:
         Returns:
             [{"member": "한 위원", "opinion": "발언 내용"}, ...]
         """
-        opinions = []
+        return member_opinions_from_spans(self.find_member_spans(text), self.MIN_OPINION_LENGTH)
 
-        # 위원 발언 패턴으로 텍스트 분할
-        parts = self.MEMBER_PATTERN.split(text)
-
-        current_member = None
-        for i, part in enumerate(parts):
-            part = part.strip()
-            if not part:
-                continue
-
-            # 위원 패턴에 매치되면 다음 부분이 해당 위원의 발언
-            if self.MEMBER_PATTERN.match(part):
-                current_member = part
-            elif current_member:
-                # 발언 내용 정제
-                opinion_text = self.normalize_text(part)
-                if len(opinion_text) > 20:  # 너무 짧은 발언 제외
-                    opinions.append({
-                        "member": current_member,
-                        "opinion": opinion_text
-                    })
-                current_member = None
-
-        return opinions
+    def is_member_label(self, member: str) -> bool:
+        """위원 표현 라벨이 실제 위원을 가리키는지 여부 (MEMBER_LABEL_PATTERN 전체 일치)"""
+        return self.MEMBER_LABEL_PATTERN.fullmatch(member) is not None
 
     def process(self, text: str, meeting_date: str = "") -> ProcessedMinutes:
         """
@@ -237,32 +550,47 @@ class TextPreprocessor:
             raw_text=text
         )
 
-        # 1. 페이지 헤더 제거
-        cleaned = self.remove_page_headers(text)
+        timings = result.stage_timings
+        clock = time.perf_counter()
 
-        # 2. 텍스트 정규화
-        cleaned = self.normalize_text(cleaned)
+        def lap(stage: str):
+            nonlocal clock
+            now = time.perf_counter()
+            timings[stage] = now - clock
+            self.stage_totals[stage] = self.stage_totals.get(stage, 0.0) + timings[stage]
+            clock = now
+
+        # 1-2. 페이지 헤더 제거 + 텍스트 정규화
+        cleaned = self.clean_text(text)
+        lap("clean")
 
         # 3. 섹션 분리
         discussion, decision = self.extract_sections(cleaned)
         result.discussion_section = discussion
         result.decision_section = decision
+        lap("sections")
 
         # 4. 문장 분리 (토의 내용 기준)
         if discussion:
             result.sentences = self.split_sentences(discussion)
+        lap("sentences")
 
         # 5. 위원별 발언 추출
         if discussion:
-            result.member_opinions = self.extract_member_opinions(discussion)
+            result.member_spans = self.find_member_spans(discussion)
+        lap("member_spans")
 
         # 6. 전처리된 텍스트 저장
         result.cleaned_text = cleaned
 
+        logger.debug(
+            "전처리 단계별 시간 [%s]: %s", meeting_date,
+            ", ".join(f"{stage}={seconds * 1000:.1f}ms" for stage, seconds in timings.items())
+        )
         logger.info(
             f"전처리 완료 [{meeting_date}]: "
             f"문장 {len(result.sentences)}개, "
-            f"위원 발언 {len(result.member_opinions)}개"
+            f"위원 발언 {len(result.member_spans)}개"
         )
 
         return result
@@ -308,6 +636,11 @@ class TextPreprocessor:
                 results.append(result)
 
         logger.info(f"총 {len(results)}개 파일 전처리 완료")
+        if self.stage_totals:
+            logger.info(
+                "전처리 누적 단계별 시간: " +
+                ", ".join(f"{stage}={seconds:.3f}s" for stage, seconds in self.stage_totals.items())
+            )
         return results
 
 
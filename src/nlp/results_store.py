@@ -0,0 +1,317 @@
+"""
+톤 분석 결과 컬럼형 저장소
+
+CSV/JSON 대신 타입이 지정된 컬럼형 포맷으로 결과를 저장합니다.
+- pyarrow가 있으면 Parquet, 없으면 NumPy .npz
+- 회의 요약 테이블: 회의별 1행 (톤 지수, 점수, 해석 등)
+- 문장별 톤: 전체 문장 톤을 가변 길이 배열로 보존 (잘라내지 않음)
+- 키워드 테이블: (회의, 극성, 종류, 키워드 ID, 점수, 횟수) 롱 포맷 + 키워드 어휘
+- 위원 테이블: (회의, 위원 표현 ID, 톤) 롱 포맷 + 위원 표현 어휘
+
+필요한 컬럼만 읽을 수 있으며(컬럼 프로젝션), CSV 파싱 없이 바로 로드됩니다.
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+POLARITIES = ("hawkish", "dovish")
+TERM_KINDS = ("term", "ngram")
+
+
+class ToneResultStore:
+    """톤 분석 결과 컬럼형 저장소"""
+
+    def __init__(self, base_path: Path, backend: Optional[str] = None):
+        """
+        Args:
+            base_path: 확장자 없는 저장 경로 (예: data/analysis/tone_index_results)
+            backend: "parquet" 또는 "npz" (None이면 pyarrow 설치 여부로 결정하되,
+                     npz 결과만 있으면 npz 사용)
+        """
+        self.base_path = Path(base_path)
+        if backend is None:
+            backend = "parquet" if PYARROW_AVAILABLE else "npz"
+            if backend == "parquet" and not self.parquet_path.exists() and self.npz_path.exists():
+                backend = "npz"
+        if backend == "parquet" and not PYARROW_AVAILABLE:
+            raise ImportError("Parquet 저장소를 사용하려면 pyarrow를 설치해주세요: pip install pyarrow")
+        self.backend = backend
+
+    @property
+    def npz_path(self) -> Path:
+        return self.base_path.with_name(self.base_path.name + ".npz")
+
+    @property
+    def parquet_path(self) -> Path:
+        return self.base_path.with_name(self.base_path.name + ".parquet")
+
+    @property
+    def terms_parquet_path(self) -> Path:
+        return self.base_path.with_name(self.base_path.name + "_terms.parquet")
+
+    @property
+    def members_parquet_path(self) -> Path:
+        return self.base_path.with_name(self.base_path.name + "_members.parquet")
+
+    def exists(self) -> bool:
+        """저장된 결과 존재 여부"""
+        if self.backend == "parquet":
+            return self.parquet_path.exists()
+        return self.npz_path.exists()
+
+    # ------------------------------------------------------------------
+    # 저장
+    # ------------------------------------------------------------------
+
+    def save(self, summary: pd.DataFrame, results: List) -> Path:
+        """
+        결과 저장
+
+        Args:
+            summary: 회의별 요약 DataFrame (ToneAnalyzer.results_to_dataframe 결과)
+            results: ToneResult 리스트 (summary와 같은 회의 집합)
+
+        Returns:
+            저장된 (주) 파일 경로
+        """
+        summary = summary.reset_index(drop=True)
+        by_date = {r.meeting_date: r for r in results}
+        ordered = [by_date[d] for d in summary["meeting_date_str"]]
+
+        # 문장별 톤 (가변 길이 → 값 + 오프셋)
+        tones = [np.asarray(r.sentence_tones, dtype=np.float64) for r in ordered]
+        offsets = np.zeros(len(tones) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(t) for t in tones])
+        values = np.concatenate(tones) if tones else np.zeros(0)
+
+        terms = self._build_term_table(ordered)
+        members = self._build_member_table(ordered)
+
+        if self.backend == "parquet":
+            return self._save_parquet(summary, values, offsets, terms, members)
+        return self._save_npz(summary, values, offsets, terms, members)
+
+    def _build_term_table(self, results: List) -> Dict[str, np.ndarray]:
+        """키워드 롱 포맷 테이블 생성"""
+        vocabulary: Dict[str, int] = {}
+        columns = {"meeting_idx": [], "polarity": [], "kind": [], "term_id": [], "score": [], "count": []}
+
+        for idx, r in enumerate(results):
+            for p, polarity in enumerate(POLARITIES):
+                counts = getattr(r, f"{polarity}_counts")
+                for k, kind in enumerate(TERM_KINDS):
+                    scores = getattr(r, f"{polarity}_terms" if kind == "term" else f"{polarity}_ngrams")
+                    for term, score in scores.items():
+                        columns["meeting_idx"].append(idx)
+                        columns["polarity"].append(p)
+                        columns["kind"].append(k)
+                        columns["term_id"].append(vocabulary.setdefault(term, len(vocabulary)))
+                        columns["score"].append(score)
+                        columns["count"].append(counts.get(term, 0))
+
+        return {
+            "meeting_idx": np.asarray(columns["meeting_idx"], dtype=np.int32),
+            "polarity": np.asarray(columns["polarity"], dtype=np.int8),
+            "kind": np.asarray(columns["kind"], dtype=np.int8),
+            "term_id": np.asarray(columns["term_id"], dtype=np.int32),
+            "score": np.asarray(columns["score"], dtype=np.float64),
+            "count": np.asarray(columns["count"], dtype=np.int32),
+            "vocabulary": np.asarray(list(vocabulary), dtype=str),
+        }
+
+    def _build_member_table(self, results: List) -> Dict[str, np.ndarray]:
+        """위원 표현별 톤 롱 포맷 테이블 생성"""
+        vocabulary: Dict[str, int] = {}
+        meeting_idx, member_id, tone = [], [], []
+
+        for idx, r in enumerate(results):
+            for member, value in getattr(r, "member_tones", {}).items():
+                meeting_idx.append(idx)
+                member_id.append(vocabulary.setdefault(member, len(vocabulary)))
+                tone.append(value)
+
+        return {
+            "meeting_idx": np.asarray(meeting_idx, dtype=np.int32),
+            "member_id": np.asarray(member_id, dtype=np.int32),
+            "tone": np.asarray(tone, dtype=np.float64),
+            "vocabulary": np.asarray(list(vocabulary), dtype=str),
+        }
+
+    def _save_npz(self, summary, values, offsets, terms, members) -> Path:
+        arrays = {"meetings.__columns__": np.asarray(summary.columns, dtype=str)}
+        for col in summary.columns:
+            series = summary[col]
+            if pd.api.types.is_datetime64_any_dtype(series):
+                arrays[f"meetings.{col}"] = series.to_numpy(dtype="datetime64[ns]")
+            elif pd.api.types.is_numeric_dtype(series):
+                arrays[f"meetings.{col}"] = series.to_numpy()
+            else:
+                arrays[f"meetings.{col}"] = series.fillna("").astype(str).to_numpy(dtype=str)
+
+        arrays["sentence_tones.values"] = values
+        arrays["sentence_tones.offsets"] = offsets
+        for key, array in terms.items():
+            arrays[f"terms.{key}"] = array
+        for key, array in members.items():
+            arrays[f"members.{key}"] = array
+
+        np.savez_compressed(self.npz_path, **arrays)
+        logger.info(f"결과 저장소 저장 (npz): {self.npz_path}")
+        return self.npz_path
+
+    def _save_parquet(self, summary, values, offsets, terms, members) -> Path:
+        table = pa.Table.from_pandas(summary, preserve_index=False)
+        table = table.append_column(
+            "sentence_tones",
+            pa.ListArray.from_arrays(pa.array(offsets, pa.int32()), pa.array(values, pa.float64()))
+        )
+        pq.write_table(table, self.parquet_path)
+
+        vocabulary = terms["vocabulary"]
+        term_table = pa.table({
+            "meeting_idx": terms["meeting_idx"],
+            "polarity": terms["polarity"],
+            "kind": terms["kind"],
+            "term": pa.DictionaryArray.from_arrays(
+                pa.array(terms["term_id"], pa.int32()), pa.array(vocabulary.tolist(), pa.string())
+            ),
+            "score": terms["score"],
+            "count": terms["count"],
+        })
+        pq.write_table(term_table, self.terms_parquet_path)
+
+        member_table = pa.table({
+            "meeting_idx": members["meeting_idx"],
+            "member": pa.DictionaryArray.from_arrays(
+                pa.array(members["member_id"], pa.int32()),
+                pa.array(members["vocabulary"].tolist(), pa.string())
+            ),
+            "tone": members["tone"],
+        })
+        pq.write_table(member_table, self.members_parquet_path)
+
+        logger.info(f"결과 저장소 저장 (parquet): {self.parquet_path}")
+        return self.parquet_path
+
+    # ------------------------------------------------------------------
+    # 로드
+    # ------------------------------------------------------------------
+
+    def load(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        회의 요약 테이블 로드
+
+        Args:
+            columns: 읽을 컬럼 (None이면 sentence_tones를 제외한 전체).
+                     "sentence_tones"를 지정하면 회의별 NumPy 배열 컬럼으로 반환
+
+        Returns:
+            DataFrame (회의 날짜 순)
+        """
+        if self.backend == "parquet":
+            if columns is None:
+                schema = pq.read_schema(self.parquet_path)
+                columns = [name for name in schema.names if name != "sentence_tones"]
+            df = pq.read_table(self.parquet_path, columns=columns).to_pandas()
+            if "sentence_tones" in df.columns:
+                df["sentence_tones"] = df["sentence_tones"].map(lambda v: np.asarray(v, dtype=np.float64))
+            return df
+
+        with np.load(self.npz_path) as npz:
+            available = npz["meetings.__columns__"].tolist()
+            if columns is None:
+                columns = available
+
+            data = {}
+            for col in columns:
+                if col == "sentence_tones":
+                    values = npz["sentence_tones.values"]
+                    offsets = npz["sentence_tones.offsets"]
+                    data[col] = [values[offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1)]
+                elif col in available:
+                    data[col] = npz[f"meetings.{col}"]
+                else:
+                    raise KeyError(f"저장소에 없는 컬럼: {col}")
+
+        return pd.DataFrame(data)
+
+    def load_terms(self) -> pd.DataFrame:
+        """
+        키워드 테이블 로드
+
+        Returns:
+            DataFrame (meeting_date_str, polarity, kind, term, score, count)
+        """
+        meeting_dates = self.load(columns=["meeting_date_str"])["meeting_date_str"].to_numpy()
+
+        if self.backend == "parquet":
+            df = pq.read_table(self.terms_parquet_path).to_pandas()
+            df["term"] = df["term"].astype(str)
+            meeting_idx = df["meeting_idx"].to_numpy()
+            polarity = df["polarity"].to_numpy()
+            kind = df["kind"].to_numpy()
+        else:
+            with np.load(self.npz_path) as npz:
+                meeting_idx = npz["terms.meeting_idx"]
+                polarity = npz["terms.polarity"]
+                kind = npz["terms.kind"]
+                vocabulary = npz["terms.vocabulary"]
+                df = pd.DataFrame({
+                    "term": vocabulary[npz["terms.term_id"]] if len(vocabulary) else np.zeros(0, dtype=str),
+                    "score": npz["terms.score"],
+                    "count": npz["terms.count"],
+                })
+
+        return pd.DataFrame({
+            "meeting_date_str": meeting_dates[meeting_idx],
+            "polarity": np.asarray(POLARITIES)[polarity],
+            "kind": np.asarray(TERM_KINDS)[kind],
+            "term": df["term"].to_numpy(),
+            "score": df["score"].to_numpy(),
+            "count": df["count"].to_numpy(),
+        })
+
+    def load_members(self) -> pd.DataFrame:
+        """
+        위원 표현별 톤 테이블 로드
+
+        Returns:
+            DataFrame (meeting_date_str, member, tone). 위원 테이블이 없는 이전 결과는 빈 DataFrame
+        """
+        empty = pd.DataFrame({"meeting_date_str": [], "member": [], "tone": []})
+        meeting_dates = self.load(columns=["meeting_date_str"])["meeting_date_str"].to_numpy()
+
+        if self.backend == "parquet":
+            if not self.members_parquet_path.exists():
+                return empty
+            df = pq.read_table(self.members_parquet_path).to_pandas()
+            meeting_idx = df["meeting_idx"].to_numpy()
+            members = df["member"].astype(str).to_numpy()
+            tone = df["tone"].to_numpy()
+        else:
+            with np.load(self.npz_path) as npz:
+                if "members.meeting_idx" not in npz.files:
+                    return empty
+                meeting_idx = npz["members.meeting_idx"]
+                vocabulary = npz["members.vocabulary"]
+                members = vocabulary[npz["members.member_id"]] if len(vocabulary) else np.zeros(0, dtype=str)
+                tone = npz["members.tone"]
+
+        return pd.DataFrame({
+            "meeting_date_str": meeting_dates[meeting_idx],
+            "member": members,
+            "tone": tone,
+        })
@@ -0,0 +1,105 @@
+"""
+문장 분리 결과 디스크 캐시
+
+KSS 문장 분리는 전처리에서 가장 느린 단계이지만, 같은 텍스트와 같은
+분리기 버전이면 결과가 바뀌지 않습니다. 문장 경계를 (start, end) 오프셋
+배열로 저장해 두고 재분석/대시보드 재로딩/백테스트에서 재사용합니다.
+
+- 키: sha256(분리기 버전 + 텍스트)
+- 값: int32 (문장 수, 2) 배열 (.npy)
+- 저장 위치: data/cache/sentences/<키 앞 2자리>/<키>.npy
+"""
+
+import os
+import hashlib
+import logging
+import tempfile
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 프로젝트 루트 디렉토리
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DEFAULT_CACHE_DIR = PROJECT_ROOT / "data" / "cache" / "sentences"
+
+
+class SentenceSpanCache:
+    """문장 오프셋 디스크 캐시"""
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리 (None이면 data/cache/sentences)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(text: str, splitter_version: str) -> str:
+        """텍스트 + 분리기 버전 해시"""
+        digest = hashlib.sha256(splitter_version.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(text.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.npy"
+
+    def contains(self, text: str, splitter_version: str) -> bool:
+        """캐시 존재 여부 (통계에는 반영하지 않음)"""
+        return self._path(self.make_key(text, splitter_version)).exists()
+
+    def get(self, text: str, splitter_version: str) -> Optional[List[Tuple[int, int]]]:
+        """
+        캐시된 문장 오프셋 조회
+
+        Returns:
+            [(start, end), ...] 또는 None (캐시 없음/손상)
+        """
+        path = self._path(self.make_key(text, splitter_version))
+        try:
+            spans = np.load(path, allow_pickle=False)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"문장 캐시 손상, 무시: {path} ({e})")
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return [(int(start), int(end)) for start, end in spans.reshape(-1, 2)]
+
+    def put(self, text: str, splitter_version: str, spans: List[Tuple[int, int]]):
+        """문장 오프셋 저장 (임시 파일 후 교체 → 동시 실행 프로세스에서도 안전)"""
+        path = self._path(self.make_key(text, splitter_version))
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        array = np.asarray(spans, dtype=np.int32).reshape(-1, 2)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, array, allow_pickle=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"문장 캐시 저장 실패: {path} ({e})")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def clear(self) -> int:
+        """
+        캐시 전체 삭제
+
+        Returns:
+            삭제된 파일 수
+        """
+        removed = 0
+        if self.cache_dir.exists():
+            for path in self.cache_dir.glob("*/*.npy"):
+                path.unlink()
+                removed += 1
+        return removed
@@ -7,11 +7,14 @@
 """
 
 import json
+import hashlib
 import logging
 from typing import Dict, List, Set, Tuple, Optional
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
-from collections import defaultdict
+from collections import defaultdict, Counter
+
+from .keyword_matcher import KeywordMatcher
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -31,6 +34,16 @@ class SentimentEntry:
     description: str = "" # 설명
 
 
+@dataclass
+class KeywordHit:
+    """텍스트 내 키워드 출현 위치"""
+    term: str
+    polarity: str       # 'hawkish' 또는 'dovish'
+    weight: float
+    start: int          # 시작 오프셋
+    end: int            # 끝 오프셋 (exclusive)
+
+
 class SentimentDictionary:
     """한국은행 통화정책 감성 사전"""
 
@@ -39,6 +52,10 @@ class SentimentDictionary:
         self.hawkish_terms: Dict[str, SentimentEntry] = {}
         self.dovish_terms: Dict[str, SentimentEntry] = {}
 
+        # 사전 버전 (키워드 집합이 바뀔 때마다 증가) 및 컴파일된 매처 캐시
+        self.version = 0
+        self._matchers: Dict[str, Tuple[int, KeywordMatcher]] = {}
+
         # 기본 사전 로드
         self._build_default_dictionary()
 
@@ -157,6 +174,8 @@ class SentimentDictionary:
         for entry in dovish_keywords:
             self.dovish_terms[entry.term] = entry
 
+        self._bump_version()
+
         logger.info(f"기본 감성 사전 로드: 매파 {len(self.hawkish_terms)}개, 비둘기파 {len(self.dovish_terms)}개")
 
     def add_hawkish_term(
@@ -169,6 +188,7 @@ class SentimentDictionary:
         """매파적 키워드 추가"""
         entry = SentimentEntry(term, "hawkish", weight, category, description)
         self.hawkish_terms[term] = entry
+        self._bump_version()
 
     def add_dovish_term(
         self,
@@ -180,6 +200,7 @@ class SentimentDictionary:
         """비둘기파적 키워드 추가"""
         entry = SentimentEntry(term, "dovish", weight, category, description)
         self.dovish_terms[term] = entry
+        self._bump_version()
 
     def get_hawkish_terms(self) -> List[str]:
         """매파적 키워드 리스트 반환"""
@@ -203,32 +224,107 @@ class SentimentDictionary:
         else:
             return ("neutral", 0.0)
 
-    def match_in_text(self, text: str) -> Dict[str, List[Tuple[str, float]]]:
+    def _bump_version(self):
+        """키워드 집합 변경 시 버전 증가 (컴파일된 매처 무효화)"""
+        self.version += 1
+        self._matchers.clear()
+
+    def fingerprint(self) -> str:
+        """
+        사전 내용 해시 (키워드, 극성, 가중치 기준)
+
+        프로세스와 무관하게 같은 사전이면 같은 값을 반환하므로
+        증분 분석 매니페스트의 사전 버전으로 사용합니다.
+        """
+        entries = sorted(
+            (e.polarity, e.term, e.weight)
+            for e in list(self.hawkish_terms.values()) + list(self.dovish_terms.values())
+        )
+        payload = json.dumps(entries, ensure_ascii=False).encode("utf-8")
+        return hashlib.sha1(payload).hexdigest()[:16]
+
+    def get_matcher(self, overlap: str = "all") -> KeywordMatcher:
+        """
+        현재 사전 버전에 대해 컴파일된 매처 반환 (버전별 1회 컴파일)
+
+        가중치는 매칭 시점에 사전에서 조회하므로, 가중치만 바뀐 경우에는
+        재컴파일이 필요하지 않습니다.
+
+        Args:
+            overlap: 중첩 매칭 방식 ("all" 또는 "longest")
+        """
+        cached = self._matchers.get(overlap)
+        if cached and cached[0] == self.version:
+            return cached[1]
+
+        patterns = [(term, ("hawkish", term)) for term in self.hawkish_terms]
+        patterns += [(term, ("dovish", term)) for term in self.dovish_terms]
+        matcher = KeywordMatcher(patterns, overlap=overlap)
+
+        self._matchers[overlap] = (self.version, matcher)
+        logger.debug(f"키워드 매처 컴파일: v{self.version}, {matcher.pattern_count}개 패턴 ({overlap})")
+        return matcher
+
+    def find_matches(self, text: str, overlap: str = "all") -> List[KeywordHit]:
+        """
+        텍스트 내 모든 감성 키워드 출현 위치 반환 (키워드별 재스캔 없음)
+
+        Args:
+            text: 분석할 텍스트
+            overlap: 중첩 매칭 방식 ("all": "대외불확실성" 안의 "불확실성"도 매칭,
+                     "longest": 가장 긴 키워드만 매칭)
+
+        Returns:
+            KeywordHit 리스트 (시작 오프셋 순)
+        """
+        hits = []
+        for start, end, (polarity, term) in self.get_matcher(overlap).find_all(text):
+            terms = self.hawkish_terms if polarity == "hawkish" else self.dovish_terms
+            hits.append(KeywordHit(term, polarity, terms[term].weight, start, end))
+        return hits
+
+    def match_in_text(
+        self,
+        text: str,
+        overlap: str = "all"
+    ) -> Dict[str, List[Tuple[str, float]]]:
         """
         텍스트에서 감성 키워드 매칭
 
         Args:
             text: 분석할 텍스트
+            overlap: 중첩 매칭 방식 (기본값 "all"은 키워드별 단순 출현 횟수와 동일)
 
         Returns:
             {"hawkish": [(term, weight), ...], "dovish": [(term, weight), ...]}
         """
+        counts = Counter(payload for _, _, payload in self.get_matcher(overlap).find_all(text))
+        return self._weigh_counts(counts)
+
+    def summarize_hits(self, hits: List[KeywordHit]) -> Dict[str, List[Tuple[str, float]]]:
+        """
+        find_matches 결과를 match_in_text와 같은 형식으로 집계 (재스캔 없음)
+
+        Returns:
+            {"hawkish": [(term, weight), ...], "dovish": [(term, weight), ...]}
+        """
+        return self._weigh_counts(Counter((hit.polarity, hit.term) for hit in hits))
+
+    def _weigh_counts(self, counts: Counter) -> Dict[str, List[Tuple[str, float]]]:
+        """(극성, 키워드)별 출현 횟수에 가중치 적용 (사전 순서 유지)"""
         matches = {
             "hawkish": [],
             "dovish": []
         }
 
-        # 매파 키워드 매칭
         for term, entry in self.hawkish_terms.items():
-            if term in text:
-                # 출현 횟수 계산
-                count = text.count(term)
+            count = counts.get(("hawkish", term))
+            if count:
                 matches["hawkish"].append((term, entry.weight * count))
 
-        # 비둘기파 키워드 매칭
         for term, entry in self.dovish_terms.items():
-            if term in text:
-                count = text.count(term)
+            count = counts.get(("dovish", term))
+            if count:
                 matches["dovish"].append((term, entry.weight * count))
 
         return matches
@@ -271,6 +367,8 @@ class SentimentDictionary:
             entry = SentimentEntry(**entry_data)
             self.dovish_terms[entry.term] = entry
 
+        self._bump_version()
+
         logger.info(f"감성 사전 로드: 매파 {len(self.hawkish_terms)}개, 비둘기파 {len(self.dovish_terms)}개")
 
     def get_statistics(self) -> Dict:
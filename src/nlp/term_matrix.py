@@ -0,0 +1,220 @@
+"""
+문서-키워드 희소 행렬 모듈
+
+회의 × 키워드 출현 횟수 행렬(매파/비둘기파 블록)을 저장해 두고,
+가중치가 바뀌면 텍스트를 다시 읽지 않고 희소 행렬-벡터 곱 두 번으로
+전체 회의의 톤 지수를 재계산합니다.
+
+    Hawkish = X_h · w_h,  Dovish = X_d · w_d
+    Tone = (Hawkish - Dovish) / (Hawkish + Dovish + ε)
+"""
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SparseCounts:
+    """CSR 형식 희소 출현 횟수 행렬"""
+    indptr: np.ndarray     # 행별 시작 위치 (길이: 행 수 + 1)
+    indices: np.ndarray    # 열 번호
+    data: np.ndarray       # 출현 횟수
+    n_cols: int
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Dict[int, int]], n_cols: int) -> "SparseCounts":
+        """행별 {열 번호: 횟수} 딕셔너리로부터 생성"""
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        indices: List[int] = []
+        data: List[int] = []
+        for i, row in enumerate(rows):
+            for col in sorted(row):
+                indices.append(col)
+                data.append(row[col])
+            indptr[i + 1] = len(indices)
+
+        return cls(
+            indptr=indptr,
+            indices=np.asarray(indices, dtype=np.int64),
+            data=np.asarray(data, dtype=np.float64),
+            n_cols=n_cols
+        )
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.indptr) - 1
+
+    def matvec(self, weights: np.ndarray) -> np.ndarray:
+        """행렬-벡터 곱 (행별 가중 합계)"""
+        rows = np.repeat(np.arange(self.n_rows), np.diff(self.indptr))
+        return np.bincount(rows, weights=self.data * weights[self.indices], minlength=self.n_rows)
+
+    def to_dense(self) -> np.ndarray:
+        """밀집 행렬로 변환"""
+        dense = np.zeros((self.n_rows, self.n_cols))
+        rows = np.repeat(np.arange(self.n_rows), np.diff(self.indptr))
+        dense[rows, self.indices] = self.data
+        return dense
+
+
+class TermMatrix:
+    """회의 × 키워드 출현 횟수 행렬 (매파/비둘기파 블록)"""
+
+    def __init__(
+        self,
+        meeting_dates: List[str],
+        hawkish_terms: List[str],
+        dovish_terms: List[str],
+        hawkish_counts: SparseCounts,
+        dovish_counts: SparseCounts,
+        hawkish_weights: np.ndarray,
+        dovish_weights: np.ndarray
+    ):
+        """
+        Args:
+            meeting_dates: 행 순서의 회의 날짜 (YYYY_MM_DD)
+            hawkish_terms / dovish_terms: 열 순서의 키워드 (N-gram 표현 포함)
+            hawkish_counts / dovish_counts: 블록별 희소 출현 횟수 행렬
+            hawkish_weights / dovish_weights: 행렬 생성 시점의 가중치 (재계산 기본값)
+        """
+        self.meeting_dates = meeting_dates
+        self.hawkish_terms = hawkish_terms
+        self.dovish_terms = dovish_terms
+        self.hawkish_counts = hawkish_counts
+        self.dovish_counts = dovish_counts
+        self.hawkish_weights = hawkish_weights
+        self.dovish_weights = dovish_weights
+
+    @classmethod
+    def from_results(cls, results, dictionary=None) -> "TermMatrix":
+        """
+        ToneResult 리스트로부터 행렬 생성
+
+        Args:
+            results: ToneResult 리스트 (hawkish_counts / dovish_counts 필요)
+            dictionary: 감성 사전 (주어지면 출현하지 않은 키워드도 열에 포함하고 사전 가중치를 기본값으로 사용)
+        """
+        blocks = {}
+        for polarity in ("hawkish", "dovish"):
+            terms: Dict[str, int] = {}
+            base_weights: Dict[str, float] = {}
+
+            if dictionary is not None:
+                entries = dictionary.hawkish_terms if polarity == "hawkish" else dictionary.dovish_terms
+                for term, entry in entries.items():
+                    terms.setdefault(term, len(terms))
+                    base_weights[term] = entry.weight
+
+            rows = []
+            for r in results:
+                counts = getattr(r, f"{polarity}_counts")
+                scores = {**getattr(r, f"{polarity}_terms"), **getattr(r, f"{polarity}_ngrams")}
+                row = {}
+                for term, count in counts.items():
+                    col = terms.setdefault(term, len(terms))
+                    row[col] = count
+                    if term not in base_weights and count:
+                        base_weights[term] = scores.get(term, 0.0) / count
+                rows.append(row)
+
+            blocks[polarity] = (
+                list(terms),
+                SparseCounts.from_rows(rows, len(terms)),
+                np.array([base_weights.get(t, 0.0) for t in terms], dtype=np.float64)
+            )
+
+        return cls(
+            meeting_dates=[r.meeting_date for r in results],
+            hawkish_terms=blocks["hawkish"][0],
+            dovish_terms=blocks["dovish"][0],
+            hawkish_counts=blocks["hawkish"][1],
+            dovish_counts=blocks["dovish"][1],
+            hawkish_weights=blocks["hawkish"][2],
+            dovish_weights=blocks["dovish"][2]
+        )
+
+    def weight_vectors(self, weights: Optional[Dict[str, float]] = None):
+        """
+        키워드별 가중치 딕셔너리를 블록별 가중치 벡터로 변환
+
+        Args:
+            weights: {키워드: 가중치}. 없는 키워드는 행렬 생성 시점의 가중치 사용
+        """
+        if not weights:
+            return self.hawkish_weights, self.dovish_weights
+
+        w_h = np.array([weights.get(t, w) for t, w in zip(self.hawkish_terms, self.hawkish_weights)])
+        w_d = np.array([weights.get(t, w) for t, w in zip(self.dovish_terms, self.dovish_weights)])
+        return w_h, w_d
+
+    def score(
+        self,
+        weights: Optional[Dict[str, float]] = None,
+        epsilon: float = 1e-6
+    ) -> pd.DataFrame:
+        """
+        가중치 벡터로 전체 회의 톤 지수 재계산
+
+        Args:
+            weights: {키워드: 가중치} (예: DatabaseManager.get_active_weights())
+            epsilon: 분모 0 방지용 상수
+
+        Returns:
+            DataFrame (meeting_date_str, hawkish_score, dovish_score, tone_index)
+        """
+        w_h, w_d = self.weight_vectors(weights)
+        hawkish = self.hawkish_counts.matvec(w_h)
+        dovish = self.dovish_counts.matvec(w_d)
+        tone = np.clip((hawkish - dovish) / (hawkish + dovish + epsilon), -1.0, 1.0)
+
+        return pd.DataFrame({
+            "meeting_date_str": self.meeting_dates,
+            "hawkish_score": hawkish,
+            "dovish_score": dovish,
+            "tone_index": tone,
+        })
+
+    def save(self, filepath: Path):
+        """NumPy .npz 파일로 저장"""
+        np.savez_compressed(
+            filepath,
+            meeting_dates=np.array(self.meeting_dates, dtype=str),
+            hawkish_terms=np.array(self.hawkish_terms, dtype=str),
+            dovish_terms=np.array(self.dovish_terms, dtype=str),
+            hawkish_indptr=self.hawkish_counts.indptr,
+            hawkish_indices=self.hawkish_counts.indices,
+            hawkish_data=self.hawkish_counts.data,
+            dovish_indptr=self.dovish_counts.indptr,
+            dovish_indices=self.dovish_counts.indices,
+            dovish_data=self.dovish_counts.data,
+            hawkish_weights=self.hawkish_weights,
+            dovish_weights=self.dovish_weights,
+        )
+        logger.info(f"문서-키워드 행렬 저장: {filepath}")
+
+    @classmethod
+    def load(cls, filepath: Path) -> "TermMatrix":
+        """NumPy .npz 파일에서 로드"""
+        with np.load(filepath) as npz:
+            hawkish_terms = npz["hawkish_terms"].tolist()
+            dovish_terms = npz["dovish_terms"].tolist()
+            return cls(
+                meeting_dates=npz["meeting_dates"].tolist(),
+                hawkish_terms=hawkish_terms,
+                dovish_terms=dovish_terms,
+                hawkish_counts=SparseCounts(
+                    npz["hawkish_indptr"], npz["hawkish_indices"], npz["hawkish_data"], len(hawkish_terms)
+                ),
+                dovish_counts=SparseCounts(
+                    npz["dovish_indptr"], npz["dovish_indices"], npz["dovish_data"], len(dovish_terms)
+                ),
+                hawkish_weights=npz["hawkish_weights"],
+                dovish_weights=npz["dovish_weights"],
+            )
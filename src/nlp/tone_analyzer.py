@@ -19,10 +19,16 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from collections import Counter
 import json
+import os
+import hashlib
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 
-from .sentiment_dict import SentimentDictionary
-from .preprocessor import TextPreprocessor, ProcessedMinutes
+from .sentiment_dict import SentimentDictionary, KeywordHit
+from .preprocessor import TextPreprocessor, ProcessedMinutes, MemberSpan
+from .ngram_matcher import NgramMatcher
+from .term_matrix import TermMatrix
+from .results_store import ToneResultStore
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -32,6 +38,24 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 OUTPUT_DIR = DATA_DIR / "analysis"
 
+# 분석 로직 버전 (점수 산출 방식이 바뀌면 증가 → 증분 분석 시 전체 재분석)
+ANALYZER_VERSION = "4"
+
+
+# 프로세스 풀 워커별 분석기 (워커 초기화 시 1회 전달)
+_worker_analyzer: Optional["ToneAnalyzer"] = None
+
+
+def _init_worker(analyzer: "ToneAnalyzer"):
+    """프로세스 풀 워커 초기화: 컴파일된 사전을 포함한 분석기 수신"""
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+
+
+def _analyze_file_in_worker(filepath: Path) -> Optional["ToneResult"]:
+    """워커에서 파일 분석 (실패 시 analyze_file과 동일하게 로깅 후 None)"""
+    return _worker_analyzer.analyze_file(filepath)
+
 
 @dataclass
 class ToneResult:
@@ -42,7 +66,12 @@ class ToneResult:
     dovish_score: float                  # 비둘기파 점수 (가중 빈도)
     hawkish_terms: Dict[str, float] = field(default_factory=dict)  # 매파 키워드별 점수
     dovish_terms: Dict[str, float] = field(default_factory=dict)   # 비둘기파 키워드별 점수
-    sentence_tones: List[float] = field(default_factory=list)      # 문장별 톤
+    hawkish_ngrams: Dict[str, float] = field(default_factory=dict)  # 매파 N-gram 표현별 점수
+    dovish_ngrams: Dict[str, float] = field(default_factory=dict)   # 비둘기파 N-gram 표현별 점수
+    hawkish_counts: Dict[str, int] = field(default_factory=dict)   # 매파 키워드/N-gram별 출현 횟수
+    dovish_counts: Dict[str, int] = field(default_factory=dict)    # 비둘기파 키워드/N-gram별 출현 횟수
+    sentence_tones: np.ndarray = field(default_factory=lambda: np.zeros(0))  # 문장별 톤
+    member_tones: Dict[str, float] = field(default_factory=dict)   # 위원 표현별 톤 ("한 위원" 등)
     total_sentences: int = 0
     interpretation: str = ""             # 톤 해석
 
@@ -63,7 +92,8 @@ class ToneAnalyzer:
         self,
         dictionary: Optional[SentimentDictionary] = None,
         preprocessor: Optional[TextPreprocessor] = None,
-        epsilon: float = 1e-6
+        epsilon: float = 1e-6,
+        ngram_matcher: Optional[NgramMatcher] = None
     ):
         """
         톤 분석기 초기화
@@ -72,10 +102,13 @@ class ToneAnalyzer:
             dictionary: 감성 사전 (None이면 기본 사전 사용)
             preprocessor: 전처리기 (None이면 기본 설정 사용)
             epsilon: 분모 0 방지용 상수
+            ngram_matcher: N-gram 표현 매처 (None이면 N-gram 점수 미사용,
+                           NgramMatcher.from_defaults()로 기본 사전 사용 가능)
         """
         self.dictionary = dictionary or SentimentDictionary()
         self.preprocessor = preprocessor or TextPreprocessor(use_kss=False)
         self.epsilon = epsilon
+        self.ngram_matcher = ngram_matcher
 
         # 출력 디렉토리 생성
         OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -110,19 +143,28 @@ class ToneAnalyzer:
         else:
             return "강한 비둘기파 (Strong Dovish)"
 
-    def analyze_text(self, text: str, meeting_date: str = "") -> ToneResult:
+    def analyze_text(
+        self,
+        text: str,
+        meeting_date: str = "",
+        discussion_span: Optional[Tuple[int, int]] = None
+    ) -> ToneResult:
         """
         텍스트의 톤 분석
 
         Args:
             text: 분석할 텍스트
             meeting_date: 회의 날짜
+            discussion_span: 위원별 톤을 계산할 토의 내용 구간 (text 기준 오프셋)
+                             (None이면 text에서 섹션을 찾아 사용)
 
         Returns:
             ToneResult 객체
         """
-        # 감성 키워드 매칭
-        matches = self.dictionary.match_in_text(text)
+        # 감성 키워드 매칭 (문서 전체 1회 스캔)
+        hits = self.dictionary.find_matches(text)
+
+        matches = self.dictionary.summarize_hits(hits)
 
         # 매파/비둘기파 점수 계산
         hawkish_terms = {term: weight for term, weight in matches["hawkish"]}
@@ -131,20 +173,43 @@ class ToneAnalyzer:
         hawkish_score = sum(hawkish_terms.values())
         dovish_score = sum(dovish_terms.values())
 
+        # N-gram 표현 점수 (선택)
+        hawkish_ngrams: Dict[str, float] = {}
+        dovish_ngrams: Dict[str, float] = {}
+        if self.ngram_matcher is not None:
+            ngram_hits = self.ngram_matcher.find_matches(text)
+            for hit in ngram_hits:
+                ngrams = hawkish_ngrams if hit.polarity == "hawkish" else dovish_ngrams
+                ngrams[hit.term] = ngrams.get(hit.term, 0.0) + hit.weight
+            hawkish_score += sum(hawkish_ngrams.values())
+            dovish_score += sum(dovish_ngrams.values())
+            hits = hits + ngram_hits
+
+        # 키워드/N-gram별 출현 횟수 (문서-키워드 행렬용)
+        hawkish_counts: Dict[str, int] = {}
+        dovish_counts: Dict[str, int] = {}
+        for hit in hits:
+            counts = hawkish_counts if hit.polarity == "hawkish" else dovish_counts
+            counts[hit.term] = counts.get(hit.term, 0) + 1
+
         # 톤 지수 계산
         tone_index = self.calculate_tone_index(hawkish_score, dovish_score)
 
-        # 문장별 톤 분석
-        sentences = self.preprocessor.split_sentences(text)
-        sentence_tones = []
-
-        for sentence in sentences:
-            sent_matches = self.dictionary.match_in_text(sentence)
-            h_score = sum(w for _, w in sent_matches["hawkish"])
-            d_score = sum(w for _, w in sent_matches["dovish"])
-            if h_score > 0 or d_score > 0:
-                sent_tone = self.calculate_tone_index(h_score, d_score)
-                sentence_tones.append(sent_tone)
+        # 문장별 톤 분석 (문서 매칭 결과를 문장 오프셋에 매핑)
+        spans = self.preprocessor.split_sentence_spans(text)
+        sentence_tones = self._score_sentences(hits, spans)
+
+        # 위원별 톤 (같은 매칭 결과를 위원 발언 구간에 매핑)
+        # - 토의 내용 섹션 안의 발언만 사용 (출석위원 명단, 의결 문구 등 제외)
+        # - 위원을 가리키지 않는 표현("금융위원", "경우 위원" 등)의 구간은 제외
+        if discussion_span is None:
+            discussion_span, _ = self.preprocessor.section_spans(text)
+        discussion_start, discussion_end = discussion_span
+        member_spans = [
+            span for span in self.preprocessor.find_member_spans(text, start=discussion_start, end=discussion_end)
+            if self.preprocessor.is_member_label(span.member)
+        ]
+        member_tones = self._score_members(hits, member_spans)
 
         return ToneResult(
             meeting_date=meeting_date,
@@ -153,11 +218,88 @@ class ToneAnalyzer:
             dovish_score=dovish_score,
             hawkish_terms=hawkish_terms,
             dovish_terms=dovish_terms,
+            hawkish_ngrams=hawkish_ngrams,
+            dovish_ngrams=dovish_ngrams,
+            hawkish_counts=hawkish_counts,
+            dovish_counts=dovish_counts,
             sentence_tones=sentence_tones,
-            total_sentences=len(sentences),
+            member_tones=member_tones,
+            total_sentences=len(spans),
             interpretation=self.interpret_tone(tone_index)
         )
 
+    def _span_scores(
+        self,
+        hits: List[KeywordHit],
+        spans: List[Tuple[int, int]]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        문서 단위 매칭 결과를 구간별 매파/비둘기파 점수로 집계
+
+        각 키워드 출현 위치를 정렬된 구간 시작 오프셋에서 이진 탐색하여
+        구간에 할당합니다. 구간 경계를 넘는 매칭은 제외합니다.
+
+        Returns:
+            (구간별 매파 점수, 구간별 비둘기파 점수)
+        """
+        n = len(spans)
+        if not hits or not spans:
+            return np.zeros(n), np.zeros(n)
+
+        bounds = np.asarray(spans, dtype=np.int64)
+        hit_start = np.fromiter((h.start for h in hits), dtype=np.int64, count=len(hits))
+        hit_end = np.fromiter((h.end for h in hits), dtype=np.int64, count=len(hits))
+        weights = np.fromiter((h.weight for h in hits), dtype=np.float64, count=len(hits))
+        is_hawkish = np.fromiter((h.polarity == "hawkish" for h in hits), dtype=bool, count=len(hits))
+
+        idx = np.searchsorted(bounds[:, 0], hit_start, side="right") - 1
+        inside = idx >= 0
+        inside[inside] &= hit_end[inside] <= bounds[idx[inside], 1]
+
+        h_scores = np.bincount(idx[inside & is_hawkish], weights[inside & is_hawkish], minlength=n)
+        d_scores = np.bincount(idx[inside & ~is_hawkish], weights[inside & ~is_hawkish], minlength=n)
+        return h_scores, d_scores
+
+    def _score_sentences(
+        self,
+        hits: List[KeywordHit],
+        spans: List[Tuple[int, int]]
+    ) -> np.ndarray:
+        """
+        문서 단위 매칭 결과로 문장별 톤 계산
+
+        Returns:
+            키워드가 하나 이상 포함된 문장의 톤 배열 (문장 순서)
+        """
+        h_scores, d_scores = self._span_scores(hits, spans)
+
+        scored = (h_scores > 0) | (d_scores > 0)
+        h, d = h_scores[scored], d_scores[scored]
+        return np.clip((h - d) / (h + d + self.epsilon), -1.0, 1.0)
+
+    def _score_members(self, hits: List[KeywordHit], member_spans: List[MemberSpan]) -> Dict[str, float]:
+        """
+        문서 단위 매칭 결과로 위원 표현별 톤 계산
+
+        같은 위원 표현("한 위원" 등)의 발언 구간 점수를 합산한 뒤 톤 지수 산출
+
+        Returns:
+            {위원 표현: 톤} (키워드가 하나 이상 포함된 위원 표현만)
+        """
+        h_scores, d_scores = self._span_scores(hits, [(m.start, m.end) for m in member_spans])
+
+        totals: Dict[str, List[float]] = {}
+        for member_span, h, d in zip(member_spans, h_scores, d_scores):
+            total = totals.setdefault(member_span.member, [0.0, 0.0])
+            total[0] += h
+            total[1] += d
+
+        return {
+            member: float(self.calculate_tone_index(h, d))
+            for member, (h, d) in totals.items()
+            if h > 0 or d > 0
+        }
+
     def analyze_processed_minutes(self, minutes: ProcessedMinutes) -> ToneResult:
         """
         전처리된 의사록 분석
@@ -169,8 +311,10 @@ class ToneAnalyzer:
             ToneResult 객체
         """
         # 토의 내용 섹션을 주로 분석 (의결 문구는 형식적인 내용이 많음)
-        text = minutes.discussion_section or minutes.cleaned_text
-        return self.analyze_text(text, minutes.meeting_date)
+        if minutes.discussion_section:
+            text = minutes.discussion_section
+            return self.analyze_text(text, minutes.meeting_date, discussion_span=(0, len(text)))
+        return self.analyze_text(minutes.cleaned_text, minutes.meeting_date)
 
     def analyze_file(self, filepath: Path) -> Optional[ToneResult]:
         """
@@ -193,10 +337,35 @@ class ToneAnalyzer:
             logger.error(f"파일 분석 실패 [{filepath}]: {e}")
             return None
 
+    def analyzer_version(self) -> str:
+        """분석 설정 버전 (분석 로직 버전 + N-gram/문장 분리 설정)"""
+        ngram = self.ngram_matcher.fingerprint() if self.ngram_matcher is not None else "none"
+        splitter = self.preprocessor.splitter_version()
+        return f"{ANALYZER_VERSION}:{ngram}:{splitter}:{self.epsilon}"
+
+    def _analyze_files(self, filepaths: List[Path], workers: int = 1) -> List[Optional[ToneResult]]:
+        """파일 목록 분석 (입력 순서 유지, 실패 시 None)"""
+        if workers > 1 and len(filepaths) > 1:
+            # 매처를 미리 컴파일하여 워커마다 한 번만 전달
+            self.dictionary.get_matcher()
+            chunksize = max(1, len(filepaths) // (workers * 4))
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self,)
+            ) as pool:
+                return list(pool.map(_analyze_file_in_worker, filepaths, chunksize=chunksize))
+
+        # workers == 1: 프로세스 풀 없이 순차 분석 (KSS 문장 분리도 이 프로세스에서 수행)
+        return [self.analyze_file(filepath) for filepath in filepaths]
+
     def analyze_directory(
         self,
         dir_path: Path,
-        save_results: bool = True
+        save_results: bool = True,
+        workers: int = 1,
+        incremental: bool = False,
+        filename: str = "tone_index_results"
     ) -> List[ToneResult]:
         """
         디렉토리 내 모든 의사록 분석
@@ -204,14 +373,20 @@ class ToneAnalyzer:
         Args:
             dir_path: 텍스트 파일 디렉토리
             save_results: 결과 저장 여부
+            workers: 병렬 처리 프로세스 수 (1이면 순차 처리)
+            incremental: 매니페스트 기준 신규/변경 파일만 분석하고 기존 결과와 병합
+            filename: 결과 파일명 (증분 분석 시 기존 결과/매니페스트 위치)
 
         Returns:
-            ToneResult 리스트
+            ToneResult 리스트 (파일명 = 회의 날짜 순)
         """
-        results = []
+        filepaths = sorted(dir_path.glob("*.txt"))
+
+        if incremental:
+            return self._analyze_directory_incremental(filepaths, save_results, workers, filename)
 
-        for filepath in sorted(dir_path.glob("*.txt")):
-            result = self.analyze_file(filepath)
+        results = []
+        for result in self._analyze_files(filepaths, workers):
             if result:
                 results.append(result)
                 logger.info(
@@ -220,10 +395,115 @@ class ToneAnalyzer:
                 )
 
         if save_results and results:
-            self.save_results(results)
+            self.save_results(results, filename)
 
         return results
 
+    def analyze_documents(
+        self,
+        documents,
+        use_sections: bool = True,
+        save_results: bool = False,
+        filename: str = "tone_index_results"
+    ) -> List[ToneResult]:
+        """
+        문서 저장소(DB)에 저장된 의사록 분석
+
+        Args:
+            documents: StoredDocument 목록 (예: DocumentStore().iter_documents())
+            use_sections: True면 저장된 토의 내용 섹션 분석 (analyze_processed_minutes와 동일),
+                          False면 원문 전체 분석 (analyze_file과 동일)
+            save_results: 결과 저장 여부
+            filename: 결과 파일명
+
+        Returns:
+            ToneResult 리스트 (입력 순서)
+        """
+        results = []
+        for document in documents:
+            try:
+                if use_sections:
+                    result = self.analyze_processed_minutes(document.to_processed_minutes())
+                else:
+                    result = self.analyze_text(document.raw_text, document.meeting_date)
+            except Exception as e:
+                logger.error(f"문서 분석 실패 [{document.meeting_date}]: {e}")
+                continue
+            results.append(result)
+
+        if save_results and results:
+            self.save_results(results, filename)
+
+        return results
+
+    def _analyze_directory_incremental(
+        self,
+        filepaths: List[Path],
+        save_results: bool,
+        workers: int,
+        filename: str
+    ) -> List[ToneResult]:
+        """매니페스트 기반 증분 분석"""
+        manifest_path = OUTPUT_DIR / f"{filename}_manifest.json"
+        manifest = load_manifest(manifest_path)
+        previous = {r.meeting_date: r for r in self.load_results(filename)}
+
+        dictionary_version = self.dictionary.fingerprint()
+        analyzer_version = self.analyzer_version()
+
+        entries: Dict[str, Dict] = {}
+        pending: List[Tuple[Path, Dict]] = []
+        results: Dict[str, ToneResult] = {}
+
+        for filepath in filepaths:
+            meeting_date = filepath.stem.replace("minutes_", "")
+            old_entry = manifest.get(filepath.name)
+            entry = {
+                "path": str(filepath),
+                "meeting_date": meeting_date,
+                "size": filepath.stat().st_size,
+                "dictionary_version": dictionary_version,
+                "analyzer_version": analyzer_version,
+            }
+
+            entry["sha256"] = file_sha256(filepath)
+
+            # 내용 해시와 사전/분석기 버전이 모두 같고 이전 결과가 있으면 재사용
+            unchanged = (
+                old_entry is not None
+                and old_entry.get("size") == entry["size"]
+                and old_entry.get("sha256") == entry["sha256"]
+                and old_entry.get("dictionary_version") == dictionary_version
+                and old_entry.get("analyzer_version") == analyzer_version
+                and meeting_date in previous
+            )
+            if unchanged:
+                results[meeting_date] = previous[meeting_date]
+                entries[filepath.name] = entry
+            else:
+                pending.append((filepath, entry))
+
+        logger.info(f"증분 분석: 전체 {len(filepaths)}개 중 {len(pending)}개 분석 대상")
+
+        analyzed = self._analyze_files([filepath for filepath, _ in pending], workers)
+        for (filepath, entry), result in zip(pending, analyzed):
+            if result:
+                results[result.meeting_date] = result
+                entries[filepath.name] = entry
+                logger.info(
+                    f"[{result.meeting_date}] "
+                    f"Tone: {result.tone_index:+.3f} ({result.interpretation})"
+                )
+
+        merged = [results[date] for date in sorted(results)]
+
+        if save_results and merged:
+            if pending or len(merged) != len(previous):
+                self.save_results(merged, filename)
+            save_manifest(manifest_path, entries)
+
+        return merged
+
     def results_to_dataframe(self, results: List[ToneResult]) -> pd.DataFrame:
         """분석 결과를 DataFrame으로 변환"""
         data = []
@@ -265,37 +545,112 @@ class ToneAnalyzer:
         results: List[ToneResult],
         filename: str = "tone_index_results"
     ):
-        """결과 저장"""
+        """
+        결과 저장
+
+        - 컬럼형 저장소 (Parquet 또는 .npz): 전체 문장 톤과 키워드별 점수 포함
+        - CSV: 요약 테이블 내보내기용
+        - 문서-키워드 행렬 (.npz): 가중치 재계산용
+        """
         # DataFrame으로 변환
         df = self.results_to_dataframe(results)
 
-        # CSV 저장
+        # 컬럼형 저장소 저장
+        ToneResultStore(OUTPUT_DIR / filename).save(df, results)
+
+        # CSV 내보내기
         csv_path = OUTPUT_DIR / f"{filename}.csv"
         df.to_csv(csv_path, index=False, encoding="utf-8-sig")
         logger.info(f"CSV 저장: {csv_path}")
 
-        # JSON 저장 (상세 정보 포함)
-        json_path = OUTPUT_DIR / f"{filename}.json"
-        json_data = []
-        for r in results:
-            json_data.append({
-                "meeting_date": r.meeting_date,
-                "tone_index": r.tone_index,
-                "hawkish_score": r.hawkish_score,
-                "dovish_score": r.dovish_score,
-                "interpretation": r.interpretation,
-                "hawkish_terms": r.hawkish_terms,
-                "dovish_terms": r.dovish_terms,
-                "sentence_tones": r.sentence_tones[:20],  # 처음 20개만
-                "total_sentences": r.total_sentences
-            })
+        # 문서-키워드 행렬 저장 (가중치 변경 시 재분석 없이 재계산용)
+        TermMatrix.from_results(results, self.dictionary).save(
+            OUTPUT_DIR / f"{filename}_term_matrix.npz"
+        )
+
+        return df
 
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(json_data, f, ensure_ascii=False, indent=2)
-        logger.info(f"JSON 저장: {json_path}")
+    def load_results(self, filename: str = "tone_index_results") -> List[ToneResult]:
+        """
+        컬럼형 저장소에서 ToneResult 리스트 로드
+
+        Returns:
+            ToneResult 리스트 (저장된 결과가 없으면 빈 리스트)
+        """
+        store = ToneResultStore(OUTPUT_DIR / filename)
+        if not store.exists():
+            return []
+
+        df = store.load(columns=[
+            "meeting_date_str", "tone_index", "hawkish_score", "dovish_score",
+            "interpretation", "total_sentences", "sentence_tones"
+        ])
+        results = {
+            row.meeting_date_str: ToneResult(
+                meeting_date=row.meeting_date_str,
+                tone_index=row.tone_index,
+                hawkish_score=row.hawkish_score,
+                dovish_score=row.dovish_score,
+                sentence_tones=row.sentence_tones,
+                total_sentences=int(row.total_sentences),
+                interpretation=row.interpretation
+            )
+            for row in df.itertuples(index=False)
+        }
+
+        for row in store.load_terms().itertuples(index=False):
+            r = results[row.meeting_date_str]
+            scores = getattr(r, f"{row.polarity}_terms" if row.kind == "term" else f"{row.polarity}_ngrams")
+            scores[row.term] = float(row.score)
+            if row.count:
+                getattr(r, f"{row.polarity}_counts")[row.term] = int(row.count)
+
+        for row in store.load_members().itertuples(index=False):
+            results[row.meeting_date_str].member_tones[row.member] = float(row.tone)
+
+        return list(results.values())
 
+    def rescore(
+        self,
+        weights: Optional[Dict[str, float]] = None,
+        filename: str = "tone_index_results"
+    ) -> pd.DataFrame:
+        """
+        저장된 문서-키워드 행렬로 전체 회의 톤 지수 재계산 (텍스트 재분석 없음)
+
+        Args:
+            weights: {키워드: 가중치} (예: DatabaseManager.get_active_weights()).
+                     None이면 분석 시점의 가중치 사용
+            filename: 분석 결과 파일명 (save_results와 동일)
+
+        Returns:
+            DataFrame (meeting_date_str, hawkish_score, dovish_score, tone_index, interpretation)
+        """
+        matrix = TermMatrix.load(OUTPUT_DIR / f"{filename}_term_matrix.npz")
+        df = matrix.score(weights, epsilon=self.epsilon)
+        df["interpretation"] = df["tone_index"].map(self.interpret_tone)
         return df
 
+    def member_tone_series(self, results: List[ToneResult]) -> pd.DataFrame:
+        """
+        위원 표현별 톤 시계열
+
+        Returns:
+            DataFrame (index: 회의 날짜, columns: 위원 표현, 값: 톤. 발언이 없으면 NaN)
+        """
+        records = [
+            {"meeting_date_str": r.meeting_date, "member": member, "tone": tone}
+            for r in results
+            for member, tone in r.member_tones.items()
+        ]
+        if not records:
+            return pd.DataFrame()
+
+        series = pd.DataFrame(records).pivot(index="meeting_date_str", columns="member", values="tone")
+        series.index = pd.to_datetime(series.index.str.replace("_", "-"), errors="coerce")
+        series.index.name = "meeting_date"
+        return series.sort_index()
+
     def get_tone_statistics(self, results: List[ToneResult]) -> Dict:
         """톤 분석 통계"""
         if not results:
@@ -316,6 +671,39 @@ class ToneAnalyzer:
         }
 
 
+def file_sha256(filepath: Path) -> str:
+    """파일 내용 SHA-256 해시"""
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_manifest(manifest_path: Path) -> Dict[str, Dict]:
+    """증분 분석 매니페스트 로드 ({파일명: 엔트리})"""
+    if not manifest_path.exists():
+        return {}
+
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f).get("files", {})
+    except (json.JSONDecodeError, OSError) as e:
+        logger.warning(f"매니페스트 로드 실패, 전체 재분석: {e}")
+        return {}
+
+
+def save_manifest(manifest_path: Path, entries: Dict[str, Dict]):
+    """증분 분석 매니페스트 저장"""
+    data = {
+        "updated_at": datetime.now().isoformat(timespec="seconds"),
+        "files": entries
+    }
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    logger.info(f"매니페스트 저장: {manifest_path} ({len(entries)}개 파일)")
+
+
 def main():
     """메인 실행: 전체 의사록 톤 분석"""
     print("=" * 70)
@@ -334,7 +722,13 @@ def main():
 
     # 전체 분석 수행
     print(f"\n분석 대상: {texts_dir}")
-    results = analyzer.analyze_directory(texts_dir, save_results=True)
+    # 증분 분석: 신규/변경된 의사록만 분석하고 기존 결과와 병합
+    results = analyzer.analyze_directory(
+        texts_dir,
+        save_results=True,
+        workers=os.cpu_count() or 1,
+        incremental=True
+    )
 
     # 통계 출력
     stats = analyzer.get_tone_statistics(results)
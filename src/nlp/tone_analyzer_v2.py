@@ -229,6 +229,11 @@ class EnhancedToneAnalyzer(ToneAnalyzer):
             dovish_score=base_result.dovish_score,
             hawkish_terms=base_result.hawkish_terms,
             dovish_terms=base_result.dovish_terms,
+            hawkish_ngrams=base_result.hawkish_ngrams,
+            dovish_ngrams=base_result.dovish_ngrams,
+            hawkish_counts=base_result.hawkish_counts,
+            dovish_counts=base_result.dovish_counts,
+            member_tones=base_result.member_tones,
             sentence_tones=base_result.sentence_tones,
             total_sentences=base_result.total_sentences,
             interpretation=self.interpret_tone(tone_adjusted),  # 조정된 톤으로 해석
@@ -8,7 +8,7 @@ import plotly.express as px
 import pandas as pd
 import os
 from pathlib import Path
-from src.data.database import DatabaseManager
+from src.data.database import get_database_manager
 from datetime import datetime
 
 def render_analysis_view(row, previous_row=None):
@@ -32,7 +32,7 @@ def render_sample_2025_11_27(row):
     """2025년 11월 27일 발표에 대한 전문가 수준의 상세 분석"""
     
     # DB에서 최신 경제전망 조회
-    db = DatabaseManager()
+    db = get_database_manager()
     latest_forecast = db.get_latest_forecast(target_date='2025-11-27')
     
     # 기본값 (DB에 없을 경우) - 수정된 올바른 값
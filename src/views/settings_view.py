@@ -5,6 +5,7 @@
 - 키워드 가중치
 - 톤 지수 모델 파라미터 (α, β, γ)
 - 설정 저장 및 복원
+- DB 성능 통계 (선택 계측)
 """
 
 import streamlit as st
@@ -17,7 +18,13 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.nlp.sentiment_dict import SentimentDictionary
-from src.data.database import DatabaseManager
+from src.nlp.term_matrix import TermMatrix
+from src.nlp.tone_analyzer import OUTPUT_DIR as ANALYSIS_DIR
+from src.data.database import DatabaseManager, get_database_manager
+from src.data.db_writer import get_database_writer
+
+# 쓰기 완료 대기 시간 (초)
+WRITE_TIMEOUT = 30
 
 
 def render_settings_view():
@@ -34,7 +41,7 @@ def render_settings_view():
     st.markdown("---")
 
     # 데이터베이스 및 감성 사전 로드
-    db = DatabaseManager()
+    db = get_database_manager()
     sentiment_dict = SentimentDictionary()
 
     # 세션 상태 초기화
@@ -42,10 +49,11 @@ def render_settings_view():
         st.session_state.settings_modified = False
 
     # 탭 구성
-    tab1, tab2, tab3 = st.tabs([
+    tab1, tab2, tab3, tab4 = st.tabs([
         "📊 키워드 가중치",
         "🔧 모델 파라미터",
-        "💾 설정 관리"
+        "💾 설정 관리",
+        "📈 DB 성능"
     ])
 
     # ===== 탭 1: 키워드 가중치 조정 =====
@@ -60,6 +68,10 @@ def render_settings_view():
     with tab3:
         render_settings_management_tab(db, sentiment_dict)
 
+    # ===== 탭 4: DB 성능 통계 =====
+    with tab4:
+        render_db_stats_tab(db)
+
 
 def render_keyword_weights_tab(db: DatabaseManager, sentiment_dict: SentimentDictionary):
     """키워드 가중치 조정 탭"""
@@ -93,15 +105,13 @@ def render_keyword_weights_tab(db: DatabaseManager, sentiment_dict: SentimentDic
 
         with col2:
             if st.button("모두 초기화", key="reset_hawkish"):
-                # 매파 키워드 모두 기본값으로 복원
-                for _, row in df_hawkish.iterrows():
-                    if row['active_weight'] != row['base_weight']:
-                        db.save_expert_weight(
-                            row['term'],
-                            row['base_weight'],
-                            reason="전문가가 기본값으로 복원",
-                            expert_name="User"
-                        )
+                # 매파 키워드 모두 기본값으로 복원 (쓰기 스레드에서 단일 트랜잭션)
+                get_database_writer().submit(
+                    db.reset_expert_weights,
+                    polarity="hawkish",
+                    reason="전문가가 기본값으로 복원",
+                    expert_name="User"
+                ).result(timeout=WRITE_TIMEOUT)
                 st.success("매파 키워드가 모두 초기화되었습니다!")
                 st.rerun()
 
@@ -142,13 +152,12 @@ def render_keyword_weights_tab(db: DatabaseManager, sentiment_dict: SentimentDic
         if hawkish_changes:
             st.markdown("---")
             if st.button("💾 매파 키워드 변경사항 저장", key="save_hawkish"):
-                for term, weight in hawkish_changes.items():
-                    db.save_expert_weight(
-                        term,
-                        weight,
-                        reason="전문가가 UI에서 조정",
-                        expert_name="User"
-                    )
+                get_database_writer().submit(
+                    db.save_expert_weights,
+                    hawkish_changes,
+                    reason="전문가가 UI에서 조정",
+                    expert_name="User"
+                ).result(timeout=WRITE_TIMEOUT)
                 st.success(f"{len(hawkish_changes)}개 키워드 가중치가 저장되었습니다!")
                 st.session_state.settings_modified = True
                 st.rerun()
@@ -186,15 +195,13 @@ def render_keyword_weights_tab(db: DatabaseManager, sentiment_dict: SentimentDic
 
         with col2:
             if st.button("모두 초기화", key="reset_dovish"):
-                # 비둘기파 키워드 모두 기본값으로 복원
-                for _, row in df_dovish.iterrows():
-                    if row['active_weight'] != row['base_weight']:
-                        db.save_expert_weight(
-                            row['term'],
-                            row['base_weight'],
-                            reason="전문가가 기본값으로 복원",
-                            expert_name="User"
-                        )
+                # 비둘기파 키워드 모두 기본값으로 복원 (쓰기 스레드에서 단일 트랜잭션)
+                get_database_writer().submit(
+                    db.reset_expert_weights,
+                    polarity="dovish",
+                    reason="전문가가 기본값으로 복원",
+                    expert_name="User"
+                ).result(timeout=WRITE_TIMEOUT)
                 st.success("비둘기파 키워드가 모두 초기화되었습니다!")
                 st.rerun()
 
@@ -235,17 +242,63 @@ def render_keyword_weights_tab(db: DatabaseManager, sentiment_dict: SentimentDic
         if dovish_changes:
             st.markdown("---")
             if st.button("💾 비둘기파 키워드 변경사항 저장", key="save_dovish"):
-                for term, weight in dovish_changes.items():
-                    db.save_expert_weight(
-                        term,
-                        weight,
-                        reason="전문가가 UI에서 조정",
-                        expert_name="User"
-                    )
+                get_database_writer().submit(
+                    db.save_expert_weights,
+                    dovish_changes,
+                    reason="전문가가 UI에서 조정",
+                    expert_name="User"
+                ).result(timeout=WRITE_TIMEOUT)
                 st.success(f"{len(dovish_changes)}개 키워드 가중치가 저장되었습니다!")
                 st.session_state.settings_modified = True
                 st.rerun()
 
+    # 조정 가중치 반영 톤 지수 미리보기
+    render_tone_preview(db, active_weights, {**hawkish_changes, **dovish_changes})
+
+
+@st.cache_resource
+def load_term_matrix(matrix_mtime: float) -> TermMatrix:
+    """문서-키워드 행렬 로드 (파일이 바뀔 때만 다시 읽음)"""
+    return TermMatrix.load(ANALYSIS_DIR / "tone_index_results_term_matrix.npz")
+
+
+@st.cache_data
+def load_rescored_tone(weights_version: int, matrix_mtime: float, _active_weights: dict) -> pd.DataFrame:
+    """저장된 가중치 기준 톤 지수 재계산 (가중치 버전 / 행렬 파일이 바뀔 때만 재계산)"""
+    return load_term_matrix(matrix_mtime).score(_active_weights)
+
+
+def render_tone_preview(db: DatabaseManager, active_weights: dict, pending_changes: dict):
+    """저장된 문서-키워드 행렬로 조정 가중치 반영 톤 지수 미리보기 (텍스트 재분석 없음)"""
+
+    st.markdown("---")
+    st.subheader("🔁 가중치 반영 톤 지수 미리보기")
+
+    matrix_path = ANALYSIS_DIR / "tone_index_results_term_matrix.npz"
+    if not matrix_path.exists():
+        st.info("문서-키워드 행렬이 없습니다. 톤 분석(tone_analyzer)을 먼저 실행해주세요.")
+        return
+
+    matrix_mtime = matrix_path.stat().st_mtime
+    matrix = load_term_matrix(matrix_mtime)
+    df_base = matrix.score()
+    if pending_changes:
+        df_adjusted = matrix.score({**active_weights, **pending_changes})
+    else:
+        # 가중치 버전이 같으면 이전 재계산 결과 재사용 (가중치 딕셔너리 해싱 대신 버전으로 구분)
+        df_adjusted = load_rescored_tone(db.get_weights_version(), matrix_mtime, _active_weights=active_weights)
+
+    df_chart = pd.DataFrame({
+        "분석 시점 가중치": df_base["tone_index"].values,
+        "조정 가중치": df_adjusted["tone_index"].values,
+    }, index=pd.to_datetime(df_base["meeting_date_str"].str.replace("_", "-")))
+
+    st.line_chart(df_chart)
+
+    if pending_changes:
+        st.caption(f"저장되지 않은 변경 {len(pending_changes)}건이 반영된 결과입니다.")
+
+
 def render_model_parameters_tab(db: DatabaseManager):
     """모델 파라미터 조정 탭"""
 
@@ -327,9 +380,15 @@ def render_model_parameters_tab(db: DatabaseManager):
             new_beta_norm = new_beta / total
             new_gamma_norm = new_gamma / total
 
-            db.save_model_parameter('alpha', new_alpha_norm, 'Text Tone Weight (Normalized)')
-            db.save_model_parameter('beta', new_beta_norm, 'Market Reaction Weight (Normalized)')
-            db.save_model_parameter('gamma', new_gamma_norm, 'News Sentiment Weight (Normalized)')
+            get_database_writer().submit(
+                db.save_model_parameters,
+                {'alpha': new_alpha_norm, 'beta': new_beta_norm, 'gamma': new_gamma_norm},
+                {
+                    'alpha': 'Text Tone Weight (Normalized)',
+                    'beta': 'Market Reaction Weight (Normalized)',
+                    'gamma': 'News Sentiment Weight (Normalized)',
+                }
+            ).result(timeout=WRITE_TIMEOUT)
 
             st.success(f"정규화 완료! α={new_alpha_norm:.2f}, β={new_beta_norm:.2f}, γ={new_gamma_norm:.2f}")
             st.session_state.settings_modified = True
@@ -340,9 +399,15 @@ def render_model_parameters_tab(db: DatabaseManager):
         # 변경사항이 있으면 저장 버튼 표시
         if abs(new_alpha - alpha) > 0.01 or abs(new_beta - beta) > 0.01 or abs(new_gamma - gamma) > 0.01:
             if st.button("💾 모델 파라미터 저장", key="save_params"):
-                db.save_model_parameter('alpha', new_alpha, 'Text Tone Weight')
-                db.save_model_parameter('beta', new_beta, 'Market Reaction Weight')
-                db.save_model_parameter('gamma', new_gamma, 'News Sentiment Weight')
+                get_database_writer().submit(
+                    db.save_model_parameters,
+                    {'alpha': new_alpha, 'beta': new_beta, 'gamma': new_gamma},
+                    {
+                        'alpha': 'Text Tone Weight',
+                        'beta': 'Market Reaction Weight',
+                        'gamma': 'News Sentiment Weight',
+                    }
+                ).result(timeout=WRITE_TIMEOUT)
 
                 st.success("모델 파라미터가 저장되었습니다!")
                 st.session_state.settings_modified = True
@@ -378,28 +443,20 @@ def render_settings_management_tab(db: DatabaseManager, sentiment_dict: Sentimen
 
     st.warning("모든 키워드 가중치와 모델 파라미터를 기본값으로 복원합니다.")
 
-    if st.button("⚠️ 모든 설정 초기화", key="reset_all"):
-        confirm = st.checkbox("정말로 모든 설정을 초기화하시겠습니까?", key="confirm_reset")
-
-        if confirm:
-            # 모든 키워드 기본값으로
-            for _, row in df_keywords.iterrows():
-                if row['active_weight'] != row['base_weight']:
-                    db.save_expert_weight(
-                        row['term'],
-                        row['base_weight'],
-                        reason="전체 초기화",
-                        expert_name="System"
-                    )
-
-            # 모델 파라미터 기본값으로
-            db.save_model_parameter('alpha', 0.5, 'Text Tone Weight (Reset)')
-            db.save_model_parameter('beta', 0.3, 'Market Reaction Weight (Reset)')
-            db.save_model_parameter('gamma', 0.2, 'News Sentiment Weight (Reset)')
-
-            st.success("모든 설정이 초기화되었습니다!")
-            st.session_state.settings_modified = False
-            st.rerun()
+    # 확인 체크 후 버튼 활성화 (버튼 클릭 후 나타나는 체크박스는 재실행 시 사라져 초기화가 실행되지 않음)
+    confirm = st.checkbox("정말로 모든 설정을 초기화하시겠습니까?", key="confirm_reset")
+
+    if st.button("⚠️ 모든 설정 초기화", key="reset_all", disabled=not confirm):
+        # 키워드 가중치 + 모델 파라미터를 단일 트랜잭션으로 복원 (일부만 적용되지 않음)
+        get_database_writer().submit(
+            db.reset_all_settings,
+            reason="전체 초기화",
+            expert_name="System"
+        ).result(timeout=WRITE_TIMEOUT)
+
+        st.success("모든 설정이 초기화되었습니다!")
+        st.session_state.settings_modified = False
+        st.rerun()
 
     st.markdown("---")
 
@@ -419,6 +476,111 @@ def render_settings_management_tab(db: DatabaseManager, sentiment_dict: Sentimen
         )
 
 
+def render_db_stats_tab(db: DatabaseManager):
+    """DB 성능 통계 탭 (메서드별 지연 시간, 느린 호출 로그, 연결/캐시 통계)"""
+
+    st.header("📈 DB 성능 통계")
+
+    st.markdown("""
+    DatabaseManager 호출을 계측하여 대시보드의 실제 SQL 병목을 확인합니다.
+    - 계측은 기본적으로 꺼져 있으며, 켜면 같은 프로세스의 모든 세션 호출이 집계됩니다.
+    - 느린 호출 기준을 넘은 호출은 실행된 SQL과 실행 계획이 함께 기록됩니다.
+    """)
+
+    stats = db.stats()
+    instrumentation = stats["instrumentation"]
+
+    col1, col2, col3 = st.columns([1, 1, 1])
+    with col1:
+        enabled = st.toggle("계측 사용", value=instrumentation["enabled"], key="db_stats_enabled")
+    with col2:
+        slow_ms = st.number_input(
+            "느린 호출 기준 (ms)",
+            min_value=1.0,
+            max_value=10000.0,
+            value=float(instrumentation["slow_query_ms"]),
+            step=10.0,
+            key="db_stats_slow_ms"
+        )
+    with col3:
+        if st.button("🧹 통계 초기화", key="db_stats_reset"):
+            db.reset_stats()
+            st.rerun()
+
+    if enabled and (not instrumentation["enabled"] or slow_ms != instrumentation["slow_query_ms"]):
+        db.enable_instrumentation(slow_query_ms=slow_ms)
+        st.rerun()
+    elif not enabled and instrumentation["enabled"]:
+        db.disable_instrumentation()
+        st.rerun()
+
+    st.markdown("---")
+
+    # 연결 / 캐시
+    connections = stats["connections"]
+    cache = stats["cache"]
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("열린 연결", f"{connections['open']} / {connections['max_size']}")
+    with col2:
+        st.metric("누적 연결 열림/닫힘", f"{connections['opened']} / {connections['closed']}")
+    with col3:
+        st.metric("캐시 적중률", f"{cache['hit_rate']:.1%}")
+    with col4:
+        st.metric("캐시 항목", f"{cache['entries']} / {cache['max_entries']}")
+
+    # 쓰기 스레드
+    writer = get_database_writer().stats()
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("쓰기 대기", writer["pending"])
+    with col2:
+        st.metric("쓰기 실행/병합", f"{writer['executed']} / {writer['coalesced']}")
+    with col3:
+        st.metric("쓰기 트랜잭션", writer["batches"])
+    with col4:
+        st.metric("쓰기 실패", writer["failed"])
+
+    # 메서드별 통계
+    st.subheader("⏱️ 메서드별 지연 시간")
+    if not stats["methods"]:
+        st.info("수집된 호출이 없습니다. 계측을 켠 뒤 대시보드를 사용하세요.")
+    else:
+        df_methods = pd.DataFrame([
+            {
+                "메서드": name,
+                "호출": m["calls"],
+                "오류": m["errors"],
+                "평균(ms)": round(m["mean_ms"], 2),
+                "p50(ms)": round(m["p50_ms"], 2),
+                "p95(ms)": round(m["p95_ms"], 2),
+                "최대(ms)": round(m["max_ms"], 2),
+                "합계(ms)": round(m["total_ms"], 1),
+                "반환 행": m["rows"],
+            }
+            for name, m in stats["methods"].items()
+        ]).sort_values("합계(ms)", ascending=False)
+        st.dataframe(df_methods, use_container_width=True, hide_index=True)
+
+        selected = st.selectbox("히스토그램", df_methods["메서드"].tolist(), key="db_stats_histogram")
+        histogram = stats["methods"][selected]["histogram"]
+        st.bar_chart(pd.Series(histogram, name="호출 수"))
+
+    # 느린 호출 로그
+    st.subheader(f"🐢 느린 호출 로그 (≥ {instrumentation['slow_query_ms']:.0f}ms)")
+    if not stats["slow_queries"]:
+        st.caption("기록된 느린 호출이 없습니다.")
+    for entry in reversed(stats["slow_queries"]):
+        title = (
+            f"{entry['time']} · {entry['method']} · {entry['duration_ms']:.1f}ms "
+            f"(SQL {entry['statement_count']}개, 행 {entry['rows']}개)"
+        )
+        with st.expander(title):
+            for statement in entry["statements"]:
+                st.code(statement["sql"], language="sql")
+                st.caption(" / ".join(statement["plan"]))
+
+
 def main():
     """테스트용 메인"""
     st.set_page_config(